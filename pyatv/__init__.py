@@ -26,6 +26,7 @@ from pyatv.interface import Storage
 from pyatv.protocols import PROTOCOLS
 from pyatv.storage.memory_storage import MemoryStorage
 from pyatv.support import http
+from pyatv.support.artwork_cache import ArtworkCache
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -73,11 +74,12 @@ async def scan(  # pylint: disable=too-many-locals
     if protocol:
         protocols.update(protocol if isinstance(protocol, set) else {protocol})
 
-    for proto, proto_methods in PROTOCOLS.items():
+    for proto in PROTOCOLS:
         # If specific protocols was given, skip this one if it isn't listed
         if protocol and proto not in protocols:
             continue
 
+        proto_methods = PROTOCOLS[proto]
         scanner.add_service_info(proto, proto_methods.service_info)
 
         for service_type, handler in proto_methods.scan().items():
@@ -104,8 +106,18 @@ async def connect(  # pylint: disable=too-many-locals
     protocol: Optional[Protocol] = None,
     session: Optional[aiohttp.ClientSession] = None,
     storage: Optional[Storage] = None,
+    wait_for_all_protocols: bool = True,
+    artwork_cache: Optional[ArtworkCache] = None,
 ) -> interface.AppleTV:
-    """Connect to a device based on a configuration."""
+    """Connect to a device based on a configuration.
+
+    Protocols are connected concurrently. If `wait_for_all_protocols` is False, this
+    function returns as soon as one protocol is usable and remaining protocols are
+    added in the background when they are ready.
+
+    All protocols share the same artwork cache. Pass `artwork_cache` to share it
+    between devices or to cache artwork on disk.
+    """
     if not config.services:
         raise exceptions.NoServiceError("no service to connect to")
 
@@ -122,10 +134,12 @@ async def connect(  # pylint: disable=too-many-locals
 
     session_manager = await http.create_session(session)
     core_dispatcher = CoreStateDispatcher()
+    if artwork_cache is None:
+        artwork_cache = ArtworkCache()
     atv = FacadeAppleTV(config_copy, session_manager, core_dispatcher, settings)
 
     try:
-        for proto, proto_methods in PROTOCOLS.items():
+        for proto in PROTOCOLS:
             service = config_copy.get_service(proto)
             if service is None or not service.enabled:
                 continue
@@ -133,6 +147,9 @@ async def connect(  # pylint: disable=too-many-locals
                 _LOGGER.debug("Ignore %s as it is disabled", proto.name)
                 continue
 
+            # Only import protocols that are actually used
+            proto_methods = PROTOCOLS[proto]
+
             # Lock protocol argument so protocol does not have to deal
             # with that
             takeover_method = partial(atv.takeover, proto)
@@ -147,12 +164,13 @@ async def connect(  # pylint: disable=too-many-locals
                 core_dispatcher=core_dispatcher,
                 takeover_method=takeover_method,
                 loop=loop,
+                artwork_cache=artwork_cache,
             )
 
             for setup_data in proto_methods.setup(core):
                 atv.add_protocol(setup_data)
 
-        await atv.connect()
+        await atv.connect(wait_for_all_protocols=wait_for_all_protocols)
     except Exception:
         await session_manager.close()
         raise
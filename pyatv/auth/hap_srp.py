@@ -1,10 +1,13 @@
 """SRP implementation for HAP."""
 
+import asyncio
 import binascii
+from collections import deque
+from functools import lru_cache
 import hashlib
 import logging
 import os
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Deque, Dict, NamedTuple, Optional, Tuple
 import uuid
 
 from cryptography.exceptions import InvalidSignature
@@ -28,6 +31,8 @@ from pyatv.support import chacha20, log_binary, opack
 
 _LOGGER = logging.getLogger(__name__)
 
+KEY_POOL_SIZE = 4
+
 
 def hkdf_expand(salt: str, info: str, shared_secret: bytes) -> bytes:
     """Derive encryption keys from shared secret."""
@@ -41,6 +46,105 @@ def hkdf_expand(salt: str, info: str, shared_secret: bytes) -> bytes:
     return hkdf.derive(shared_secret)
 
 
+class _KeySet(NamedTuple):
+    signing_key: Ed25519PrivateKey
+    auth_private: bytes
+    auth_public: bytes
+    verify_private: X25519PrivateKey
+    verify_public: bytes
+
+
+def _generate_keys() -> _KeySet:
+    signing_key = Ed25519PrivateKey.from_private_bytes(os.urandom(32))
+    verify_private = X25519PrivateKey.from_private_bytes(os.urandom(32))
+    return _KeySet(
+        signing_key,
+        signing_key.private_bytes(
+            encoding=serialization.Encoding.Raw,
+            format=serialization.PrivateFormat.Raw,
+            encryption_algorithm=serialization.NoEncryption(),
+        ),
+        signing_key.public_key().public_bytes(
+            encoding=serialization.Encoding.Raw, format=serialization.PublicFormat.Raw
+        ),
+        verify_private,
+        verify_private.public_key().public_bytes(
+            encoding=serialization.Encoding.Raw, format=serialization.PublicFormat.Raw
+        ),
+    )
+
+
+class KeyPool:
+    """Pool of pre-generated keys used by SRPAuthHandler.
+
+    Generating keys is part of every pair-verify, so keys are generated ahead of time
+    when the event loop is idle instead of while a connection is being set up. A key
+    set is never handed out more than once.
+    """
+
+    def __init__(self, size: int = KEY_POOL_SIZE) -> None:
+        """Initialize a new KeyPool."""
+        self._size = size
+        self._keys: Deque[_KeySet] = deque()
+        self._refill_scheduled = False
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Return number of available key sets."""
+        return len(self._keys)
+
+    def take(self) -> _KeySet:
+        """Return a new key set, generating one if pool is empty."""
+        if self._keys:
+            self.hits += 1
+            keys = self._keys.popleft()
+        else:
+            self.misses += 1
+            keys = _generate_keys()
+        self._schedule_refill()
+        return keys
+
+    def fill(self) -> None:
+        """Generate keys until pool is full."""
+        while len(self._keys) < self._size:
+            self._keys.append(_generate_keys())
+
+    def _schedule_refill(self) -> None:
+        if self._refill_scheduled or len(self._keys) >= self._size:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        self._refill_scheduled = True
+        loop.call_soon(self._refill)
+
+    def _refill(self) -> None:
+        # Generate one key set per loop iteration to not block other tasks
+        self._refill_scheduled = False
+        if len(self._keys) < self._size:
+            self._keys.append(_generate_keys())
+        self._schedule_refill()
+
+
+KEY_POOL = KeyPool()
+
+
+# Long-term keys are the same for every pair-verify with a device, so parsed keys are
+# cached to avoid loading them again on each reconnect
+@lru_cache(maxsize=256)
+def _load_signing_key(ltsk: bytes) -> Ed25519PrivateKey:
+    return Ed25519PrivateKey.from_private_bytes(ltsk)
+
+
+@lru_cache(maxsize=256)
+def _load_verify_key(ltpk: bytes) -> Ed25519PublicKey:
+    return Ed25519PublicKey.from_public_bytes(ltpk)
+
+
 # pylint: disable=too-many-instance-attributes
 class SRPAuthHandler:
     """Handle SRP crypto routines for auth and key derivation."""
@@ -52,7 +156,6 @@ class SRPAuthHandler:
         self._auth_private = None
         self._auth_public = None
         self._verify_private = None
-        self._verify_public = None
         self._public_bytes = None
         self._session = None
         self._shared = None
@@ -64,21 +167,14 @@ class SRPAuthHandler:
         return self._session.key
 
     def initialize(self):
-        """Initialize operation by generating new keys."""
-        self._signing_key = Ed25519PrivateKey.from_private_bytes(os.urandom(32))
-        self._auth_private = self._signing_key.private_bytes(
-            encoding=serialization.Encoding.Raw,
-            format=serialization.PrivateFormat.Raw,
-            encryption_algorithm=serialization.NoEncryption(),
-        )
-        self._auth_public = self._signing_key.public_key().public_bytes(
-            encoding=serialization.Encoding.Raw, format=serialization.PublicFormat.Raw
-        )
-        self._verify_private = X25519PrivateKey.from_private_bytes(os.urandom(32))
-        self._verify_public = self._verify_private.public_key()
-        self._public_bytes = self._verify_public.public_bytes(
-            encoding=serialization.Encoding.Raw, format=serialization.PublicFormat.Raw
-        )
+        """Initialize operation by taking new keys from the key pool."""
+        (
+            self._signing_key,
+            self._auth_private,
+            self._auth_public,
+            self._verify_private,
+            self._public_bytes,
+        ) = KEY_POOL.take()
         return self._auth_public, self._public_bytes
 
     def verify1(self, credentials, session_pub_key, encrypted):
@@ -101,7 +197,7 @@ class SRPAuthHandler:
             raise exceptions.AuthenticationError("incorrect device response")
 
         info = session_pub_key + bytes(identifier) + self._public_bytes
-        ltpk = Ed25519PublicKey.from_public_bytes(bytes(credentials.ltpk))
+        ltpk = _load_verify_key(bytes(credentials.ltpk))
 
         try:
             ltpk.verify(bytes(signature), bytes(info))
@@ -110,9 +206,7 @@ class SRPAuthHandler:
 
         device_info = self._public_bytes + credentials.client_id + session_pub_key
 
-        device_signature = Ed25519PrivateKey.from_private_bytes(credentials.ltsk).sign(
-            device_info
-        )
+        device_signature = _load_signing_key(bytes(credentials.ltsk)).sign(device_info)
 
         tlv = write_tlv(
             {
@@ -8,6 +8,7 @@ from typing import (
     Awaitable,
     Callable,
     Dict,
+    FrozenSet,
     List,
     Mapping,
     NamedTuple,
@@ -20,6 +21,7 @@ from pyatv.const import FeatureName, PairingRequirement, Protocol
 from pyatv.core.protocol import MessageDispatcher
 from pyatv.interface import BaseConfig, BaseService, Playing, PushUpdater
 from pyatv.settings import Settings
+from pyatv.support.artwork_cache import ArtworkCache
 from pyatv.support.http import ClientSessionManager, create_session
 from pyatv.support.state_producer import StateProducer
 
@@ -207,6 +209,8 @@ class SetupData(NamedTuple):
     device_info: Callable[[], Dict[str, Any]]
     interfaces: Mapping[Any, Any]
     features: Set[FeatureName]
+    # Protocols that must have been set up before this protocol is connected
+    depends_on: FrozenSet[Protocol] = frozenset()
 
 
 class Core:
@@ -222,6 +226,7 @@ class Core:
         session_manager: ClientSessionManager,
         takeover: TakeoverMethod,
         state_dispatcher: ProtocolStateDispatcher,
+        artwork_cache: ArtworkCache,
     ) -> None:
         """Initialize a new Core instance."""
         self.loop = loop
@@ -232,6 +237,7 @@ class Core:
         self.session_manager = session_manager
         self.takeover = takeover
         self.state_dispatcher = state_dispatcher
+        self.artwork_cache = artwork_cache
 
 
 async def create_core(
@@ -244,6 +250,7 @@ async def create_core(
     core_dispatcher: Optional[CoreStateDispatcher] = None,
     takeover_method: Optional[TakeoverMethod] = None,
     loop: Optional[asyncio.AbstractEventLoop] = None,
+    artwork_cache: Optional[ArtworkCache] = None,
 ) -> Core:
     """Create a new core instance.
 
@@ -264,6 +271,7 @@ async def create_core(
         ProtocolStateDispatcher(
             service.protocol, core_dispatcher or CoreStateDispatcher()
         ),
+        ArtworkCache() if artwork_cache is None else artwork_cache,
     )
 
 
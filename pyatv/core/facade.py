@@ -609,6 +609,7 @@ class FacadePushUpdater(
             self, interface.PushUpdater, DEFAULT_PRIORITIES
         )
         interface.PushUpdater.__init__(self)
+        self._previous_playstatus: Optional[interface.Playing] = None
 
     @property  # type: ignore
     @shield.guard
@@ -622,6 +623,7 @@ class FacadePushUpdater(
 
         If an error occurs, start must be called again.
         """
+        self._previous_playstatus = None
         for instance in self.instances:
             instance.listener = self
             instance.start(initial_delay)
@@ -638,6 +640,11 @@ class FacadePushUpdater(
         if updater == self.main_instance:
             self.listener.playstatus_update(updater, playstatus)
 
+            changes = playstatus.diff(self._previous_playstatus)
+            self._previous_playstatus = playstatus
+            if changes:
+                self.listener.playstatus_diff(updater, playstatus, changes)
+
     def playstatus_error(self, updater, exception: Exception) -> None:
         """Inform about an error when updating play status."""
         if updater == self.main_instance:
@@ -699,6 +706,10 @@ class FacadeAppleTV(interface.AppleTV):
         self._features = FacadeFeatures(self._push_updates)
         self._pending_tasks: Optional[set] = None
         self._device_info = interface.DeviceInfo({})
+        self._setup_order: List[Protocol] = []
+        self._setup_tasks: List[asyncio.Future] = []
+        self._setup_task: Optional[asyncio.Future] = None
+        self._power_instance: Optional[interface.Power] = None
         self._interfaces = {
             interface.Features: self._features,
             interface.RemoteControl: FacadeRemoteControl(),
@@ -738,8 +749,18 @@ class FacadeAppleTV(interface.AppleTV):
         self._protocols_to_setup.put(setup_data)
 
     @shield.guard
-    async def connect(self) -> None:
-        """Initiate connection to device."""
+    async def connect(self, wait_for_all_protocols: bool = True) -> None:
+        """Initiate connection to device.
+
+        Protocols are connected concurrently, except for protocols depending on other
+        protocols added before them (see `SetupData.depends_on`) that are connected
+        once their dependencies are set up. If a protocol has several
+        implementations, they are tried in order until one of them connects.
+
+        By default this method returns when all protocols are set up. If
+        `wait_for_all_protocols` is False, it returns as soon as one protocol is
+        usable and remaining protocols are added as they finish in the background.
+        """
         # No protocols to setup + no protocols previously set up => no service
         if self._protocols_to_setup.empty() and not self._protocol_handlers:
             raise exceptions.NoServiceError("no service to connect to")
@@ -748,39 +769,105 @@ class FacadeAppleTV(interface.AppleTV):
         if self._protocol_handlers:
             raise exceptions.InvalidStateError("already connected")
 
-        devinfo: Dict[str, Any] = {}
-
-        # Set up protocols, ignoring duplicates
+        # Group implementations per protocol, first added has precedence
+        candidates: Dict[Protocol, List[SetupData]] = {}
         while not self._protocols_to_setup.empty():
             setup_data = self._protocols_to_setup.get()
-
-            if setup_data.protocol in self._protocol_handlers:
-                _LOGGER.debug(
-                    "Protocol %s already set up, ignoring", setup_data.protocol
+            candidates.setdefault(setup_data.protocol, []).append(setup_data)
+        self._setup_order = list(candidates.keys())
+        order = {proto: index for index, proto in enumerate(self._setup_order)}
+
+        tasks: Dict[Protocol, asyncio.Future] = {}
+
+        async def _setup(protocol: Protocol) -> bool:
+            for setup_data in candidates[protocol]:
+                # Only protocols added before this one are considered (no cycles)
+                dependencies = [
+                    tasks[dependency]
+                    for dependency in setup_data.depends_on
+                    if dependency in tasks and order[dependency] < order[protocol]
+                ]
+                if not all(await asyncio.gather(*dependencies)):
+                    _LOGGER.debug("Dependencies for %s not set up, ignoring", protocol)
+                    continue
+
+                _LOGGER.debug("Connecting to protocol: %s", protocol)
+                try:
+                    connected = await setup_data.connect()
+                except asyncio.CancelledError:
+                    setup_data.close()
+                    raise
+
+                if connected:
+                    _LOGGER.debug("Connected to protocol: %s", protocol)
+                    self._add_protocol_handler(setup_data)
+                    return True
+            return False
+
+        for protocol in candidates:
+            tasks[protocol] = asyncio.ensure_future(_setup(protocol))
+
+        pending: Set[asyncio.Future] = set(tasks.values())
+        if not wait_for_all_protocols:
+            while pending and not self._protocol_handlers:
+                _, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
                 )
-                continue
 
-            _LOGGER.debug("Connecting to protocol: %s", setup_data.protocol)
-            if await setup_data.connect():
-                _LOGGER.debug("Connected to protocol: %s", setup_data.protocol)
-                self._protocol_handlers[setup_data.protocol] = setup_data
+        if pending and self._protocol_handlers:
+            self._setup_tasks = list(tasks.values())
+            self._setup_task = asyncio.ensure_future(self._finish_setup())
+        else:
+            results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
 
-                for iface, instance in setup_data.interfaces.items():
-                    self._interfaces[iface].register(instance, setup_data.protocol)
+        self._update_power_listener()
 
-                self._features.add_mapping(setup_data.protocol, setup_data.features)
-                dict_merge(devinfo, setup_data.device_info())
+    async def _finish_setup(self) -> None:
+        results = await asyncio.gather(*self._setup_tasks, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                _LOGGER.warning("Failed to set up protocol: %s", result)
+        self._update_power_listener()
 
+    def _add_protocol_handler(self, setup_data: SetupData) -> None:
+        if self._pending_tasks is not None:
+            # Connection was closed while setting up protocol
+            self._pending_tasks.update(setup_data.close())
+            return
+
+        self._protocol_handlers[setup_data.protocol] = setup_data
+
+        for iface, instance in setup_data.interfaces.items():
+            self._interfaces[iface].register(instance, setup_data.protocol)
+
+        self._features.add_mapping(setup_data.protocol, setup_data.features)
+
+        # Merge device info in the order protocols were added
+        devinfo: Dict[str, Any] = {}
+        for protocol in self._setup_order:
+            handler = self._protocol_handlers.get(protocol)
+            if handler:
+                dict_merge(devinfo, handler.device_info())
         self._device_info = interface.DeviceInfo(devinfo)
 
+    def _update_power_listener(self) -> None:
         # Forward power events in case an interface exists for it
         try:
             power = cast(
                 interface.Power, self._interfaces[interface.Power].main_instance
             )
-            power.listener = self._interfaces[interface.Power]
         except exceptions.NotSupportedError:
             _LOGGER.debug("Power management not supported by any protocols")
+            return
+
+        if power is not self._power_instance:
+            if self._power_instance is not None:
+                self._power_instance.listener = None
+            power.listener = self._interfaces[interface.Power]
+            self._power_instance = power
 
     def close(self) -> Set[asyncio.Task]:
         """Close connection and release allocated resources."""
@@ -792,6 +879,8 @@ class FacadeAppleTV(interface.AppleTV):
         self.push_updater.stop()
 
         self._pending_tasks = set()
+        for task in self._setup_tasks:
+            task.cancel()
         self._pending_tasks.add(asyncio.create_task(self._session_manager.close()))
         for setup_data in self._protocol_handlers.values():
             self._pending_tasks.update(setup_data.close())
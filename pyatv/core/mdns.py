@@ -4,7 +4,7 @@ import asyncio
 from ipaddress import IPv4Address, ip_address
 import logging
 import math
-import socket
+import struct
 from types import SimpleNamespace
 import typing
 import weakref
@@ -12,7 +12,7 @@ import weakref
 from zeroconf import ServiceInfo, Zeroconf
 
 from pyatv import exceptions
-from pyatv.support import log_binary, net
+from pyatv.support import knock, log_binary, net
 from pyatv.support.collections import CaseInsensitiveDict
 from pyatv.support.dns import (
     DnsMessage,
@@ -29,6 +29,14 @@ SERVICES_PER_MSG = 3
 
 SLEEP_PROXY_SERVICE = "_sleep-proxy._udp.local"
 
+# Maximum number of hosts queried at the same time during a unicast sweep
+SWEEP_CONCURRENCY = 64
+
+# Retransmission timeouts (in seconds) used during a unicast sweep
+SWEEP_INITIAL_RTO = 1.0
+SWEEP_MIN_RTO = 0.2
+SWEEP_MAX_RTO = 2.0
+
 # This module produces a lot of debug output, use a dedicated log level.
 # Maybe move this to top-level support later?
 TRAFFIC_LEVEL = logging.DEBUG - 5
@@ -104,65 +112,97 @@ def _first_rd(qtype: QueryType, entries: typing.Dict[int, typing.List[DnsResourc
 
 
 class ServiceParser:
-    """Parse zeroconf services from records in DNS messages."""
+    """Parse zeroconf services from records in DNS messages.
+
+    Records are indexed as they are added and only services affected by new records
+    are rebuilt, so the cost of adding a message is proportional to the number of
+    records in that message rather than all records seen so far.
+    """
 
     def __init__(self) -> None:
         """Initialize a new ServiceParser instance."""
         self.table: typing.Dict[str, typing.Dict[int, typing.List[DnsResource]]] = {}
         self.ptrs: typing.Dict[str, str] = {}  # qname -> real name
+        self._names: typing.Dict[str, typing.Optional[ServiceInstanceName]] = {}
+        self._targets: typing.Dict[str, typing.Set[str]] = {}  # target -> services
+        self._services: typing.Dict[str, Service] = {}
+        self._dirty: typing.Dict[str, None] = {}  # Used as an ordered set
         self._cache: typing.Optional[typing.List[Service]] = None
+        self._model: typing.Optional[str] = None
 
     def add_message(self, message: DnsMessage) -> "ServiceParser":
         """Add message to with records to parse."""
-        self._cache = None
-
         for record in message.answers + message.resources:
             if record.qtype == QueryType.PTR and record.qname.startswith("_"):
-                self.ptrs[record.qname] = record.rd
-            else:
-                entry = self.table.setdefault(record.qname, {})
-                if record.qtype not in entry:
-                    entry[record.qtype] = []
-
-                if record not in entry[record.qtype]:
-                    entry[record.qtype].append(record)
-        return self
+                if self.ptrs.get(record.qname) != record.rd:
+                    self.ptrs[record.qname] = record.rd
+                    self._cache = None
+                continue
 
-    def parse(self) -> typing.List[Service]:
-        """Parse records and return services."""
-        if self._cache:
-            return self._cache
+            entry = self.table.setdefault(record.qname, {})
+            records = entry.setdefault(record.qtype, [])
+            if record in records:
+                continue
+            records.append(record)
+
+            if record.qtype == QueryType.A:
+                self._dirty.update(dict.fromkeys(self._targets.get(record.qname, ())))
+            if self._service_name(record.qname) is not None:
+                if record.qtype == QueryType.SRV and len(records) == 1:
+                    self._targets.setdefault(record.rd["target"], set()).add(
+                        record.qname
+                    )
+                self._dirty[record.qname] = None
 
-        results: typing.Dict[str, Service] = {}
+        if self._dirty:
+            self._cache = None
+        return self
 
-        # Build services
-        for service, device in self.table.items():
+    def _service_name(self, name: str) -> typing.Optional[ServiceInstanceName]:
+        if name not in self._names:
             try:
-                service_name = ServiceInstanceName.split_name(service)
+                self._names[name] = ServiceInstanceName.split_name(name)
             except ValueError:
-                continue
+                self._names[name] = None
+        return self._names[name]
 
-            srv_rd = _first_rd(QueryType.SRV, device)
-            target = srv_rd["target"] if srv_rd else None
+    def _build_service(self, service: str) -> Service:
+        service_name = typing.cast(ServiceInstanceName, self._names[service])
+        device = self.table[service]
 
-            target_records = self.table.get(typing.cast(str, target), {}).get(
-                QueryType.A, []
-            )
-            address = None
+        srv_rd = _first_rd(QueryType.SRV, device)
+        target = srv_rd["target"] if srv_rd else None
 
-            # Pick one address that is not link-local
-            for addr in [IPv4Address(record.rd) for record in target_records]:
-                if not addr.is_link_local:
-                    address = addr
-                    break
+        target_records = self.table.get(typing.cast(str, target), {}).get(
+            QueryType.A, []
+        )
+        address = None
+
+        # Pick one address that is not link-local
+        for addr in [IPv4Address(record.rd) for record in target_records]:
+            if not addr.is_link_local:
+                address = addr
+                break
+
+        return Service(
+            service_name.ptr_name,
+            typing.cast(str, service_name.instance),
+            address,
+            srv_rd["port"] if srv_rd else 0,
+            _decode_properties(_first_rd(QueryType.TXT, device) or {}),
+        )
 
-            results[service] = Service(
-                service_name.ptr_name,
-                typing.cast(str, service_name.instance),
-                address,
-                srv_rd["port"] if srv_rd else 0,
-                _decode_properties(_first_rd(QueryType.TXT, device) or {}),
-            )
+    def parse(self) -> typing.List[Service]:
+        """Parse records and return services."""
+        if self._cache is not None:
+            return self._cache
+
+        # Only rebuild services affected by records added since last parse
+        for service in self._dirty:
+            self._services[service] = self._build_service(service)
+        self._dirty.clear()
+
+        results = dict(self._services)
 
         # If there are PTRs to unknown services, create placeholders
         for qname, real_name in self.ptrs.items():
@@ -171,8 +211,15 @@ class ServiceParser:
                     qname, real_name.split(".")[0], None, 0, {}
                 )
         self._cache = list(results.values())
+        self._model = _get_model(self._cache)
         return self._cache
 
+    @property
+    def model(self) -> typing.Optional[str]:
+        """Return device model from parsed services (if present)."""
+        self.parse()
+        return self._model
+
 
 class QueryResponse(SimpleNamespace):
     """Hold DNS query response records."""
@@ -211,11 +258,10 @@ class UnicastDnsSdClientProtocol(asyncio.Protocol):
             except asyncio.CancelledError:
                 pass
 
-        services = self.parser.parse()
         return Response(
-            services=services,
+            services=self.parser.parse(),
             deep_sleep=False,
-            model=_get_model(services),
+            model=self.parser.model,
         )
 
     def connection_made(self, transport) -> None:
@@ -270,6 +316,195 @@ class UnicastDnsSdClientProtocol(asyncio.Protocol):
             self._task.cancel()
 
 
+class _SweepHost:  # pylint: disable=too-few-public-methods
+    """State for a host queried by UnicastDnsSdSweepProtocol."""
+
+    __slots__ = (
+        "address",
+        "queries",
+        "pending",
+        "first_sent",
+        "retransmitted",
+        "rto",
+        "parser",
+        "answered",
+        "retransmit_handle",
+        "deadline_handle",
+    )
+
+    def __init__(self, address: str, rto: float) -> None:
+        """Initialize a new _SweepHost."""
+        self.address = address
+        self.queries: typing.Dict[int, bytes] = {}  # transaction id -> query
+        self.pending: typing.Set[int] = set()  # transaction ids not answered yet
+        self.first_sent: float = 0.0
+        self.retransmitted: bool = False
+        self.rto: float = rto
+        self.parser: ServiceParser = ServiceParser()
+        self.answered: bool = False
+        self.retransmit_handle: typing.Optional[asyncio.TimerHandle] = None
+        self.deadline_handle: typing.Optional[asyncio.TimerHandle] = None
+
+
+class UnicastDnsSdSweepProtocol(asyncio.DatagramProtocol):
+    """Protocol making unicast requests to many hosts over a single socket.
+
+    Each query is sent with a unique transaction id, which is used to map responses
+    back to hosts. Unanswered queries are retransmitted using an adaptive timeout
+    based on round trip times seen so far (similar to TCP) with exponential backoff.
+    Finished hosts are put on the `results` queue as `(address, response)`, where
+    response is `None` if the host never responded.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        services: typing.List[str],
+        port: int,
+        timeout: float,
+    ) -> None:
+        """Initialize a new UnicastDnsSdSweepProtocol."""
+        self.loop = loop
+        self.queries = create_service_queries(services, QueryType.PTR)
+        self.port = port
+        self.timeout = timeout
+        self.transport: typing.Optional[asyncio.DatagramTransport] = None
+        self.results: asyncio.Queue = asyncio.Queue()
+        self._hosts: typing.Dict[str, _SweepHost] = {}
+        self._transactions: typing.Dict[int, _SweepHost] = {}
+        self._next_id: int = 0
+        self._srtt: typing.Optional[float] = None
+        self._rttvar: float = 0.0
+
+    @property
+    def rto(self) -> float:
+        """Return current retransmission timeout for new hosts."""
+        if self._srtt is None:
+            return SWEEP_INITIAL_RTO
+        return min(max(self._srtt + 4 * self._rttvar, SWEEP_MIN_RTO), SWEEP_MAX_RTO)
+
+    def connection_made(self, transport) -> None:
+        """Establish connection to host."""
+        self.transport = transport
+
+    def query(self, address: str) -> None:
+        """Start querying a host for services."""
+        host = _SweepHost(address, self.rto)
+        for query in self.queries:
+            msg_id = self._allocate_id()
+            host.queries[msg_id] = struct.pack(">H", msg_id) + query[2:]
+            self._transactions[msg_id] = host
+        host.pending.update(host.queries)
+        self._hosts[address] = host
+
+        host.first_sent = self.loop.time()
+        self._send(host)
+        host.deadline_handle = self.loop.call_later(self.timeout, self._finished, host)
+
+    def _allocate_id(self) -> int:
+        while True:
+            self._next_id = (self._next_id + 1) & 0xFFFF
+            if self._next_id not in self._transactions:
+                return self._next_id
+
+    def _send(self, host: _SweepHost) -> None:
+        for msg_id in host.pending:
+            query = host.queries[msg_id]
+            log_binary(
+                _LOGGER,
+                f"Sending DNS request to {host.address}:{self.port}",
+                level=TRAFFIC_LEVEL,
+                Data=query,
+            )
+            typing.cast(asyncio.DatagramTransport, self.transport).sendto(
+                query, (host.address, self.port)
+            )
+        host.retransmit_handle = self.loop.call_later(host.rto, self._retransmit, host)
+
+    def _retransmit(self, host: _SweepHost) -> None:
+        host.retransmitted = True
+        host.rto = min(host.rto * 2, SWEEP_MAX_RTO)
+        self._send(host)
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        """DNS response packet received."""
+        log_binary(
+            _LOGGER,
+            f"Received DNS response from {addr}",
+            level=TRAFFIC_LEVEL,
+            Data=data,
+        )
+
+        if len(data) < 2:
+            return
+
+        # Responders should echo the transaction id, but fall back to address
+        (msg_id,) = struct.unpack(">H", data[0:2])
+        host = self._transactions.get(msg_id)
+        if host is None:
+            host = self._hosts.get(addr[0])
+            if host is None:
+                return
+            msg_id = next(iter(host.pending))
+
+        knock.get_scheduler().responded(IPv4Address(host.address))
+
+        try:
+            host.parser.add_message(DnsMessage().unpack(data))
+        except Exception:  # pylint: disable=broad-except
+            log_binary(_LOGGER, "Failed to decode message", Msg=data)
+            return
+
+        # Only sample round trip time if no retransmission was made (Karn's algorithm)
+        if not host.answered and not host.retransmitted:
+            self._update_rtt(self.loop.time() - host.first_sent)
+        host.answered = True
+
+        host.pending.discard(msg_id)
+        if not host.pending:
+            self._finished(host)
+
+    def _update_rtt(self, rtt: float) -> None:
+        if self._srtt is None:
+            self._srtt = rtt
+            self._rttvar = rtt / 2
+        else:
+            self._rttvar = 0.75 * self._rttvar + 0.25 * abs(self._srtt - rtt)
+            self._srtt = 0.875 * self._srtt + 0.125 * rtt
+
+    def _finished(self, host: _SweepHost) -> None:
+        if self._hosts.pop(host.address, None) is None:
+            return
+
+        for msg_id in host.queries:
+            self._transactions.pop(msg_id, None)
+        if host.retransmit_handle:
+            host.retransmit_handle.cancel()
+        if host.deadline_handle:
+            host.deadline_handle.cancel()
+
+        response = None
+        if host.answered:
+            response = Response(
+                services=host.parser.parse(),
+                deep_sleep=False,
+                model=host.parser.model,
+            )
+        self.results.put_nowait((host.address, response))
+
+    def error_received(self, exc) -> None:
+        """Error received during communication."""
+        _LOGGER.debug("Error during DNS sweep: %s", exc)
+
+    def close(self) -> None:
+        """Stop querying all hosts and close socket."""
+        for host in list(self._hosts.values()):
+            self._finished(host)
+        if self.transport:
+            self.transport.close()
+            self.transport = None
+
+
 class ReceiveDelegate(asyncio.Protocol):
     """Delegate incoming data to another object."""
 
@@ -321,6 +556,116 @@ class ReceiveDelegate(asyncio.Protocol):
         return str(self.transport.get_extra_info("socket"))
 
 
+class MulticastTransport:
+    """Multicast sockets shared by everything doing multicast requests.
+
+    One socket listening on port 5353 from anywhere is kept together with one socket
+    per local (private) address. Sockets are created when the transport is opened the
+    first time and closed when the last user closes it, so keeping the transport
+    open (e.g. in a long-running service) removes socket setup costs from repeated
+    scans. Incoming data is passed on to all added listeners.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a new MulticastTransport."""
+        self._receivers: typing.Dict[typing.Optional[str], ReceiveDelegate] = {}
+        self._listeners: typing.List[typing.Any] = []
+        self._refs: int = 0
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """Return if transport is open."""
+        return self._refs > 0
+
+    async def open(self) -> None:
+        """Open transport or update sockets if already open.
+
+        Each call must be paired with a call to `close`.
+        """
+        async with self._lock:
+            if not self._receivers:
+                # Socket listening on 5353 from anywhere
+                await self._add_receiver(None, 5353)
+
+            # One socket per local IP address, also picking up new addresses and
+            # removing old ones if already open
+            addresses = {str(addr) for addr in net.get_private_addresses()}
+            for address in set(self._receivers) - addresses - {None}:
+                self._receivers.pop(address).close()
+            for address in addresses - set(self._receivers):
+                try:
+                    await self._add_receiver(address, 0)
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.debug("Failed to add listener for %s (ignoring)", address)
+
+            self._refs += 1
+
+    async def _add_receiver(self, address: typing.Optional[str], port: int) -> None:
+        _, protocol = await asyncio.get_running_loop().create_datagram_endpoint(
+            lambda: ReceiveDelegate(self),
+            sock=net.mcast_socket(address, port),
+        )
+        self._receivers[address] = typing.cast(ReceiveDelegate, protocol)
+
+    def close(self) -> None:
+        """Close transport, closing sockets if no one else uses it."""
+        if self._refs == 0:
+            return
+
+        self._refs -= 1
+        if self._refs == 0:
+            for receiver in self._receivers.values():
+                receiver.close()
+            self._receivers.clear()
+
+    def add_listener(self, listener) -> None:
+        """Add listener receiving incoming data."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener) -> None:
+        """Remove a previously added listener."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def sendto(self, message: bytes, target) -> None:
+        """Send message to a target from all sockets."""
+        for receiver in self._receivers.values():
+            try:
+                receiver.sendto(message, target)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("fail to send to %r", receiver)
+
+    def datagram_received(self, data, addr) -> None:
+        """Receive data from remote host."""
+        for listener in tuple(self._listeners):
+            try:
+                listener.datagram_received(data, addr)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("exception during data handling")
+
+    def error_received(self, exc) -> None:
+        """Error during reception."""
+        for listener in tuple(self._listeners):
+            try:
+                listener.error_received(exc)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("connection error")
+
+
+_MULTICAST_TRANSPORTS: (
+    "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, MulticastTransport]"
+) = weakref.WeakKeyDictionary()
+
+
+def get_multicast_transport(loop: asyncio.AbstractEventLoop) -> MulticastTransport:
+    """Return multicast transport shared by everything running in a loop."""
+    transport = _MULTICAST_TRANSPORTS.get(loop)
+    if transport is None:
+        transport = _MULTICAST_TRANSPORTS[loop] = MulticastTransport()
+    return transport
+
+
 class MulticastDnsSdClientProtocol:  # pylint: disable=too-many-instance-attributes
     """Protocol to make multicast requests."""
 
@@ -344,16 +689,12 @@ class MulticastDnsSdClientProtocol:  # pylint: disable=too-many-instance-attribu
         self.parser = ServiceParser()
         self._unicasts: typing.Dict[IPv4Address, typing.List[bytes]] = {}
         self._task: typing.Optional[asyncio.Future] = None
-        self._receivers: typing.List[asyncio.BaseProtocol] = []
-
-    async def add_socket(self, sock: socket.socket):
-        """Add a new multicast socket."""
-        _, protocol = await self.loop.create_datagram_endpoint(
-            lambda: ReceiveDelegate(self),
-            sock=sock,
-        )
+        self._transport: typing.Optional[MulticastTransport] = None
 
-        self._receivers.append(protocol)
+    def attach(self, transport: MulticastTransport) -> None:
+        """Send and receive data via a multicast transport."""
+        transport.add_listener(self)
+        self._transport = transport
 
     async def get_response(self, timeout: int) -> typing.List[Response]:
         """Get respoonse with a maximum timeout."""
@@ -373,11 +714,10 @@ class MulticastDnsSdClientProtocol:  # pylint: disable=too-many-instance-attribu
                 self._task = None
 
         def _to_response(query_response: QueryResponse):
-            services = query_response.parser.parse()
             return Response(
-                services=services,
+                services=query_response.parser.parse(),
                 deep_sleep=query_response.deep_sleep,
-                model=_get_model(services),
+                model=query_response.parser.model,
             )
 
         return [_to_response(response) for response in self.query_responses.values()]
@@ -408,11 +748,8 @@ class MulticastDnsSdClientProtocol:  # pylint: disable=too-many-instance-attribu
             await asyncio.sleep(1)
 
     def _sendto(self, message, target):
-        for receiver in self._receivers:
-            try:
-                receiver.sendto(message, target)
-            except Exception:  # pylint: disable=broad-except
-                _LOGGER.exception("fail to send to %r", receiver)
+        if self._transport:
+            self._transport.sendto(message, target)
 
     def datagram_received(self, data, addr) -> None:
         """DNS response packet received."""
@@ -423,6 +760,8 @@ class MulticastDnsSdClientProtocol:  # pylint: disable=too-many-instance-attribu
             Data=data,
         )
 
+        knock.get_scheduler().responded(IPv4Address(addr[0]))
+
         query_resp = self.query_responses.setdefault(
             addr[0], QueryResponse(count=0, deep_sleep=False, parser=ServiceParser())
         )
@@ -462,7 +801,7 @@ class MulticastDnsSdClientProtocol:  # pylint: disable=too-many-instance-attribu
             response = Response(
                 services=query_resp.parser.parse(),
                 deep_sleep=query_resp.deep_sleep,
-                model=_get_model(query_resp.parser.parse()),
+                model=query_resp.parser.model,
             )
 
             if self.end_condition(response):
@@ -478,8 +817,9 @@ class MulticastDnsSdClientProtocol:  # pylint: disable=too-many-instance-attribu
 
     def close(self):
         """Close resources used by this instance."""
-        for receiver in self._receivers:
-            receiver.close()
+        if self._transport:
+            self._transport.remove_listener(self)
+            self._transport = None
         if self._task:
             self._task.cancel()
 
@@ -503,6 +843,56 @@ async def unicast(
         transport.close()
 
 
+async def unicast_sweep(  # pylint: disable=too-many-arguments
+    loop: asyncio.AbstractEventLoop,
+    addresses: typing.Iterable[str],
+    services: typing.List[str],
+    port: int = 5353,
+    timeout: float = 4,
+    concurrency: int = SWEEP_CONCURRENCY,
+    on_query: typing.Optional[typing.Callable[[str], None]] = None,
+    on_finished: typing.Optional[typing.Callable[[str], None]] = None,
+) -> typing.AsyncIterator[typing.Tuple[str, Response]]:
+    """Send request for services to many hosts, yielding responses as they arrive.
+
+    All requests are sent from a single socket and at most `concurrency` hosts are
+    queried at the same time. Each host is given `timeout` seconds to respond, so
+    the sweep finishes within `ceil(len(addresses) / concurrency) * timeout` seconds.
+    Hosts not responding at all are not yielded.
+    """
+    transport, protocol = await loop.create_datagram_endpoint(
+        lambda: UnicastDnsSdSweepProtocol(loop, services, port, timeout),
+        local_addr=("0.0.0.0", 0),
+    )
+    sweep = typing.cast(UnicastDnsSdSweepProtocol, protocol)
+
+    remaining = iter(dict.fromkeys(addresses))
+    active = 0
+    try:
+        while True:
+            while active < concurrency:
+                address = next(remaining, None)
+                if address is None:
+                    break
+                if on_query:
+                    on_query(address)
+                sweep.query(address)
+                active += 1
+
+            if active == 0:
+                break
+
+            address, response = await sweep.results.get()
+            active -= 1
+            if on_finished:
+                on_finished(address)
+            if response is not None:
+                yield address, response
+    finally:
+        sweep.close()
+        transport.close()
+
+
 async def multicast(  # pylint: disable=too-many-arguments
     loop: asyncio.AbstractEventLoop,
     services: typing.List[str],
@@ -516,19 +906,16 @@ async def multicast(  # pylint: disable=too-many-arguments
         loop, services, address, port, end_condition
     )
 
-    # Socket listening on 5353 from anywhere
-    await protocol.add_socket(net.mcast_socket(None, 5353))
-
-    # One socket per local IP address
-    for addr in net.get_private_addresses():
-        try:
-            await protocol.add_socket(net.mcast_socket(str(addr)))
-        except Exception:  # pylint: disable=broad-except
-            _LOGGER.debug("Failed to add listener for %s (ignoring)", addr)
-
-    return await typing.cast(MulticastDnsSdClientProtocol, protocol).get_response(
-        timeout
-    )
+    transport = get_multicast_transport(loop)
+    await transport.open()
+    try:
+        protocol.attach(transport)
+        return await typing.cast(MulticastDnsSdClientProtocol, protocol).get_response(
+            timeout
+        )
+    finally:
+        protocol.close()
+        transport.close()
 
 
 async def publish(loop: asyncio.AbstractEventLoop, service: Service, zconf: Zeroconf):
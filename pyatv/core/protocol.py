@@ -1,25 +1,40 @@
 """Generic functions for protocol logic."""
 
 import asyncio
+import heapq
 import inspect
+import itertools
 import logging
+import random
+import sys
 from typing import (
     Awaitable,
     Callable,
+    Coroutine,
     Dict,
     Generic,
     List,
+    NamedTuple,
     Optional,
     Tuple,
     TypeVar,
     Union,
 )
+import weakref
 
 _LOGGER = logging.getLogger(__name__)
 
 HEARTBEAT_INTERVAL = 30
 HEARTBEAT_RETRIES = 1  # One regular attempt + retries
 
+# Heartbeats are sent up to this fraction of the interval early to spread them out
+HEARTBEAT_JITTER = 0.1
+
+# Heartbeats due within this many seconds are sent in the same timer wake-up
+HEARTBEAT_COALESCE = 0.05
+
+_EAGER_TASKS = sys.version_info >= (3, 12)
+
 MessageType = TypeVar("MessageType")  # pylint: disable=invalid-name
 
 DispatchType = TypeVar("DispatchType")  # pylint: disable=invalid-name
@@ -32,58 +47,268 @@ def _no_filter(message: MessageType) -> bool:
     return True
 
 
-async def heartbeater(
-    name: str,
-    sender_func: Callable[[Optional[MessageType]], Awaitable],
-    finish_func: Callable[[], None] = lambda: None,
-    failure_func: Callable[[Exception], None] = lambda exc: None,
-    message_factory: Callable[[], Optional[MessageType]] = lambda: None,
-    retries=HEARTBEAT_RETRIES,
-    interval=HEARTBEAT_INTERVAL,
-):
-    """Periodically send heartbeat messages to device."""
-    _LOGGER.debug("Starting heartbeat loop (%s)", name)
-    count = 0
-    attempts = 0
-    message = message_factory()
-    while True:
-        try:
-            # Re-attempts are made with no initial delay to more quickly
-            # recover a failed heartbeat (if possible)
-            if attempts == 0:
-                await asyncio.sleep(interval)
+class Heartbeat:
+    """Periodic heartbeat scheduled by HeartbeatScheduler.
+
+    The sender function is called once every interval. A failed send is retried
+    immediately up to a number of times before the failure function is called and
+    the heartbeat stops. If traffic is seen on the connection (reported via `touch`),
+    the next heartbeat is postponed until a full interval has passed without traffic.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        scheduler: "HeartbeatScheduler",
+        name: str,
+        sender_func: Callable[[Optional[MessageType]], Awaitable],
+        finish_func: Callable[[], None],
+        failure_func: Callable[[Exception], None],
+        message: Optional[MessageType],
+        retries: int,
+        interval: float,
+    ) -> None:
+        """Initialize a new Heartbeat instance."""
+        self.name = name
+        self.interval = interval
+        self.count = 0
+        self._scheduler = scheduler
+        self._sender_func = sender_func
+        self._finish_func = finish_func
+        self._failure_func = failure_func
+        self._message = message
+        self._retries = retries
+        self._attempts = 0
+        self._due: Optional[float] = None
+        self._last_activity: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+        self._active = True
+
+    @property
+    def active(self) -> bool:
+        """Return if heartbeat is still running."""
+        return self._active
+
+    @property
+    def due(self) -> Optional[float]:
+        """Return loop time when next heartbeat is due (None if not scheduled)."""
+        return self._due
+
+    def touch(self) -> None:
+        """Report that traffic was seen on the connection."""
+        self._last_activity = asyncio.get_running_loop().time()
+
+    def cancel(self) -> Optional[asyncio.Task]:
+        """Stop sending heartbeats.
 
-            _LOGGER.debug("Sending periodic heartbeat %d (%s)", count, name)
-            await sender_func(message)
-            _LOGGER.debug("Got heartbeat %d (%s)", count, name)
+        A heartbeat currently being sent is cancelled and returned so that it can be
+        awaited. The finish function is called (soon) unless heartbeat already failed.
+        """
+        if not self._active:
+            return None
+
+        _LOGGER.debug("Stopping heartbeat loop at %d (%s)", self.count, self.name)
+        self._active = False
+        self._due = None
+        asyncio.get_running_loop().call_soon(self._finish_func)
+        task, self._task = self._task, None
+        if task:
+            task.cancel()
+        return task
+
+    def _schedule(self, delay: float) -> None:
+        self._due = asyncio.get_running_loop().time() + delay
+        self._scheduler._push(self, self._due)  # pylint: disable=protected-access
+
+    def _fire(self, now: float) -> None:
+        self._due = None
+
+        # Traffic on the connection serves the same purpose as a heartbeat, so if
+        # something was received recently the heartbeat is postponed until a full
+        # interval has passed since then (retries are always sent)
+        if self._attempts == 0 and self._last_activity is not None:
+            quiet_since = now - self._last_activity
+            if quiet_since < self.interval / 2:
+                _LOGGER.debug("Skipping heartbeat %d (%s)", self.count, self.name)
+                self._schedule(self._scheduler.jittered(self.interval - quiet_since))
+                return
+
+        self._task = asyncio.ensure_future(self._send())
+
+    async def _send(self) -> None:
+        try:
+            _LOGGER.debug("Sending periodic heartbeat %d (%s)", self.count, self.name)
+            await self._sender_func(self._message)
+            _LOGGER.debug("Got heartbeat %d (%s)", self.count, self.name)
         except asyncio.CancelledError:
-            break
+            return
         except Exception as exc:
-            attempts += 1
-            if attempts > retries:
+            self._task = None
+            self._attempts += 1
+            if self._attempts > self._retries:
                 _LOGGER.debug(
-                    "Heartbeat %d failed after %d tries (%s)", count, attempts, name
+                    "Heartbeat %d failed after %d tries (%s)",
+                    self.count,
+                    self._attempts,
+                    self.name,
                 )
-                failure_func(exc)
+                self._active = False
+                self._failure_func(exc)
                 return
-            _LOGGER.debug("Heartbeat %d failed (%s)", count, name)
+
+            # Re-attempts are made with no initial delay to more quickly
+            # recover a failed heartbeat (if possible)
+            _LOGGER.debug("Heartbeat %d failed (%s)", self.count, self.name)
+            self.count += 1
+            self._schedule(0.0)
         else:
-            attempts = 0
-        finally:
-            count += 1
+            self._task = None
+            self._attempts = 0
+            self.count += 1
+            if self._active:
+                self._schedule(self._scheduler.jittered(self.interval))
+
+
+class HeartbeatScheduler:
+    """Send heartbeats for all connections from one timer.
 
-    _LOGGER.debug("Stopping heartbeat loop at %d (%s)", count, name)
-    finish_func()
+    Heartbeats are kept in a heap ordered by due time and a single timer is armed for
+    the earliest one. Heartbeats due close to each other are handled in the same
+    wake-up. Intervals are jittered so that connections set up at the same time (e.g.
+    after a restart) do not send heartbeats in lockstep.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a new HeartbeatScheduler instance."""
+        self._heap: List[Tuple[float, int, Heartbeat]] = []
+        self._counter = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def __len__(self) -> int:
+        """Return number of pending heartbeats."""
+        return len(self._heap)
+
+    def schedule(  # pylint: disable=too-many-arguments
+        self,
+        name: str,
+        sender_func: Callable[[Optional[MessageType]], Awaitable],
+        finish_func: Callable[[], None] = lambda: None,
+        failure_func: Callable[[Exception], None] = lambda exc: None,
+        message_factory: Callable[[], Optional[MessageType]] = lambda: None,
+        retries: int = HEARTBEAT_RETRIES,
+        interval: float = HEARTBEAT_INTERVAL,
+        initial_delay: Optional[float] = None,
+    ) -> Heartbeat:
+        """Start sending heartbeats.
+
+        First heartbeat is sent after `initial_delay` seconds. If not specified, a
+        random delay of up to one interval is used to spread out heartbeats.
+        """
+        _LOGGER.debug("Starting heartbeat loop (%s)", name)
+        heartbeat = Heartbeat(
+            self,
+            name,
+            sender_func,
+            finish_func,
+            failure_func,
+            message_factory(),
+            retries,
+            interval,
+        )
+        if initial_delay is None:
+            initial_delay = random.uniform(interval / 2, interval)
+        heartbeat._schedule(initial_delay)  # pylint: disable=protected-access
+        return heartbeat
+
+    @staticmethod
+    def jittered(delay: float) -> float:
+        """Return delay shortened by a random jitter."""
+        return max(0.0, delay * random.uniform(1.0 - HEARTBEAT_JITTER, 1.0))
+
+    def _push(self, heartbeat: Heartbeat, due: float) -> None:
+        heapq.heappush(self._heap, (due, next(self._counter), heartbeat))
+        if self._timer is None or due < self._timer.when():
+            self._arm()
+
+    def _arm(self) -> None:
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+
+        # Entries for cancelled or rescheduled heartbeats are dropped lazily
+        while self._heap and self._heap[0][2].due != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+        if self._heap:
+            self._timer = asyncio.get_running_loop().call_at(
+                self._heap[0][0], self._run
+            )
+
+    def _run(self) -> None:
+        self._timer = None
+        now = asyncio.get_running_loop().time()
+        expired: List[Heartbeat] = []
+        while self._heap and self._heap[0][0] <= now + HEARTBEAT_COALESCE:
+            due, _, heartbeat = heapq.heappop(self._heap)
+            if heartbeat.due == due:
+                expired.append(heartbeat)
+
+        # Fire after popping so that heartbeats rescheduled by _fire are not handled
+        # again in this wake-up
+        for heartbeat in expired:
+            heartbeat._fire(now)  # pylint: disable=protected-access
+        self._arm()
+
+
+_SCHEDULERS: (
+    "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, HeartbeatScheduler]"
+) = weakref.WeakKeyDictionary()
+
+
+def get_heartbeat_scheduler() -> HeartbeatScheduler:
+    """Return heartbeat scheduler shared by everything running in the current loop."""
+    loop = asyncio.get_running_loop()
+    scheduler = _SCHEDULERS.get(loop)
+    if scheduler is None:
+        scheduler = _SCHEDULERS[loop] = HeartbeatScheduler()
+    return scheduler
+
+
+class _Listener(NamedTuple):
+    message_filter: DispatchFilterFunc
+    func: DispatchFunc
+    is_async: bool
+
+
+async def _call_listener(coro: Awaitable) -> None:
+    # Make sure to catch any exceptions caused by the listener so we don't get
+    # unfinished tasks laying around
+    try:
+        await coro
+    except asyncio.CancelledError:
+        pass
+    except Exception:
+        _LOGGER.exception("error during dispatch")
+
+
+def _create_task(loop: asyncio.AbstractEventLoop, coro: Coroutine) -> asyncio.Task:
+    # Listeners are started eagerly where supported (Python 3.12+), i.e. run until they
+    # have to wait for something already when dispatched. They still run inside a task,
+    # so timeouts, cancellation and current_task() work as usual.
+    if _EAGER_TASKS:
+        return asyncio.Task(coro, loop=loop, eager_start=True)  # type: ignore
+    return loop.create_task(coro)
 
 
 class MessageDispatcher(Generic[DispatchType, DispatchMessage]):
-    """Dispatch message to listeners based on a type."""
+    """Dispatch message to listeners based on a type.
+
+    Coroutine functions are run in a task (started eagerly if supported) and regular
+    functions are called soon by the event loop.
+    """
 
     def __init__(self) -> None:
         """Initialize a new MessageDispatcher instance."""
-        self.__listeners: Dict[
-            DispatchType, List[Tuple[DispatchFilterFunc, DispatchFunc]]
-        ] = {}
+        self.__listeners: Dict[DispatchType, Tuple[_Listener, ...]] = {}
 
     def listen_to(
         self,
@@ -92,34 +317,33 @@ class MessageDispatcher(Generic[DispatchType, DispatchMessage]):
         message_filter: DispatchFilterFunc = _no_filter,
     ) -> None:
         """Listen to a specific type of message type."""
-        self.__listeners.setdefault(dispatch_type, []).append((message_filter, func))
+        # A new tuple is created so that listeners can be added while dispatching
+        self.__listeners[dispatch_type] = self.__listeners.get(dispatch_type, ()) + (
+            _Listener(message_filter, func, inspect.iscoroutinefunction(func)),
+        )
 
     def dispatch(
         self, dispatch_type: DispatchType, message: DispatchMessage
     ) -> List[asyncio.Task]:
         """Dispatch a message to listeners."""
-
-        async def _call_listener(func):
-            # Make sure to catch any exceptions caused by the listener so we don't get
-            # unfished tasks laying around
-            try:
-                await func
-            except asyncio.CancelledError:
-                pass
-            except Exception:
-                _LOGGER.exception("error during dispatch")
+        listeners = self.__listeners.get(dispatch_type)
+        if not listeners:
+            return []
 
         tasks = []
         loop = asyncio.get_event_loop()
-        listeners = self.__listeners.get(dispatch_type, [])
-        for func in [func for filter_func, func in listeners if filter_func(message)]:
+        for message_filter, func, is_async in listeners:
+            if message_filter is not _no_filter and not message_filter(message):
+                continue
+
             _LOGGER.debug(
                 "Dispatching message with type %s to %s",
                 dispatch_type,
                 func,
             )
-            if inspect.iscoroutinefunction(func):
-                tasks.append(asyncio.ensure_future(_call_listener(func(message))))
+            if is_async:
+                coro = _call_listener(func(message))  # type: ignore
+                tasks.append(_create_task(loop, coro))
             else:
                 loop.call_soon(func, message)
         return tasks
@@ -26,10 +26,13 @@ relayer.register(DmapMetadata())
 relayer.register(CompanionMetadata())
 relayer.register(AirPlayMetadata())
 artwork = await relayer.relay("artwork")(width=640)
+
+Which instance that implements a method only changes when an instance is registered
+or a takeover is done (or released), so the result is cached until then.
 """
 
 from itertools import chain
-from typing import Dict, Generic, List, Optional, Sequence, Type, TypeVar
+from typing import Dict, Generic, List, Optional, Sequence, Tuple, Type, TypeVar
 
 from pyatv import exceptions
 from pyatv.const import Protocol
@@ -48,6 +51,12 @@ class Relayer(Generic[T]):
         self._priorities = protocol_priority
         self._interfaces: Dict[Protocol, T] = {}
         self._takeover_protocol: List[Protocol] = []
+        # (target, priority) -> instance implementing target or None if not supported
+        self._resolved: Dict[
+            Tuple[str, Optional[Tuple[Protocol, ...]]], Optional[T]
+        ] = {}
+        self._main_protocol: Optional[Protocol] = None
+        self._main_resolved = False
 
     @property
     def count(self):
@@ -57,18 +66,25 @@ class Relayer(Generic[T]):
     @property
     def main_instance(self) -> T:
         """Return main instance based on priority."""
-        for priority in chain(self._takeover_protocol, self._priorities):
-            if priority in self._interfaces:
-                return self._interfaces[priority]
-        raise exceptions.NotSupportedError()
+        protocol = self.main_protocol
+        if protocol is None:
+            raise exceptions.NotSupportedError()
+        return self._interfaces[protocol]
 
     @property
     def main_protocol(self) -> Optional[Protocol]:
         """Return Protocol for main instance."""
-        for priority in chain(self._takeover_protocol, self._priorities):
-            if priority in self._interfaces:
-                return priority
-        return None
+        if not self._main_resolved:
+            self._main_protocol = next(
+                (
+                    priority
+                    for priority in chain(self._takeover_protocol, self._priorities)
+                    if priority in self._interfaces
+                ),
+                None,
+            )
+            self._main_resolved = True
+        return self._main_protocol
 
     @property
     def instances(self) -> Sequence[T]:
@@ -81,6 +97,7 @@ class Relayer(Generic[T]):
             raise RuntimeError(f"{protocol} not in priority list")
 
         self._interfaces[protocol] = instance
+        self._invalidate()
 
     def get(self, protocol: Protocol) -> Optional[T]:
         """Return instance for protocol if available."""
@@ -88,11 +105,29 @@ class Relayer(Generic[T]):
 
     def relay(self, target: str, priority: Optional[List[Protocol]] = None):
         """Return method (or property value) of target instance based on priority."""
-        instance = self._find_instance(
-            target, chain(self._takeover_protocol, priority or self._priorities)
-        )
+        key = (target, tuple(priority) if priority else None)
+        try:
+            instance = self._resolved[key]
+        except KeyError:
+            instance = self._resolve(target, priority)
+            self._resolved[key] = instance
+
+        if instance is None:
+            raise exceptions.NotSupportedError(f"{target} is not supported")
         return getattr(instance, target)
 
+    def _resolve(self, target: str, priority: Optional[List[Protocol]]) -> Optional[T]:
+        try:
+            return self._find_instance(
+                target, chain(self._takeover_protocol, priority or self._priorities)
+            )
+        except exceptions.NotSupportedError:
+            return None
+
+    def _invalidate(self) -> None:
+        self._resolved.clear()
+        self._main_resolved = False
+
     def _find_instance(self, target: str, priority):
         for priority_iface in priority:
             interface = self._interfaces.get(priority_iface)
@@ -121,7 +156,9 @@ class Relayer(Generic[T]):
                 f"{self._takeover_protocol[0]} has already done takeover"
             )
         self._takeover_protocol = [protocol]
+        self._invalidate()
 
     def release(self) -> None:
         """Release temporary takeover."""
         self._takeover_protocol = []
+        self._invalidate()
@@ -262,31 +262,32 @@ class UnicastMdnsScanner(BaseScanner):
 
     async def process(self, timeout: int) -> None:
         """Start to process devices and services."""
-        responses = await asyncio.gather(
-            *[self._get_services(host, timeout) for host in self.hosts]
-        )
+        port = int(os.environ.get("PYATV_UDNS_PORT", 5353))  # For testing purposes
+        scheduler = knock.get_scheduler()
+        knocking: Set[IPv4Address] = set()
 
-        for response in responses:
-            self.handle_response(response)
+        def _start_knock(address: str) -> None:
+            knocking.add(IPv4Address(address))
+            scheduler.add(IPv4Address(address), KNOCK_PORTS, timeout)
+
+        def _stop_knock(address: str) -> None:
+            knocking.discard(IPv4Address(address))
+            scheduler.remove(IPv4Address(address))
 
-    async def _get_services(self, host: IPv4Address, timeout: int) -> mdns.Response:
-        port = int(os.environ.get("PYATV_UDNS_PORT", 5353))  # For testing purposes
-        knocker = None
         try:
-            knocker = await knock.knocker(host, KNOCK_PORTS, self.loop, timeout=timeout)
-            response = await mdns.unicast(
+            async for _, response in mdns.unicast_sweep(
                 self.loop,
-                str(host),
+                [str(host) for host in self.hosts],
                 self.services,
                 port=port,
                 timeout=timeout,
-            )
-        except asyncio.TimeoutError:
-            return mdns.Response([], False, None)
+                on_query=_start_knock,
+                on_finished=_stop_knock,
+            ):
+                self.handle_response(response)
         finally:
-            if knocker:
-                knocker.cancel()
-        return response
+            for address in knocking:
+                scheduler.remove(address)
 
 
 class MulticastMdnsScanner(BaseScanner):
@@ -132,7 +132,7 @@ def retrieve_commands(obj: object):
             obj.__dict__[func], property
         ):
             continue
-        if func.startswith("_") or func == "listener":
+        if func.startswith("_") or func in ("listener", "diff"):
             continue
         commands[func] = _get_first_sentence_in_pydoc(obj.__dict__[func])
     return commands
@@ -467,9 +467,14 @@ class RemoteControl:
 
 # TODO: Should be made into a dataclass when support for 3.6 is dropped
 class Playing(ABC):
-    """Base class for retrieving what is currently playing."""
+    """Base class for retrieving what is currently playing.
 
-    _PROPERTIES = [
+    Instances are immutable snapshots with all fields kept in a single tuple, making
+    them small and cheap to create and compare. Instances are hashable and the hash
+    is only calculated once.
+    """
+
+    _PROPERTIES = (
         "media_type",
         "device_state",
         "title",
@@ -486,7 +491,9 @@ class Playing(ABC):
         "episode_number",
         "content_identifier",
         "itunes_store_identifier",
-    ]
+    )
+
+    __slots__ = ("_values", "_content_hash")
 
     def __init__(  # pylint: disable=too-many-locals
         self,
@@ -508,34 +515,32 @@ class Playing(ABC):
         itunes_store_identifier: Optional[int] = None,
     ) -> None:
         """Initialize a new Playing instance."""
-        self._itunes_store_identifier = None
-        self._media_type = media_type
-        self._device_state = device_state
-        self._title = title
-        self._artist = artist
-        self._album = album
-        self._genre = genre
-        self._total_time = total_time
-        self._position = position
-        self._shuffle = shuffle
-        self._repeat = repeat
-        self._hash = hash
-        self._series_name = series_name
-        self._season_number = season_number
-        self._episode_number = episode_number
-        self._content_identifier = content_identifier
-        self._itunes_store_identifier = itunes_store_identifier
-
-        self._post_process()
-
-    def _post_process(self) -> None:
-        if self._position:
-            # Make sure position never is negative
-            self._position = max(self._position, 0)
-
-            # If there's a total time, never exceed that'
-            if self._total_time:
-                self._position = min(self._position, self._total_time)
+        # Make sure position never is negative and never exceeds total time
+        if position:
+            position = max(position, 0)
+            if total_time:
+                position = min(position, total_time)
+
+        # Same order as _PROPERTIES
+        self._values: Tuple[Any, ...] = (
+            media_type,
+            device_state,
+            title,
+            artist,
+            album,
+            genre,
+            total_time,
+            position,
+            shuffle,
+            repeat,
+            hash,
+            series_name,
+            season_number,
+            episode_number,
+            content_identifier,
+            itunes_store_identifier,
+        )
+        self._content_hash: Optional[int] = None
 
     def __str__(self) -> str:  # pylint: disable=too-many-branches
         """Convert this playing object to a readable string."""
@@ -585,19 +590,56 @@ class Playing(ABC):
         if self.shuffle is not None:
             output.append(f"     Shuffle: {convert.shuffle_str(self.shuffle)}")
 
-        if self._itunes_store_identifier is not None:
-            output.append(f"iTunes Store Identifier: {self._itunes_store_identifier}")
+        if self.itunes_store_identifier is not None:
+            output.append(f"iTunes Store Identifier: {self.itunes_store_identifier}")
         return "\n".join(output)
 
     def __eq__(self, other) -> bool:
         """Compare if two objects are equal."""
         if isinstance(other, Playing):
-            for prop in self._PROPERTIES:
-                if getattr(self, prop) != getattr(other, prop):
-                    return False
-            return True
+            if self._values is other._values:
+                return True
+            # Different hashes (when already calculated) means different content
+            if (
+                self._content_hash is not None
+                and other._content_hash is not None
+                and self._content_hash != other._content_hash
+            ):
+                return False
+            return self._values == other._values
         return False
 
+    def __hash__(self) -> int:
+        """Return hash of all fields (calculated once)."""
+        if self._content_hash is None:
+            self._content_hash = hash(self._values)
+        return self._content_hash
+
+    def diff(self, other: Optional["Playing"]) -> Dict[str, Any]:
+        """Return fields (and values) in this instance that differ from other.
+
+        If other is None, all fields are returned. Values are the same as returned by
+        the corresponding properties.
+        """
+        if other is None:
+            return {prop: getattr(self, prop) for prop in self._PROPERTIES}
+        if self == other:
+            return {}
+
+        other_values = other._values  # pylint: disable=protected-access
+        changes = {
+            prop: getattr(self, prop)
+            for prop, value, other_value in zip(
+                self._PROPERTIES, self._values, other_values
+            )
+            if value != other_value
+        }
+
+        # Default hash is derived from other fields
+        if "hash" not in changes and self.hash != other.hash:
+            changes["hash"] = self.hash
+        return changes
+
     @property
     def hash(self) -> str:
         """Create a unique hash for what is currently playing.
@@ -605,8 +647,8 @@ class Playing(ABC):
         The hash is based on title, artist, album and total time. It should
         always be the same for the same content, but it is not guaranteed.
         """
-        if self._hash:
-            return self._hash
+        if self._values[10]:
+            return self._values[10]
 
         base = f"{self.title}{self.artist}{self.album}{self.total_time}"
         return hashlib.sha256(base.encode("utf-8")).hexdigest()
@@ -614,90 +656,90 @@ class Playing(ABC):
     @property
     def media_type(self) -> const.MediaType:
         """Type of media is currently playing, e.g. video, music."""
-        return self._media_type
+        return self._values[0]
 
     @property
     def device_state(self) -> const.DeviceState:
         """Device state, e.g. playing or paused."""
-        return self._device_state
+        return self._values[1]
 
     @property  # type: ignore
     @feature(22, "Title", "Title of playing media.")
     def title(self) -> Optional[str]:
         """Title of the current media, e.g. movie or song name."""
-        return self._title
+        return self._values[2]
 
     @property  # type: ignore
     @feature(23, "Artist", "Artist of playing song.")
     def artist(self) -> Optional[str]:
         """Artist of the currently playing song."""
-        return self._artist
+        return self._values[3]
 
     @property  # type: ignore
     @feature(24, "Album", "Album from playing artist.")
     def album(self) -> Optional[str]:
         """Album of the currently playing song."""
-        return self._album
+        return self._values[4]
 
     @property  # type: ignore
     @feature(25, "Genre", "Genre of playing song.")
     def genre(self) -> Optional[str]:
         """Genre of the currently playing song."""
-        return self._genre
+        return self._values[5]
 
     @property  # type: ignore
     @feature(26, "TotalTime", "Total length of playing media (seconds).")
     def total_time(self) -> Optional[int]:
         """Total play time in seconds."""
-        return self._total_time
+        return self._values[6]
 
     @property  # type: ignore
     @feature(27, "Position", "Current play time position.")
     def position(self) -> Optional[int]:
         """Position in the playing media (seconds)."""
-        return self._position
+        return self._values[7]
 
     @property  # type: ignore
     @feature(28, "Shuffle", "Shuffle state.")
     def shuffle(self) -> Optional[const.ShuffleState]:
         """If shuffle is enabled or not."""
-        return self._shuffle
+        return self._values[8]
 
     @property  # type: ignore
     @feature(29, "Repeat", "Repeat state.")
     def repeat(self) -> Optional[const.RepeatState]:
         """Repeat mode."""
-        return self._repeat
+        return self._values[9]
 
     @property  # type: ignore
     @feature(40, "SeriesName", "Title of TV series.")
     def series_name(self) -> Optional[str]:
         """Title of TV series."""
-        return self._series_name
+        return self._values[11]
 
     @property  # type: ignore
     @feature(41, "SeasonNumber", "Season number of TV series.")
     def season_number(self) -> Optional[int]:
         """Season number of TV series."""
-        return self._season_number
+        return self._values[12]
 
     @property  # type: ignore
     @feature(42, "EpisodeNumber", "Episode number of TV series.")
     def episode_number(self) -> Optional[int]:
         """Episode number of TV series."""
-        return self._episode_number
+        return self._values[13]
 
     @property  # type: ignore
     @feature(47, "ContentIdentifier", "Identifier for Content")
     def content_identifier(self) -> Optional[str]:
         """Content identifier (app specific)."""
-        return self._content_identifier
+        return self._values[14]
 
     @property  # type: ignore
     @feature(50, "iTunesStoreIdentifier", "iTunes Store identifier for Content")
     def itunes_store_identifier(self) -> Optional[int]:
         """Itunes Store identifier."""
-        return self._itunes_store_identifier
+        return self._values[15]
 
 
 class App:
@@ -840,6 +882,16 @@ class PushListener(ABC):
     def playstatus_error(self, updater, exception: Exception) -> None:
         """Inform about an error when updating play status."""
 
+    def playstatus_diff(
+        self, updater, playstatus: Playing, changes: Dict[str, Any]
+    ) -> None:
+        """Inform about which fields changed in what is currently playing.
+
+        Called after `playstatus_update` with the fields (and new values) that changed
+        since the previous update. All fields are included in the first update after
+        push updates are started. Implement this method to only act on changes.
+        """
+
 
 class PushUpdater(ABC, StateProducer):
     """Base class for push/async updates from an Apple TV.
@@ -0,0 +1,282 @@
+"""Manage connections to many devices from one process.
+
+A `DeviceManager` keeps a set of devices connected, sharing one HTTP session between
+all of them and limiting how many handshakes are performed at the same time. If a
+connection is lost, the manager reconnects in the background using exponential
+backoff with jitter. Health of each device is available via `DeviceManager.health`.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from enum import Enum
+import logging
+import random
+import time
+from typing import Callable, Dict, List, Optional, Set
+
+import aiohttp
+
+import pyatv
+from pyatv import exceptions, interface
+from pyatv.interface import Storage
+from pyatv.storage.memory_storage import MemoryStorage
+from pyatv.support import http
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENT_CONNECTS: int = 10
+DEFAULT_RECONNECT_DELAY: float = 1.0
+DEFAULT_MAX_RECONNECT_DELAY: float = 300.0
+
+# pylint: disable=invalid-name
+
+
+class DeviceState(Enum):
+    """Connection state of a managed device."""
+
+    Connecting = 0
+    """Device is waiting for or performing a handshake."""
+
+    Connected = 1
+    """Device is connected."""
+
+    Disconnected = 2
+    """Device is not connected and will reconnect after a delay."""
+
+    Closed = 3
+    """Device was removed from the manager and will not be reconnected."""
+
+
+# pylint: enable=invalid-name
+
+
+@dataclass
+class DeviceHealth:
+    """Health information about a managed device."""
+
+    identifier: str
+    state: DeviceState = DeviceState.Disconnected
+    connect_attempts: int = 0
+    connection_losses: int = 0
+    connected_since: Optional[float] = None
+    handshake_time: Optional[float] = None
+    last_error: Optional[Exception] = None
+
+    def __str__(self) -> str:
+        """Return string representation of object."""
+        return (
+            f"{self.identifier}: {self.state.name}, "
+            f"attempts={self.connect_attempts}, losses={self.connection_losses}, "
+            f"last_error={self.last_error}"
+        )
+
+
+class _ManagedDevice(interface.DeviceListener):
+    """Connection state for a single device."""
+
+    def __init__(
+        self,
+        config: interface.BaseConfig,
+        on_disconnected: Callable[["_ManagedDevice"], None],
+    ) -> None:
+        self.config = config
+        self.atv: Optional[interface.AppleTV] = None
+        self.health = DeviceHealth(config.identifier or config.name)
+        self.connected = asyncio.Event()
+        self.failures = 0
+        self.task: Optional[asyncio.Task] = None
+        self.reconnect: Optional[asyncio.TimerHandle] = None
+        self.closing: Set[asyncio.Task] = set()
+        self._on_disconnected = on_disconnected
+
+    def connection_lost(self, exception: Exception) -> None:
+        """Device was unexpectedly disconnected."""
+        self.health.last_error = exception
+        self._on_disconnected(self)
+
+    def connection_closed(self) -> None:
+        """Device connection was (intentionally) closed."""
+        self._on_disconnected(self)
+
+
+class DeviceManager:
+    """Keep a set of devices connected with shared resources.
+
+    All devices share the same aiohttp `ClientSession`. If `session` is provided it
+    will be used (and not closed by the manager), otherwise one is created on first
+    use and closed by `close`. At most `max_concurrent_connects` handshakes are
+    performed at the same time. After a failed attempt or a lost connection, the
+    manager waits between `reconnect_delay` and `max_reconnect_delay` seconds
+    (doubled after each consecutive failure, with jitter) before trying again. This
+    also applies when a device connection is closed by the device itself or by
+    calling `close` on it, so use `remove` to stop managing a device.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        storage: Optional[Storage] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        max_concurrent_connects: int = DEFAULT_MAX_CONCURRENT_CONNECTS,
+        reconnect_delay: float = DEFAULT_RECONNECT_DELAY,
+        max_reconnect_delay: float = DEFAULT_MAX_RECONNECT_DELAY,
+    ) -> None:
+        """Initialize a new DeviceManager."""
+        self._loop = loop
+        self._storage = storage or MemoryStorage()
+        self._session = session
+        self._session_manager: Optional[http.ClientSessionManager] = None
+        self._semaphore = asyncio.Semaphore(max_concurrent_connects)
+        self._reconnect_delay = reconnect_delay
+        self._max_reconnect_delay = max_reconnect_delay
+        self._devices: Dict[str, _ManagedDevice] = {}
+
+    @property
+    def devices(self) -> List[interface.AppleTV]:
+        """Return all currently connected devices."""
+        return [device.atv for device in self._devices.values() if device.atv]
+
+    async def add(self, config: interface.BaseConfig) -> None:
+        """Add a device and start connecting to it in the background."""
+        if config.identifier is None:
+            raise exceptions.DeviceIdMissingError("no device identifier")
+        if config.identifier in self._devices:
+            raise ValueError(f"device {config.identifier} already added")
+
+        if self._session_manager is None:
+            self._session_manager = await http.create_session(self._session)
+
+        device = _ManagedDevice(config, self._disconnected)
+        self._devices[config.identifier] = device
+        self._connect_now(device)
+
+    async def remove(self, identifier: str) -> None:
+        """Stop managing a device and close its connection."""
+        device = self._devices.pop(identifier)
+        await self._stop(device)
+
+    def get(self, identifier: str) -> Optional[interface.AppleTV]:
+        """Return connected device with identifier or None if not connected."""
+        device = self._devices.get(identifier)
+        return device.atv if device else None
+
+    def health(self) -> Dict[str, DeviceHealth]:
+        """Return health information for all managed devices."""
+        return {
+            identifier: device.health for identifier, device in self._devices.items()
+        }
+
+    async def wait_connected(self, timeout: Optional[float] = None) -> None:
+        """Wait until all managed devices are connected."""
+        await asyncio.wait_for(
+            asyncio.gather(
+                *[device.connected.wait() for device in self._devices.values()]
+            ),
+            timeout,
+        )
+
+    async def close(self) -> None:
+        """Close all device connections and release shared resources."""
+        devices = list(self._devices.values())
+        self._devices.clear()
+        await asyncio.gather(*[self._stop(device) for device in devices])
+        if self._session_manager:
+            await self._session_manager.close()
+            self._session_manager = None
+
+    async def _stop(self, device: _ManagedDevice) -> None:
+        if device.reconnect:
+            device.reconnect.cancel()
+            device.reconnect = None
+        if device.task:
+            device.task.cancel()
+            await asyncio.gather(device.task, return_exceptions=True)
+        # Clear atv first so that closing it does not trigger a reconnect
+        atv, device.atv = device.atv, None
+        if atv:
+            device.closing.update(atv.close())
+        await self._closed(device)
+        device.health.state = DeviceState.Closed
+        device.health.connected_since = None
+
+    def _next_delay(self, failures: int) -> float:
+        delay = min(
+            self._max_reconnect_delay, self._reconnect_delay * 2 ** min(failures, 32)
+        )
+        # Spread reconnects over [delay/2, delay] so that devices lost at the same
+        # time (e.g. network outage) do not reconnect in lockstep
+        return random.uniform(delay / 2, delay)
+
+    def _connect_now(self, device: _ManagedDevice) -> None:
+        device.reconnect = None
+        device.health.state = DeviceState.Connecting
+        device.task = asyncio.ensure_future(self._connect(device))
+
+    def _connect_later(self, device: _ManagedDevice) -> None:
+        delay = self._next_delay(device.failures)
+        device.failures += 1
+        device.health.state = DeviceState.Disconnected
+        _LOGGER.debug("Reconnecting to %s in %.1fs", device.health.identifier, delay)
+        device.reconnect = self._loop.call_later(delay, self._connect_now, device)
+
+    def _disconnected(self, device: _ManagedDevice) -> None:
+        if device.atv is None:
+            return
+
+        _LOGGER.debug("Disconnected from %s", device.health.identifier)
+
+        # Release everything held by the lost connection (protocols, push updaters,
+        # heartbeats, etc). Tasks are awaited before connecting again.
+        atv, device.atv = device.atv, None
+        device.closing.update(atv.close())
+        device.connected.clear()
+        device.health.connected_since = None
+        device.health.connection_losses += 1
+        self._connect_later(device)
+
+    @staticmethod
+    async def _closed(device: _ManagedDevice) -> None:
+        # Tasks are not cancelled if this is cancelled (unlike with gather)
+        if not device.closing:
+            return
+        await asyncio.wait(device.closing)
+        for task in device.closing:
+            if not task.cancelled() and task.exception():
+                _LOGGER.debug(
+                    "Error when closing %s: %s",
+                    device.health.identifier,
+                    task.exception(),
+                )
+        device.closing.clear()
+
+    async def _connect(self, device: _ManagedDevice) -> None:
+        await self._closed(device)
+
+        health = device.health
+        try:
+            async with self._semaphore:
+                health.connect_attempts += 1
+                start_time = time.monotonic()
+                atv = await pyatv.connect(
+                    device.config,
+                    self._loop,
+                    session=self._session_manager.session,  # type: ignore
+                    storage=self._storage,
+                )
+                health.handshake_time = time.monotonic() - start_time
+        except Exception as ex:  # pylint: disable=broad-except
+            _LOGGER.debug("Failed to connect to %s: %s", health.identifier, ex)
+            health.last_error = ex
+            self._connect_later(device)
+            return
+
+        # No task is kept per device while connected, the listener schedules a
+        # reconnect when the connection is lost
+        device.task = None
+        device.failures = 0
+        device.atv = atv
+        atv.listener = device
+        device.connected.set()
+        health.state = DeviceState.Connected
+        health.connected_since = time.time()
+        _LOGGER.debug("Connected to %s", health.identifier)
@@ -1,17 +1,24 @@
 """Module containing all protocol logic."""
 
-from typing import Any, Awaitable, Callable, Dict, Generator, Mapping, NamedTuple
+from importlib import import_module
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generator,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    NamedTuple,
+    Union,
+)
 
 from pyatv import interface
 from pyatv.const import Protocol
 from pyatv.core import Core, MutableService, SetupData
 from pyatv.core.scan import ScanMethod
 from pyatv.interface import BaseService, DeviceInfo
-from pyatv.protocols import airplay as airplay_proto
-from pyatv.protocols import companion as companion_proto
-from pyatv.protocols import dmap as dmap_proto
-from pyatv.protocols import mrp as mrp_proto
-from pyatv.protocols import raop as raop_proto
 
 SetupMethod = Callable[
     [Core],
@@ -34,40 +41,55 @@ class ProtocolMethods(NamedTuple):
     service_info: ServiceInfoMethod
 
 
-PROTOCOLS = {
-    Protocol.AirPlay: ProtocolMethods(
-        airplay_proto.setup,
-        airplay_proto.scan,
-        airplay_proto.pair,
-        airplay_proto.device_info,
-        airplay_proto.service_info,
-    ),
-    Protocol.Companion: ProtocolMethods(
-        companion_proto.setup,
-        companion_proto.scan,
-        companion_proto.pair,
-        companion_proto.device_info,
-        companion_proto.service_info,
-    ),
-    Protocol.DMAP: ProtocolMethods(
-        dmap_proto.setup,
-        dmap_proto.scan,
-        dmap_proto.pair,
-        dmap_proto.device_info,
-        dmap_proto.service_info,
-    ),
-    Protocol.MRP: ProtocolMethods(
-        mrp_proto.setup,
-        mrp_proto.scan,
-        mrp_proto.pair,
-        mrp_proto.device_info,
-        mrp_proto.service_info,
-    ),
-    Protocol.RAOP: ProtocolMethods(
-        raop_proto.setup,
-        raop_proto.scan,
-        raop_proto.pair,
-        raop_proto.device_info,
-        raop_proto.service_info,
-    ),
-}
+class ProtocolRegistry(MutableMapping[Protocol, ProtocolMethods]):
+    """Mapping of protocol to its implementation.
+
+    Protocol packages are imported the first time they are looked up, so that
+    importing pyatv does not import all protocols (with dependencies).
+    """
+
+    def __init__(self, modules: Mapping[Protocol, str]) -> None:
+        """Initialize a new ProtocolRegistry instance."""
+        self._protocols: Dict[Protocol, Union[str, ProtocolMethods]] = dict(modules)
+
+    def __getitem__(self, protocol: Protocol) -> ProtocolMethods:
+        """Return implementation of a protocol, importing it if needed."""
+        methods = self._protocols[protocol]
+        if isinstance(methods, str):
+            module = import_module(methods)
+            methods = ProtocolMethods(
+                module.setup,
+                module.scan,
+                module.pair,
+                module.device_info,
+                module.service_info,
+            )
+            self._protocols[protocol] = methods
+        return methods
+
+    def __setitem__(self, protocol: Protocol, methods: ProtocolMethods) -> None:
+        """Set implementation of a protocol."""
+        self._protocols[protocol] = methods
+
+    def __delitem__(self, protocol: Protocol) -> None:
+        """Remove a protocol."""
+        del self._protocols[protocol]
+
+    def __iter__(self) -> Iterator[Protocol]:
+        """Return iterator over all protocols."""
+        return iter(self._protocols)
+
+    def __len__(self) -> int:
+        """Return number of protocols."""
+        return len(self._protocols)
+
+
+PROTOCOLS = ProtocolRegistry(
+    {
+        Protocol.AirPlay: "pyatv.protocols.airplay",
+        Protocol.Companion: "pyatv.protocols.companion",
+        Protocol.DMAP: "pyatv.protocols.dmap",
+        Protocol.MRP: "pyatv.protocols.mrp",
+        Protocol.RAOP: "pyatv.protocols.raop",
+    }
+)
@@ -49,7 +49,8 @@ from pyatv.protocols.raop.protocols import (
 from pyatv.settings import MrpTunnel
 from pyatv.support import net
 from pyatv.support.device_info import lookup_model, lookup_os
-from pyatv.support.http import HttpConnection, StaticFileWebServer, http_connect
+from pyatv.support.http import HttpConnection
+from pyatv.support.media_server import MediaServer, get_media_server
 from pyatv.support.rtsp import RtspSession
 
 _LOGGER = logging.getLogger(__name__)
@@ -92,6 +93,7 @@ class AirPlayStream(Stream):  # pylint: disable=too-few-public-methods
         """Close and free resources."""
         if self._connection is not None:
             self._connection.close()
+            self.core.session_manager.http_pool.release(self._connection)
             self._connection = None
         if self._play_task is not None:
             _LOGGER.debug("Stopping AirPlay play task")
@@ -113,21 +115,23 @@ class AirPlayStream(Stream):  # pylint: disable=too-few-public-methods
         if not self.service:
             raise exceptions.NotSupportedError("AirPlay service is not available")
 
-        server: Optional[StaticFileWebServer] = None
+        server: Optional[MediaServer] = None
+        path = url
 
-        if os.path.exists(url):
-            _LOGGER.debug("URL %s is a local file, setting up web server", url)
+        if os.path.exists(path):
+            _LOGGER.debug("URL %s is a local file, publishing with media server", url)
             server_address = net.get_local_address_reaching(self.config.address)
-            server = StaticFileWebServer(url, str(server_address))
-            await server.start()
-            url = server.file_address
+            server = get_media_server(str(server_address))
+            url = await server.add_file(path)
 
         takeover_release = self.core.takeover(RemoteControl)
         try:
             # Set up a new connection and wrap it with an AirPlay stream of
             # correct protocol version
-            self._connection = await http_connect(
-                str(self.config.address), self.service.port
+            self._connection = await self.core.session_manager.http_pool.acquire(
+                str(self.config.address),
+                self.service.port,
+                context=self.service.credentials,
             )
             rtsp = RtspSession(self._connection)
             stream_protocol = self.create_airplay_protocol(self.service, rtsp)
@@ -139,10 +143,10 @@ class AirPlayStream(Stream):  # pylint: disable=too-few-public-methods
             takeover_release()
             self._play_task = None
             if self._connection:
-                self._connection.close()
+                self.core.session_manager.http_pool.release(self._connection)
                 self._connection = None
             if server:
-                await server.close()
+                await server.remove_file(path)
 
     # Should be included in a "common" module with shared AirPlay code
     def create_airplay_protocol(
@@ -243,14 +247,7 @@ def _create_mrp_tunnel_data(core: Core, credentials: HapCredentials):
         mrp_service = MutableService(None, Protocol.MRP, core.service.port, {})
         core.config.add_service(mrp_service)
 
-    (
-        _,
-        mrp_connect,
-        mrp_close,
-        mrp_device_info,
-        mrp_interfaces,
-        mrp_features,
-    ) = mrp.create_with_connection(
+    mrp_setup_data = mrp.create_with_connection(
         Core(
             core.loop,
             core.config,
@@ -260,6 +257,7 @@ def _create_mrp_tunnel_data(core: Core, credentials: HapCredentials):
             core.session_manager,
             core.takeover,
             core.state_dispatcher.create_copy(Protocol.MRP),
+            core.artwork_cache,
         ),
         AirPlayMrpConnection(session, core.device_listener),
         requires_heatbeat=False,  # Already have heartbeat on control channel
@@ -281,12 +279,12 @@ def _create_mrp_tunnel_data(core: Core, credentials: HapCredentials):
                 "Failed to set up remote control channel"
             ) from ex
 
-        await mrp_connect()
+        await mrp_setup_data.connect()
         return True
 
     def _close_rc() -> Set[asyncio.Task]:
         tasks = set()
-        tasks.update(mrp_close())
+        tasks.update(mrp_setup_data.close())
         tasks.update(session.stop())
         return tasks
 
@@ -294,9 +292,10 @@ def _create_mrp_tunnel_data(core: Core, credentials: HapCredentials):
         Protocol.MRP,
         _connect_rc,
         _close_rc,
-        mrp_device_info,
-        mrp_interfaces,
-        mrp_features,
+        mrp_setup_data.device_info,
+        mrp_setup_data.interfaces,
+        mrp_setup_data.features,
+        depends_on=frozenset([Protocol.AirPlay]),
     )
 
 
@@ -367,6 +366,7 @@ def setup(  # pylint: disable=too-many-locals
             core.session_manager,
             core.takeover,
             core.state_dispatcher.create_copy(Protocol.RAOP),
+            core.artwork_cache,
         )
 
         yield from raop_setup(raop_core)
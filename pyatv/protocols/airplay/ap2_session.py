@@ -14,7 +14,7 @@ from uuid import uuid4
 from pyatv import exceptions
 from pyatv.auth.hap_channel import setup_channel
 from pyatv.auth.hap_pairing import HapCredentials, PairVerifyProcedure
-from pyatv.core.protocol import heartbeater
+from pyatv.core.protocol import Heartbeat, get_heartbeat_scheduler
 from pyatv.interface import DeviceListener
 from pyatv.protocols.airplay.auth import verify_connection
 from pyatv.protocols.airplay.channels import DataStreamChannel, EventChannel
@@ -57,7 +57,7 @@ class AP2Session:
         self.rtsp: Optional[RtspSession] = None
         self.data_channel: Optional[DataStreamChannel] = None
         self._channels: List[asyncio.BaseTransport] = []
-        self._feedback_task: Optional[asyncio.Task] = None
+        self._keep_alive: Optional[Heartbeat] = None
 
     async def connect(self) -> None:
         """Open connection to receiver."""
@@ -97,14 +97,12 @@ class AP2Session:
         # Lambdas as needed here as accessing a method in the device listener will
         # cause the device listener to handle that as a connection error happened
         # and tear everything down. This is by design.
-        self._feedback_task = asyncio.ensure_future(
-            heartbeater(
-                name=f"AirPlay:{self._address}",
-                sender_func=_send_feedback,
-                finish_func=_finish_func,
-                failure_func=_failure_func,
-                interval=FEEDBACK_INTERVAL,
-            )
+        self._keep_alive = get_heartbeat_scheduler().schedule(
+            name=f"AirPlay:{self._address}",
+            sender_func=_send_feedback,
+            finish_func=_finish_func,
+            failure_func=_failure_func,
+            interval=FEEDBACK_INTERVAL,
         )
 
     async def _setup(self, body: Dict[str, Any]) -> Dict[str, Any]:
@@ -189,10 +187,11 @@ class AP2Session:
     def stop(self) -> Set[asyncio.Task]:
         """Close all open connections."""
         tasks = set()
-        if self._feedback_task:
-            self._feedback_task.cancel()
-            tasks.add(self._feedback_task)
-            self._feedback_task = None
+        if self._keep_alive:
+            feedback_task = self._keep_alive.cancel()
+            if feedback_task:
+                tasks.add(feedback_task)
+            self._keep_alive = None
         if self.connection:
             self.connection.close()
             self.connection = None
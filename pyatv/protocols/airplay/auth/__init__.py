@@ -37,6 +37,9 @@ CONTROL_SALT = "Control-Salt"
 CONTROL_OUTPUT_INFO = "Control-Write-Encryption-Key"
 CONTROL_INPUT_INFO = "Control-Read-Encryption-Key"
 
+# Key in HttpConnection.session_data for the procedure used to verify a connection
+_PAIR_VERIFIER = "pair_verifier"
+
 
 class NullPairVerifyProcedure(PairVerifyProcedure):
     """Null implementation for Pair-Verify when no verification is needed."""
@@ -66,9 +69,8 @@ def pair_setup(
         legacy_srp.initialize()
         return AirPlayLegacyPairSetupProcedure(connection, legacy_srp)
     if auth_type == AuthenticationType.HAP:
-        srp = SRPAuthHandler()
-        srp.initialize()
-        return AirPlayHapPairSetupProcedure(connection, srp)
+        # Keys are generated by the procedure when pairing starts
+        return AirPlayHapPairSetupProcedure(connection, SRPAuthHandler())
 
     raise exceptions.NotSupportedError(
         f"authentication type {auth_type} does not support Pair-Setup"
@@ -90,8 +92,8 @@ def pair_verify(
         legacy_srp.initialize()
         return AirPlayLegacyPairVerifyProcedure(connection, legacy_srp)
 
+    # Keys are generated by the procedure when verification starts
     srp = SRPAuthHandler()
-    srp.initialize()
     if credentials.type == AuthenticationType.HAP:
         return AirPlayHapPairVerifyProcedure(connection, srp, credentials)
     return AirPlayHapTransientPairVerifyProcedure(connection, srp)
@@ -100,9 +102,18 @@ def pair_verify(
 async def verify_connection(
     credentials: HapCredentials, connection: HttpConnection
 ) -> PairVerifyProcedure:
-    """Perform Pair-Verify on a connection and enable encryption."""
+    """Perform Pair-Verify on a connection and enable encryption.
+
+    A connection that has already been verified (e.g. reused from a connection pool)
+    is not verified again.
+    """
+    verifier = connection.session_data.get(_PAIR_VERIFIER)
+    if verifier is not None:
+        return verifier
+
     verifier = pair_verify(credentials, connection)
     has_encryption_keys = await verifier.verify_credentials()
+    connection.session_data[_PAIR_VERIFIER] = verifier
 
     if has_encryption_keys:
         output_key, input_key = verifier.encryption_keys(
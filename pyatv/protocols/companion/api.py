@@ -5,7 +5,7 @@ from enum import Enum
 import logging
 from random import randint
 import time
-from typing import Any, Dict, List, Mapping, Optional, cast
+from typing import Any, Dict, Hashable, List, Mapping, Optional, cast
 
 from pyatv import exceptions
 from pyatv.auth.hap_pairing import parse_credentials
@@ -244,7 +244,12 @@ class CompanionAPI(
         )
         _LOGGER.debug("Stopped session with SID 0x%X", self.sid)
 
-    async def _send_event(self, identifier: str, content: Mapping[str, Any]) -> None:
+    async def _send_event(
+        self,
+        identifier: str,
+        content: Mapping[str, Any],
+        coalesce_key: Optional[Hashable] = None,
+    ) -> None:
         """Subscribe to updates to an event."""
         await self.connect()
         if self._protocol is None:
@@ -258,6 +263,7 @@ class CompanionAPI(
                     "_t": MessageType.Event.value,
                     "_c": content,
                 },
+                coalesce_key,
             )
         except exceptions.ProtocolError:
             raise
@@ -323,6 +329,8 @@ class CompanionAPI(
                 "_tPh": mode.value,
                 "_cy": y,
             },
+            # Only the latest position matters while moving
+            coalesce_key="_hidT" if mode == TouchAction.Hold else None,
         )
 
     async def swipe(
@@ -2,13 +2,13 @@
 
 from abc import ABC
 import asyncio
-from collections import deque
 from enum import Enum
 import logging
-from typing import Optional
+from typing import Hashable, Optional, Tuple
 
 from pyatv import exceptions
 from pyatv.support import chacha20, log_binary
+from pyatv.support.send_queue import SendQueue
 from pyatv.support.state_producer import StateProducer
 
 _LOGGER = logging.getLogger(__name__)
@@ -69,7 +69,9 @@ class CompanionConnection(asyncio.Protocol):
         self.transport = None
         self._buffer: bytes = b""
         self._chacha: Optional[chacha20.Chacha20Cipher] = None
-        self._queue: deque = deque()
+        self.send_queue: SendQueue[Tuple[FrameType, bytes]] = SendQueue(
+            loop, self._encode
+        )
 
     @property
     def connected(self) -> bool:
@@ -84,22 +86,39 @@ class CompanionConnection(asyncio.Protocol):
         """Close connection to device."""
         _LOGGER.debug("Closing connection")
         if self.transport:
+            self.send_queue.flush(force=True)
             self.transport.close()
             self.transport = None
+        self.send_queue.detach()
 
     def enable_encryption(self, output_key: bytes, input_key: bytes) -> None:
         """Enable encryption with the specified keys."""
+        # Frames queued before this point must not be encrypted
+        self.send_queue.flush(force=True)
         self._chacha = chacha20.Chacha20Cipher(output_key, input_key, nonce_length=12)
 
     def set_listener(self, listener: CompanionConnectionListener) -> None:
         """Set the CompanionConnectionListener in a way that doesn't break pylint."""
         self._listener = listener
 
-    def send(self, frame_type: FrameType, data: bytes) -> None:
-        """Send message without waiting for a response."""
+    def send(
+        self,
+        frame_type: FrameType,
+        data: bytes,
+        coalesce_key: Optional[Hashable] = None,
+    ) -> None:
+        """Send message without waiting for a response.
+
+        If `coalesce_key` is given, a frame queued with the same key that has not yet
+        been written is replaced by this one.
+        """
         if self.transport is None:
             raise exceptions.InvalidStateError("not connected")
 
+        self.send_queue.put((frame_type, data), coalesce_key)
+
+    def _encode(self, frame: Tuple[FrameType, bytes]) -> bytes:
+        frame_type, data = frame
         payload_length = len(data)
         if self._chacha and payload_length > 0:
             payload_length += AUTH_TAG_LENGTH
@@ -116,12 +135,23 @@ class CompanionConnection(asyncio.Protocol):
             data = self._chacha.encrypt(data, aad=header)
             log_binary(_LOGGER, ">> Send", Header=header, Encrypted=data)
 
-        self.transport.write(header + data)
+        return header + data
+
+    def pause_writing(self) -> None:
+        """Transport buffer is full, stop writing."""
+        _LOGGER.debug("Pause writing (%s)", self.send_queue)
+        self.send_queue.pause()
+
+    def resume_writing(self) -> None:
+        """Transport buffer has drained, resume writing."""
+        _LOGGER.debug("Resume writing (%s)", self.send_queue)
+        self.send_queue.resume()
 
     def connection_made(self, transport):
         """Handle that connection was eatablished."""
         _LOGGER.debug("Connected to companion device %s:%d", self.host, self.port)
         self.transport = transport
+        self.send_queue.attach(transport)
 
     def data_received(self, data):
         """Handle data received from companion."""
@@ -161,6 +191,7 @@ class CompanionConnection(asyncio.Protocol):
         """Handle that connection was lost from companion."""
         _LOGGER.debug("Connection lost to remote device: %s", exc)
         self.transport = None
+        self.send_queue.detach()
         if self._device_listener is not None:
             if exc:
                 self._device_listener.listener.connection_lost(exc)
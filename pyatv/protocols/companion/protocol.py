@@ -4,7 +4,7 @@ from abc import ABC
 from enum import Enum
 import logging
 from random import randint
-from typing import Any, Dict, Union
+from typing import Any, Dict, Hashable, Optional, Union
 
 from pyatv import exceptions
 from pyatv.auth.hap_pairing import parse_credentials
@@ -175,15 +175,23 @@ class CompanionProtocol(
 
         return unpacked_object
 
-    def send_opack(self, frame_type: FrameType, data: Dict[str, Any]) -> None:
-        """Send data encoded with OPACK."""
+    def send_opack(
+        self,
+        frame_type: FrameType,
+        data: Dict[str, Any],
+        coalesce_key: Optional[Hashable] = None,
+    ) -> None:
+        """Send data encoded with OPACK.
+
+        See `CompanionConnection.send` for `coalesce_key`.
+        """
         # Add XID if not present
         if "_x" not in data:
             data["_x"] = self._xid
             self._xid += 1
 
         _LOGGER.debug("Send OPACK: %s", data)
-        self.connection.send(frame_type, opack.pack(data))
+        self.connection.send(frame_type, opack.pack(data), coalesce_key)
 
     def frame_received(self, frame_type: FrameType, data: bytes) -> None:
         """Frame was received from remote device."""
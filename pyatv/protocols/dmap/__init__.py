@@ -5,8 +5,6 @@ import logging
 from typing import Any, Dict, Generator, List, Mapping, Optional, Set, Tuple
 import weakref
 
-from aiohttp.client_exceptions import ClientError
-
 from pyatv import exceptions
 from pyatv.const import (
     DeviceModel,
@@ -48,9 +46,13 @@ from pyatv.interface import (
 from pyatv.protocols.dmap import daap, parser, tags
 from pyatv.protocols.dmap.daap import DaapRequester
 from pyatv.protocols.dmap.pairing import DmapPairingHandler
-from pyatv.support.cache import Cache
+from pyatv.protocols.dmap.updates import (
+    MIN_LONG_POLL_TIME,
+    PollStats,
+    get_update_scheduler,
+)
+from pyatv.support.artwork_cache import ArtworkCache
 from pyatv.support.collections import dict_merge
-from pyatv.support.http import HttpSession
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -205,12 +207,12 @@ class BaseDmapAppleTV:
         """Request raw data about what is currently playing.
 
         If use_revision=True, this command will "block" until playstatus
-        changes on the device.
+        changes on the device. Such requests are made on a separate connection.
 
         Must be logged in.
         """
         cmd_url = _PSU_CMD.format(self.playstatus_revision if use_revision else 0)
-        resp = await self.daap.get(cmd_url, timeout=timeout)
+        resp = await self.daap.get(cmd_url, timeout=timeout, long_poll=use_revision)
         self.playstatus_revision = parser.first(resp, "cmst", "cmsr")
         self.latest_playstatus = resp
         self.latest_playing = build_playing_instance(resp)
@@ -395,11 +397,13 @@ class DmapRemoteControl(RemoteControl):
 class DmapMetadata(Metadata):
     """Implementation of API for retrieving metadata from an Apple TV."""
 
-    def __init__(self, identifier, apple_tv):
+    def __init__(
+        self, identifier, apple_tv, artwork_cache: Optional[ArtworkCache] = None
+    ):
         """Initialize metadata instance."""
         self.identifier = identifier
         self.apple_tv = apple_tv
-        self.artwork_cache = Cache(limit=4)
+        self.artwork_cache = ArtworkCache() if artwork_cache is None else artwork_cache
 
     @property
     def device_id(self) -> Optional[str]:
@@ -422,15 +426,16 @@ class DmapMetadata(Metadata):
         # this until a better solution comes along.
         playing = await self.playing()
         identifier = playing.hash
-        if identifier in self.artwork_cache:
+        info = await self.artwork_cache.get(identifier, width, height)
+        if info:
             _LOGGER.debug("Retrieved artwork %s from cache", identifier)
-            return self.artwork_cache.get(identifier)
+            return info
 
         _LOGGER.debug("Fetching artwork")
         artwork = await self.apple_tv.artwork(width, height)
         if artwork:
             info = ArtworkInfo(bytes=artwork, mimetype="image/png", width=-1, height=-1)
-            self.artwork_cache.put(identifier, info)
+            await self.artwork_cache.put(identifier, width, height, info)
             return info
 
         return None
@@ -446,10 +451,19 @@ class DmapMetadata(Metadata):
 
 
 class DmapPushUpdater(AbstractPushUpdater):
-    """Implementation of API for handling push update from an Apple TV."""
+    """Implementation of API for handling push update from an Apple TV.
+
+    Polls are paced by a scheduler shared with other devices: after an error, or if the
+    device answers without waiting for a change, the next poll is delayed with
+    exponential backoff. Responses with an unchanged revision are not posted.
+    """
 
     def __init__(
-        self, apple_tv, state_dispatcher: ProtocolStateDispatcher, listener
+        self,
+        apple_tv,
+        state_dispatcher: ProtocolStateDispatcher,
+        listener,
+        name: str = "dmap",
     ) -> None:
         """Initialize a new DmapPushUpdater instance."""
         super().__init__(state_dispatcher)
@@ -457,6 +471,8 @@ class DmapPushUpdater(AbstractPushUpdater):
         self._listener = weakref.ref(listener)
         self._future = None
         self._initial_delay = 0
+        self._name = name
+        self.stats = PollStats()
 
     @property
     def active(self):
@@ -477,9 +493,10 @@ class DmapPushUpdater(AbstractPushUpdater):
         # first request
         self._atv.playstatus_revision = 0
 
-        # Delay before restarting after an error
+        # Minimum delay before restarting after an error
         self._initial_delay = initial_delay
 
+        self.stats = get_update_scheduler().register(self._name)
         self._future = asyncio.ensure_future(self._poller())
 
     def stop(self):
@@ -487,26 +504,41 @@ class DmapPushUpdater(AbstractPushUpdater):
         if self._future is not None:
             self._future.cancel()
             self._future = None
+            get_update_scheduler().unregister(self._name)
 
     async def _poller(self):
-        first_call = True
+        scheduler = get_update_scheduler()
+        loop = asyncio.get_running_loop()
+        failures = 0
 
         while True:
             try:
-                # Sleep some time before waiting for updates
-                if not first_call and self._initial_delay > 0:
-                    _LOGGER.debug("Initial delay set to %d", self._initial_delay)
-                    await asyncio.sleep(self._initial_delay)
-                    first_call = False
+                if failures > 0:
+                    await scheduler.wait(
+                        max(self._initial_delay, scheduler.backoff(failures))
+                    )
 
                 _LOGGER.debug("Waiting for playstatus updates")
+                revision = self._atv.playstatus_revision
+                start_time = loop.time()
                 playstatus = await self._atv.playstatus(use_revision=True, timeout=0)
-
+                latency = loop.time() - start_time
+                self.stats.record(latency)
+
+                if revision != 0 and self._atv.playstatus_revision == revision:
+                    # Nothing changed, so nothing to post. Back off in case device did
+                    # not wait for a change, otherwise this would be a tight loop.
+                    self.stats.suppressed += 1
+                    failures = failures + 1 if latency < MIN_LONG_POLL_TIME else 0
+                    continue
+
+                failures = 0
+                self.stats.updates += 1
                 self.post_update(playstatus)
             except asyncio.CancelledError:
                 break
 
-            except ClientError as ex:
+            except (exceptions.ConnectionLostError, ConnectionError) as ex:
                 _LOGGER.exception("A communication error happened")
                 listener = self._listener()
                 if listener:
@@ -518,6 +550,8 @@ class DmapPushUpdater(AbstractPushUpdater):
             # exceptions to keep the API.
             except Exception as ex:  # pylint: disable=broad-except
                 _LOGGER.debug("Playstatus error occurred: %s", ex)
+                failures += 1
+                self.stats.errors += 1
                 self._atv.playstatus_revision = 0
                 self.loop.call_soon(self.listener.playstatus_error, self, ex)
 
@@ -661,16 +695,20 @@ def setup(  # pylint: disable=too-many-locals
     core: Core,
 ) -> Generator[SetupData, None, None]:
     """Set up a new DMAP service."""
-    daap_http = HttpSession(
-        core.session_manager.session,
-        f"http://{core.config.address}:{core.service.port}/",
+    requester = DaapRequester(
+        core.session_manager.http_pool,
+        str(core.config.address),
+        core.service.port,
+        core.service.credentials,
     )
-    requester = DaapRequester(daap_http, core.service.credentials)
     apple_tv = BaseDmapAppleTV(requester)
     push_updater = DmapPushUpdater(
-        apple_tv, core.state_dispatcher, core.device_listener
+        apple_tv,
+        core.state_dispatcher,
+        core.device_listener,
+        name=str(core.config.address),
     )
-    metadata = DmapMetadata(core.config.identifier, apple_tv)
+    metadata = DmapMetadata(core.config.identifier, apple_tv, core.artwork_cache)
     audio = DmapAudio(apple_tv)
 
     interfaces = {
@@ -690,6 +728,7 @@ def setup(  # pylint: disable=too-many-locals
 
     def _close() -> Set[asyncio.Task]:
         push_updater.stop()
+        requester.close()
         core.device_listener.listener.connection_closed()
         return set()
 
@@ -1,14 +1,17 @@
 """Methods used to GET/POST data from/to an Apple TV."""
 
+import asyncio
 from copy import copy
+import gzip
 import logging
 import re
-from typing import Optional
+from typing import Mapping, Optional, Tuple, cast
 
 from pyatv import exceptions
 from pyatv.const import DeviceState, MediaType
 from pyatv.protocols.dmap import parser
 from pyatv.support import log_binary
+from pyatv.support.http import HttpConnection, HttpConnectionPool
 
 from .tag_definitions import lookup_tag
 
@@ -27,6 +30,10 @@ _DMAP_HEADERS = {
 
 DEFAULT_TIMEOUT = 10.0  # Seconds
 
+# A session that has not been used for this long is renewed before the next request
+# instead of waiting for the device to reject it (sessions expire after 30 minutes)
+SESSION_RENEW_INTERVAL = 25 * 60.0  # Seconds
+
 
 def media_kind(kind):
     """Convert iTunes media kind to API representation."""
@@ -72,47 +79,162 @@ def ms_to_s(time):
     return round(time / 1000.0)
 
 
+class DaapChannel:
+    """Keep-alive connection to a device used for one kind of requests.
+
+    The connection is taken from a connection pool and kept until it is closed (by
+    either side), then a new connection is acquired for the next request. Requests
+    made concurrently are pipelined on the same connection.
+    """
+
+    def __init__(
+        self, http_pool: HttpConnectionPool, address: str, port: int, name: str
+    ) -> None:
+        """Initialize a new DaapChannel instance."""
+        self._http_pool = http_pool
+        self._address = address
+        self._port = port
+        self._name = name
+        self._connection: Optional[HttpConnection] = None
+        self._connect_lock = asyncio.Lock()
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        headers: Mapping[str, str],
+        body: Optional[bytes] = None,
+        timeout: Optional[float] = None,
+    ) -> Tuple[bytes, int]:
+        """Perform a request and return response body and status code.
+
+        A timeout of None means DEFAULT_TIMEOUT and zero means no timeout at all.
+        """
+        connection = await self._acquire()
+        try:
+            resp = await connection.send_and_receive(
+                method,
+                "/" + path,
+                headers={"Host": f"{self._address}:{self._port}", **headers},
+                body=body,
+                allow_error=True,
+                timeout=DEFAULT_TIMEOUT if timeout is None else (timeout or None),
+            )
+        except exceptions.AuthenticationError:
+            # Raised for 403 regardless of allow_error, which DAAP responds with when
+            # session has expired
+            return b"", 403
+        except BaseException:
+            # Responses to pipelined requests can not be matched after a failure (e.g.
+            # a timeout), so start over with a new connection
+            self._discard(connection)
+            raise
+
+        # Received bodies are str (if decodable as UTF-8) or bytes
+        content = resp.body
+        if isinstance(content, str):
+            data = content.encode("utf-8")
+        else:
+            data = cast(bytes, content)
+        if resp.headers.get("Content-Encoding", "").lower() == "gzip":
+            data = gzip.decompress(data)
+        return data, resp.code
+
+    def close(self) -> None:
+        """Close connection and give it back to the pool."""
+        if self._connection is not None:
+            self._discard(self._connection)
+
+    def _discard(self, connection: HttpConnection) -> None:
+        if connection is self._connection:
+            self._connection = None
+            connection.close()
+            self._http_pool.release(connection)
+
+    async def _acquire(self) -> HttpConnection:
+        async with self._connect_lock:
+            if self._connection is not None and not self._connection.usable:
+                self._discard(self._connection)
+            if self._connection is None:
+                _LOGGER.debug("Opening %s connection to %s", self._name, self._address)
+                self._connection = await self._http_pool.acquire(
+                    self._address, self._port, context=("daap", self._name)
+                )
+            return self._connection
+
+
 class DaapRequester:
     """Helper class that makes it easy to perform DAAP requests.
 
-    It will automatically do login and other necessary book-keeping.
+    It will automatically do login and other necessary book-keeping. Long-poll
+    requests (waiting for a new playstatus revision) are made on a dedicated
+    connection, so that commands are not queued behind them. Commands are pipelined
+    on a separate connection.
     """
 
-    def __init__(self, http, login_id):
+    def __init__(
+        self,
+        http_pool: HttpConnectionPool,
+        address: str,
+        port: int,
+        login_id: Optional[str],
+    ) -> None:
         """Initialize a new DaapRequester."""
-        self.http = http
         self._login_id = login_id
         self._session_id = 0
+        self._session_used = 0.0
+        self._long_polls = 0
+        self._login_lock = asyncio.Lock()
+        self._commands = DaapChannel(http_pool, address, port, "command")
+        self._long_poll = DaapChannel(http_pool, address, port, "long-poll")
+
+    def close(self) -> None:
+        """Close all connections."""
+        self._commands.close()
+        self._long_poll.close()
 
     async def login(self):
         """Login to Apple TV using specified login id."""
+        async with self._login_lock:
+            return await self._login()
 
-        # Do not use session.get_data(...) in login as that would end up in
-        # an infinite loop.
+    async def _login(self):
+        # Do not use get(...) in login as that would end up in an infinite loop
         def _login_request():
             url = self._mkurl("login?[AUTH]&hasFP=1", session=False, login_id=True)
             _login_request.log_text = "Login request: " + url
-            return self.http.get_data(
-                url,
-                headers=_DMAP_HEADERS,
-            )
+            return self._commands.request("GET", url, headers=_DMAP_HEADERS)
 
         resp = await self._do(_login_request, is_login=True)
         self._session_id = parser.first(resp, "mlog", "mlid")
+        self._session_used = asyncio.get_running_loop().time()
 
         _LOGGER.info("Logged in and got session id %s", self._session_id)
         return self._session_id
 
-    async def get(self, cmd, daap_data=True, timeout=None, **args):
-        """Perform a DAAP GET command."""
+    async def get(self, cmd, daap_data=True, timeout=None, long_poll=False, **args):
+        """Perform a DAAP GET command.
+
+        Set long_poll to True for requests blocking until something changes on the
+        device, which makes them use a dedicated connection.
+        """
+        channel = self._long_poll if long_poll else self._commands
 
         def _get_request():
             url = self._mkurl(cmd, *args)
             _get_request.log_text = "GET request: " + url
-            return self.http.get_data(url, headers=_DMAP_HEADERS, timeout=timeout)
+            return channel.request("GET", url, headers=_DMAP_HEADERS, timeout=timeout)
 
         await self._assure_logged_in()
-        return await self._do(_get_request, is_daap=daap_data)
+        if not long_poll:
+            return await self._do(_get_request, is_daap=daap_data)
+
+        # Session is kept alive by the long poll, so don't renew it while waiting
+        self._long_polls += 1
+        try:
+            return await self._do(_get_request, is_daap=daap_data)
+        finally:
+            self._long_polls -= 1
 
     async def post(self, cmd, data=None, timeout=None, **args):
         """Perform DAAP POST command with optional data."""
@@ -122,18 +244,22 @@ class DaapRequester:
             _post_request.log_text = "POST request: " + url
             headers = copy(_DMAP_HEADERS)
             headers["Content-Type"] = "application/x-www-form-urlencoded"
-            return self.http.post_data(url, data=data, headers=headers, timeout=timeout)
+            return self._commands.request(
+                "POST", url, headers=headers, body=data, timeout=timeout
+            )
 
         await self._assure_logged_in()
         return await self._do(_post_request)
 
     async def _do(self, action, retry=True, is_login=False, is_daap=True):
+        session_id = self._session_id
         resp, status = await action()
         if is_daap:
             resp = parser.parse(resp, lookup_tag)
 
         self._log_response(action.log_text, resp, is_daap)
         if 200 <= status < 300:
+            self._session_used = asyncio.get_running_loop().time()
             return resp
 
         # Seems to be the case?
@@ -141,9 +267,9 @@ class DaapRequester:
             raise exceptions.NotSupportedError("command not supported at this stage")
 
         if not is_login:
-            # If a request fails, try to login again before retrying
-            _LOGGER.info("implicitly logged out, logging in again")
-            await self.login()
+            # If a request fails, try to login again before retrying (unless someone
+            # else already did that)
+            await self._renew_session(session_id)
 
         # Retry once if we got a bad response, otherwise bail out
         if retry:
@@ -170,10 +296,20 @@ class DaapRequester:
         return url.replace("[AUTH]", "&".join(parameters))
 
     async def _assure_logged_in(self):
-        if self._session_id != 0:
-            _LOGGER.debug("Already logged in, reusing seasion id %d", self._session_id)
+        idle_time = asyncio.get_running_loop().time() - self._session_used
+        if self._session_id == 0:
+            await self._renew_session(0)
+        elif idle_time > SESSION_RENEW_INTERVAL and self._long_polls == 0:
+            _LOGGER.debug("Session idle for %.0fs, renewing it", idle_time)
+            await self._renew_session(self._session_id)
         else:
-            await self.login()
+            _LOGGER.debug("Already logged in, reusing seasion id %d", self._session_id)
+
+    async def _renew_session(self, session_id: int) -> None:
+        async with self._login_lock:
+            if self._session_id == session_id:
+                _LOGGER.info("Logging in to get a new session")
+                await self._login()
 
     @staticmethod
     def _log_response(text, data, is_daap):
@@ -6,13 +6,20 @@ a four byte big endian unsigned int as length and the data as data. So:
   +---------------+------------------+--------------------+
   | Key (4 bytes) | Length (4 bytes) | Data (Length bytes |
   +---------------+------------------+--------------------+
+
+Parsed data is represented as a list of single key dicts, where the value of a
+container is another such list. Lists returned by the parser are instances of
+`DmapList`, which lazily builds an index of all paths the first time `first` is
+called, so looking up many values in the same response is cheap.
 """
 
 from collections import namedtuple
+import struct
+from typing import Any, Dict, List, Optional, Tuple
 
 from pyatv import exceptions
 
-from .tags import read_bplist, read_str, read_uint
+from .tags import read_bplist
 
 
 class DmapTag(namedtuple("DmapTag", ["type", "name"])):
@@ -29,28 +36,86 @@ class DmapTag(namedtuple("DmapTag", ["type", "name"])):
         return f"[{type_name}, {self.name}]"
 
 
-def _parse(data, data_len, tag_lookup, pos, ctx=None):
-    if ctx is None:
-        ctx = []
-    if pos >= data_len:
-        return ctx
+_HEADER = struct.Struct(">4sI")
 
-    f_name = read_str(data, pos, 4)
-    f_len = read_uint(data, pos + 4, 4)
-    pos += 8
+_MISSING = object()
 
-    tag = tag_lookup(f_name)
-    if tag.type == "container":
-        ctx.append({f_name: _parse(data, pos + f_len, tag_lookup, pos, ctx=[])})
-    else:
-        ctx.append({f_name: tag.type(data, pos, f_len)})
 
-    return _parse(data, data_len, tag_lookup, pos + f_len, ctx)
+class DmapList(list):
+    """List of parsed DMAP tags with a lazily built path index."""
+
+    __slots__ = ("_index",)
+
+    def __init__(self, *args) -> None:
+        """Initialize a new DmapList instance."""
+        super().__init__(*args)
+        self._index: Optional[Dict[Tuple[str, ...], Any]] = None
+
+    @property
+    def paths(self) -> Dict[Tuple[str, ...], Any]:
+        """Return value of first tag for every path (built on first access).
+
+        Like `first`, only the first occurrence of a container is descended into.
+        """
+        if self._index is None:
+            self._index = _index_paths(self)
+        return self._index
+
+
+def _index_paths(dmap_data: list) -> Dict[Tuple[str, ...], Any]:
+    index: Dict[Tuple[str, ...], Any] = {}
+    pending: List[Tuple[Tuple[str, ...], list]] = [((), dmap_data)]
+    while pending:
+        prefix, items = pending.pop()
+        for item in items:
+            for name, value in item.items():
+                path = prefix + (name,)
+                if path in index:
+                    continue
+                index[path] = value
+                if isinstance(value, list):
+                    pending.append((path, value))
+    return index
 
 
 def parse(data, tag_lookup):
     """Parse raw DAAP data and returns it as a python object."""
-    return _parse(data, len(data), tag_lookup, 0, [])
+    view = memoryview(data)
+    result = DmapList()
+
+    # Parsing is iterative: when entering a container, the list being filled and
+    # where it ends are saved and restored when reaching end of the container
+    containers: List[Tuple[DmapList, int]] = []
+    tags: Dict[bytes, Any] = {}
+    current, end, pos = result, len(view), 0
+    while True:
+        if pos >= end:
+            if not containers:
+                return result
+            current, end = containers.pop()
+            continue
+
+        try:
+            raw_name, length = _HEADER.unpack_from(view, pos)
+        except struct.error as ex:
+            raise exceptions.InvalidDmapDataError(
+                f"truncated dmap data at {pos}"
+            ) from ex
+        pos += 8
+
+        if raw_name not in tags:
+            name = raw_name.decode("utf-8")
+            tags[raw_name] = (name, tag_lookup(name))
+        name, dmap_tag = tags[raw_name]
+
+        if dmap_tag.type == "container":
+            container = DmapList()
+            current.append({name: container})
+            containers.append((current, end))
+            current, end = container, pos + length
+        else:
+            current.append({name: dmap_tag.type(view, pos, length)})
+            pos += length
 
 
 def first(dmap_data, *path):
@@ -58,6 +123,19 @@ def first(dmap_data, *path):
     if not (path and isinstance(dmap_data, list)):
         return dmap_data
 
+    if isinstance(dmap_data, DmapList):
+        index = dmap_data.paths
+        value = index.get(path, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        # Path might continue past a non-container value, which is then returned
+        for size in range(len(path) - 1, 0, -1):
+            value = index.get(path[:size], _MISSING)
+            if value is not _MISSING:
+                return None if isinstance(value, list) else value
+        return None
+
     for key in dmap_data:
         if path[0] in key:
             return first(key[path[0]], *path[1:])
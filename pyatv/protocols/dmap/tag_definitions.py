@@ -17,9 +17,11 @@ _LOGGER = logging.getLogger(__name__)
 
 # Internal version that works like read_ignore, but also logs
 def _read_unknown(data, start, length):
-    _LOGGER.warning("Unknown data: %s", str(data[start - 8 : start + length + 8]))
+    _LOGGER.warning("Unknown data: %s", bytes(data[start - 8 : start + length + 8]))
 
 
+_UNKNOWN_TAG = DmapTag(_read_unknown, "unknown tag")
+
 # These are the tags that we know about so far
 _TAGS = {
     "aelb": DmapTag(read_bool, "com.apple.itunes.like-button"),
@@ -126,7 +128,4 @@ _TAGS = {
 
 def lookup_tag(name):
     """Look up a tag based on its key. Returns a DmapTag."""
-    return next(
-        (tag for tag_name, tag in _TAGS.items() if tag_name == name),
-        DmapTag(_read_unknown, "unknown tag"),
-    )
+    return _TAGS.get(name, _UNKNOWN_TAG)
@@ -6,7 +6,7 @@ import plistlib
 
 def read_str(data, start, length):
     """Extract a string from a position in a sequence."""
-    return data[start : start + length].decode("utf-8")
+    return str(data[start : start + length], "utf-8")
 
 
 def read_uint(data, start, length):
@@ -0,0 +1,119 @@
+"""Scheduling of playstatus polls used for DMAP push updates.
+
+Push updates in DMAP are implemented by long polling: a playstatus request with the
+latest known revision blocks until something changes on the device. Polls that must be
+delayed, i.e. after an error or when a device answers without waiting for a change,
+are paced by a scheduler shared by all devices in the same event loop (see
+`get_update_scheduler`). Delays grow exponentially with jitter and polls are spread
+out, so that many devices failing at the same time (e.g. during a network hiccup) are
+not polled again in lockstep.
+"""
+
+import asyncio
+from dataclasses import dataclass
+import logging
+import random
+from typing import Dict, Mapping
+import weakref
+
+_LOGGER = logging.getLogger(__name__)
+
+# Maximum number of delayed polls per second (all devices)
+POLL_RATE = 20.0
+
+# Delay before first retry, doubled for each consecutive failure up to BACKOFF_MAX
+BACKOFF_INITIAL = 0.5  # Seconds
+BACKOFF_MAX = 60.0  # Seconds
+
+# A poll returning an unchanged revision quicker than this means that the device did
+# not wait for a change, so next poll is delayed
+MIN_LONG_POLL_TIME = 1.0  # Seconds
+
+# Weight of latest poll when calculating average latency
+LATENCY_WEIGHT = 0.2
+
+
+@dataclass
+class PollStats:
+    """Statistics for playstatus polls made to a device.
+
+    Latency is the time it took for a poll to finish, which for a long poll includes
+    waiting for something to change.
+    """
+
+    polls: int = 0
+    updates: int = 0
+    suppressed: int = 0
+    errors: int = 0
+    last_latency: float = 0.0
+    average_latency: float = 0.0
+
+    def record(self, latency: float) -> None:
+        """Record latency of a finished poll."""
+        if self.polls == 0:
+            self.average_latency = latency
+        else:
+            self.average_latency += LATENCY_WEIGHT * (latency - self.average_latency)
+        self.polls += 1
+        self.last_latency = latency
+
+
+class DmapUpdateScheduler:
+    """Pace delayed playstatus polls for all DMAP devices.
+
+    Each delayed poll is given a slot at least 1/`rate` seconds after the previous one
+    (across all devices), after waiting for a backoff delay.
+    """
+
+    def __init__(
+        self,
+        rate: float = POLL_RATE,
+        initial_backoff: float = BACKOFF_INITIAL,
+        max_backoff: float = BACKOFF_MAX,
+    ) -> None:
+        """Initialize a new DmapUpdateScheduler instance."""
+        self.rate = rate
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self._stats: Dict[str, PollStats] = {}
+        self._next_slot = 0.0
+
+    @property
+    def stats(self) -> Mapping[str, PollStats]:
+        """Return poll statistics for registered devices."""
+        return self._stats
+
+    def register(self, name: str) -> PollStats:
+        """Register a device and return its statistics."""
+        return self._stats.setdefault(name, PollStats())
+
+    def unregister(self, name: str) -> None:
+        """Remove statistics for a device."""
+        self._stats.pop(name, None)
+
+    def backoff(self, attempt: int) -> float:
+        """Return jittered delay before an attempt (counted from one)."""
+        delay = min(self.initial_backoff * 2 ** (attempt - 1), self.max_backoff)
+        return random.uniform(delay / 2, delay)
+
+    async def wait(self, delay: float) -> None:
+        """Wait for at least delay seconds and a free poll slot."""
+        now = asyncio.get_running_loop().time()
+        due = max(now + delay, self._next_slot)
+        self._next_slot = due + 1.0 / self.rate
+        _LOGGER.debug("Delaying poll for %.2fs", due - now)
+        await asyncio.sleep(due - now)
+
+
+_SCHEDULERS: (
+    "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, DmapUpdateScheduler]"
+) = weakref.WeakKeyDictionary()
+
+
+def get_update_scheduler() -> DmapUpdateScheduler:
+    """Return update scheduler shared by everything running in the current loop."""
+    loop = asyncio.get_running_loop()
+    scheduler = _SCHEDULERS.get(loop)
+    if scheduler is None:
+        scheduler = _SCHEDULERS[loop] = DmapUpdateScheduler()
+    return scheduler
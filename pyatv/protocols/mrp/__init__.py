@@ -6,7 +6,18 @@ import datetime
 import logging
 import math
 import re
-from typing import Any, Dict, Generator, List, Mapping, Optional, Set, Tuple, cast
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Generator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    cast,
+)
 
 from aiohttp import ClientError, ClientSession
 
@@ -58,15 +69,19 @@ from pyatv.interface import (
     PushUpdater,
     RemoteControl,
 )
-from pyatv.protocols.mrp import messages, protobuf
+from pyatv.protocols.mrp import messages, player_state, protobuf
 from pyatv.protocols.mrp.connection import AbstractMrpConnection, MrpConnection
 from pyatv.protocols.mrp.pairing import MrpPairingHandler
-from pyatv.protocols.mrp.player_state import PlayerState, PlayerStateManager
+from pyatv.protocols.mrp.player_state import (
+    PlayerState,
+    PlayerStateChange,
+    PlayerStateManager,
+)
 from pyatv.protocols.mrp.protobuf import CommandInfo_pb2
 from pyatv.protocols.mrp.protobuf import ContentItemMetadata as cim
 from pyatv.protocols.mrp.protobuf import PlaybackState
 from pyatv.protocols.mrp.protocol import MrpProtocol
-from pyatv.support.cache import Cache
+from pyatv.support.artwork_cache import ArtworkCache
 from pyatv.support.device_info import lookup_model, lookup_version
 from pyatv.support.url import is_url
 
@@ -146,6 +161,19 @@ _FIELD_FEATURES: Dict[FeatureName, str] = {
     FeatureName.iTunesStoreIdentifier: "iTunesStoreIdentifier",
 }
 
+# Changed fields (see PlayerStateChange) that build_playing_instance depends on
+_PLAYING_FIELDS: FrozenSet[str] = frozenset(
+    [
+        player_state.PLAYBACK_STATE,
+        player_state.SUPPORTED_COMMANDS,
+        player_state.CONTENT_ITEM,
+        "mediaType",
+        "elapsedTime",
+        "playbackRate",
+        *_FIELD_FEATURES.values(),
+    ]
+)
+
 DELAY_BETWEEN_COMMANDS = 0.1
 
 
@@ -324,6 +352,67 @@ async def _send_hid_key(
         raise exceptions.NotSupportedError(f"unsupported input action: {action}")
 
 
+def _verify_command_result(command, resp: protobuf.ProtocolMessage) -> None:
+    inner = protobuf.extract_inner(resp)
+
+    if inner.sendError == protobuf.SendError.NoError:
+        return
+
+    raise exceptions.CommandError(
+        f"{CommandInfo_pb2.Command.Name(command)} failed: "
+        f"SendError={protobuf.SendError.Enum.Name(inner.sendError)}, "
+        "HandlerReturnStatus="
+        f"{protobuf.HandlerReturnStatus.Enum.Name(inner.handlerReturnStatus)}"
+    )
+
+
+class CommandBatch:
+    """Sequence of key presses and commands sent to a device in one go.
+
+    Steps are added with `key` and `command` and then sent with
+    `MrpRemoteControl.send_batch`, e.g. for a macro like "home, down, select".
+    Holding a key is not supported as that requires waiting between key down and key
+    up.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a new CommandBatch instance."""
+        self.requests: List[Tuple[protobuf.ProtocolMessage, bool]] = []
+        self.commands: List[int] = []
+
+    def key(
+        self, key: str, action: InputAction = InputAction.SingleTap
+    ) -> "CommandBatch":
+        """Add a key press to the batch."""
+        keycode = _KEY_LOOKUP.get(key)
+        if not keycode:
+            raise exceptions.NotSupportedError(f"unsupported key: {key}")
+
+        if action == InputAction.SingleTap:
+            presses = 1
+        elif action == InputAction.DoubleTap:
+            presses = 2
+        else:
+            raise exceptions.NotSupportedError(
+                f"unsupported input action in batch: {action}"
+            )
+
+        for _ in range(presses):
+            self.requests.append(
+                (messages.send_hid_event(keycode[0], keycode[1], True), False)
+            )
+            self.requests.append(
+                (messages.send_hid_event(keycode[0], keycode[1], False), False)
+            )
+        return self
+
+    def command(self, command: int, **kwargs) -> "CommandBatch":
+        """Add a command to the batch."""
+        self.requests.append((messages.command(command, **kwargs), True))
+        self.commands.append(command)
+        return self
+
+
 # pylint: disable=too-many-public-methods
 class MrpRemoteControl(RemoteControl):
     """Implementation of API for controlling an Apple TV."""
@@ -341,17 +430,22 @@ class MrpRemoteControl(RemoteControl):
 
     async def _send_command(self, command, **kwargs):
         resp = await self.protocol.send_and_receive(messages.command(command, **kwargs))
-        inner = protobuf.extract_inner(resp)
+        _verify_command_result(command, resp)
 
-        if inner.sendError == protobuf.SendError.NoError:
-            return
+    async def send_batch(self, batch: CommandBatch) -> None:
+        """Send all key presses and commands in a batch.
 
-        raise exceptions.CommandError(
-            f"{CommandInfo_pb2.Command.Name(command)} failed: "
-            f"SendError={protobuf.SendError.Enum.Name(inner.sendError)}, "
-            "HandlerReturnStatus="
-            f"{protobuf.HandlerReturnStatus.Enum.Name(inner.handlerReturnStatus)}"
+        Everything is written to the device at once and responses are awaited
+        concurrently, so a batch completes in roughly one round trip no matter how
+        many steps it has.
+        """
+        # Send and receive a generic message as "flush", like for single key presses
+        flush = messages.create(protobuf.GENERIC_MESSAGE)
+        responses = await asyncio.gather(
+            *self.protocol.send_batch(batch.requests + [(flush, True)])
         )
+        for command, resp in zip(batch.commands, responses):
+            _verify_command_result(command, resp)
 
     async def up(self, action: InputAction = InputAction.SingleTap) -> None:
         """Press key up."""
@@ -488,13 +582,14 @@ class MrpMetadata(Metadata):
         psm: PlayerStateManager,
         identifier: Optional[str],
         client_session: ClientSession,
+        artwork_cache: Optional[ArtworkCache] = None,
     ):
         """Initialize a new MrpPlaying."""
         self.protocol = protocol
         self.psm = psm
         self.identifier = identifier
         self.client_session = client_session
-        self.artwork_cache = Cache(limit=4)
+        self.artwork_cache = ArtworkCache() if artwork_cache is None else artwork_cache
 
     @property
     def device_id(self) -> Optional[str]:
@@ -517,17 +612,18 @@ class MrpMetadata(Metadata):
             _LOGGER.debug("No artwork available")
             return None
 
-        if identifier in self.artwork_cache:
+        artwork = await self.artwork_cache.get(identifier, width, height)
+        if artwork:
             _LOGGER.debug("Retrieved artwork %s from cache", identifier)
-            return self.artwork_cache.get(identifier)
+            return artwork
 
-        artwork: Optional[ArtworkInfo] = None
         try:
             artwork = await self._fetch_artwork(width or 0, height or -1)
         except Exception:
             _LOGGER.warning("Artwork not present in response")
         else:
-            self.artwork_cache.put(identifier, artwork)
+            if artwork:
+                await self.artwork_cache.put(identifier, width, height, artwork)
 
         return artwork
 
@@ -731,8 +827,15 @@ class MrpPushUpdater(AbstractPushUpdater):
         """No longer forward updates to listener."""
         self.psm.listener = None
 
-    async def state_updated(self):
-        """State was updated for active player."""
+    async def state_updated(self, change: Optional[PlayerStateChange] = None):
+        """State was updated for active player.
+
+        A new Playing instance is only built if a field it depends on changed (or
+        if it is not known what changed).
+        """
+        if change is not None and _PLAYING_FIELDS.isdisjoint(change.fields):
+            return
+
         try:
             playstatus = await self.metadata.playing()
             self.post_update(playstatus)
@@ -1109,7 +1212,11 @@ def create_with_connection(  # pylint: disable=too-many-locals
 
     remote_control = MrpRemoteControl(core.loop, psm, protocol)
     metadata = MrpMetadata(
-        protocol, psm, core.config.identifier, core.session_manager.session
+        protocol,
+        psm,
+        core.config.identifier,
+        core.session_manager.session,
+        core.artwork_cache,
     )
     power = MrpPower(core.loop, protocol, remote_control)
     push_updater = MrpPushUpdater(metadata, psm, core.state_dispatcher)
@@ -3,17 +3,38 @@
 from abc import abstractmethod
 import asyncio
 import logging
+from typing import Hashable, Optional, Sequence
 
 from pyatv import exceptions
 from pyatv.protocols.mrp import protobuf
 from pyatv.support import chacha20, log_binary, log_protobuf
 from pyatv.support.net import tcp_keepalive
+from pyatv.support.send_queue import SendQueue
 from pyatv.support.state_producer import StateProducer
 from pyatv.support.variant import read_variant, write_variant
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _coalesce_key(message: protobuf.ProtocolMessage) -> Optional[Hashable]:
+    # Only messages nobody waits for a response to can be replaced by later ones
+    if message.identifier:
+        return None
+
+    if message.type == protobuf.SET_VOLUME_MESSAGE:
+        inner = protobuf.extract_inner(message)
+        return (message.type, inner.outputDeviceUID)
+
+    if message.type == protobuf.SEND_PACKED_VIRTUAL_TOUCH_EVENT_MESSAGE:
+        # Data is X, Y, phase, deviceID and finger as 16 bit little endian integers
+        data = protobuf.extract_inner(message).data
+        phase = int.from_bytes(data[4:6], byteorder="little")
+        if phase == protobuf.SendPackedVirtualTouchEventMessage.Phase.Moved:
+            return (message.type, data[6:10])
+
+    return None
+
+
 class AbstractMrpConnection(asyncio.Protocol, StateProducer):
     """Abstract base class for an MRP connection."""
 
@@ -38,6 +59,11 @@ class AbstractMrpConnection(asyncio.Protocol, StateProducer):
     def send(self, message: protobuf.ProtocolMessage) -> None:
         """Send protobuf message to device."""
 
+    def send_many(self, messages: Sequence[protobuf.ProtocolMessage]) -> None:
+        """Send several protobuf messages to device, in order."""
+        for message in messages:
+            self.send(message)
+
 
 class MrpConnection(
     AbstractMrpConnection
@@ -55,11 +81,15 @@ class MrpConnection(
         self._buffer = b""
         self._chacha = None
         self._transport = None
+        self.send_queue: SendQueue[protobuf.ProtocolMessage] = SendQueue(
+            loop, self._encode
+        )
 
     def connection_made(self, transport):
         """Device connection was made."""
         _LOGGER.debug("Connection made to device")
         self._transport = transport
+        self.send_queue.attach(transport)
         sock = transport.get_extra_info("socket")
         try:
             tcp_keepalive(sock)
@@ -75,6 +105,7 @@ class MrpConnection(
         """Device connection was dropped."""
         _LOGGER.debug("%s Disconnected from device: %s", self._log_str, exc)
         self._transport = None
+        self.send_queue.detach()
         self.listener.stop()  # pylint: disable=no-member
 
         if self.atv:
@@ -92,6 +123,8 @@ class MrpConnection(
 
     def enable_encryption(self, output_key: bytes, input_key: bytes) -> None:
         """Enable encryption with the specified keys."""
+        # Messages queued before this point must not be encrypted
+        self.send_queue.flush(force=True)
         self._chacha = chacha20.Chacha20Cipher8byteNonce(output_key, input_key)
 
     @property
@@ -107,12 +140,37 @@ class MrpConnection(
         """Close connection to device."""
         _LOGGER.debug("%s Closing connection", self._log_str)
         if self._transport:
+            self.send_queue.flush(force=True)
             self._transport.close()
+        self.send_queue.detach()
         self._transport = None
         self._chacha = None
 
+    def pause_writing(self) -> None:
+        """Transport buffer is full, stop writing."""
+        _LOGGER.debug("%s Pause writing (%s)", self._log_str, self.send_queue)
+        self.send_queue.pause()
+
+    def resume_writing(self) -> None:
+        """Transport buffer has drained, resume writing."""
+        _LOGGER.debug("%s Resume writing (%s)", self._log_str, self.send_queue)
+        self.send_queue.resume()
+
     def send(self, message: protobuf.ProtocolMessage) -> None:
         """Send protobuf message to device."""
+        if self._transport is None:
+            raise exceptions.InvalidStateError("not connected")
+        self.send_queue.put(message, _coalesce_key(message))
+
+    def send_many(self, messages: Sequence[protobuf.ProtocolMessage]) -> None:
+        """Send several protobuf messages to device with one write."""
+        if self._transport is None:
+            raise exceptions.InvalidStateError("not connected")
+        self.send_queue.put_many(
+            (message, _coalesce_key(message)) for message in messages
+        )
+
+    def _encode(self, message: protobuf.ProtocolMessage) -> bytes:
         serialized = message.SerializeToString()
 
         log_binary(_LOGGER, self._log_str + ">> Send", Data=serialized)
@@ -120,13 +178,15 @@ class MrpConnection(
             serialized = self._chacha.encrypt(serialized)
             log_binary(_LOGGER, self._log_str + ">> Send", Encrypted=serialized)
 
-        data = write_variant(len(serialized)) + serialized
-        self._transport.write(data)
         log_protobuf(_LOGGER, self._log_str + ">> Send: Protobuf", message)
+        return write_variant(len(serialized)) + serialized
 
     def send_raw(self, data):
         """Send message to device."""
         log_binary(_LOGGER, self._log_str + ">> Send raw", Data=data)
+
+        # Queued messages must be encrypted before this one
+        self.send_queue.flush(force=True)
         if self._chacha:
             data = self._chacha.encrypt(data)
             log_binary(_LOGGER, self._log_str + ">> Send raw", Encrypted=data)
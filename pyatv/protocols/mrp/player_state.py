@@ -3,7 +3,7 @@
 from itertools import chain
 import logging
 import math
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Set
 import weakref
 
 from pyatv.protocols.mrp import protobuf as pb
@@ -13,6 +13,24 @@ _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_PLAYER_ID = "MediaRemote-DefaultPlayer"
 
+# Names of changed fields that are not metadata fields (metadata fields use the
+# field name in ContentItemMetadata, e.g. "title")
+PLAYBACK_STATE = "playbackState"
+SUPPORTED_COMMANDS = "supportedCommands"
+CONTENT_ITEM = "contentItem"
+
+
+def _diff_metadata(
+    old: Optional[pb.ContentItemMetadata], new: Optional[pb.ContentItemMetadata]
+) -> Set[str]:
+    old_fields = {field.name: value for field, value in old.ListFields()} if old else {}
+    new_fields = {field.name: value for field, value in new.ListFields()} if new else {}
+    return {
+        name
+        for name in old_fields.keys() | new_fields.keys()
+        if old_fields.get(name) != new_fields.get(name)
+    }
+
 
 class PlayerState:
     """Represent what is currently playing on a device."""
@@ -27,6 +45,7 @@ class PlayerState:
         self.identifier: Optional[str] = player.identifier
         self.display_name: Optional[str] = None
         self.parent = parent
+        self._changes: Set[str] = set()
         self.update(player)
 
     @property
@@ -97,24 +116,54 @@ class PlayerState:
                 return cmd
         return None
 
+    def pop_changes(self) -> FrozenSet[str]:
+        """Return fields changed since last call and reset them."""
+        changes = frozenset(self._changes)
+        self._changes.clear()
+        return changes
+
     def handle_set_state(self, setstate):
         """Update current state with new data from SetStateMessage."""
         if setstate.HasField("playbackState"):
+            if setstate.playbackState != self._playback_state:
+                self._changes.add(PLAYBACK_STATE)
             self._playback_state = setstate.playbackState
 
         if setstate.HasField("supportedCommands"):
-            self.supported_commands = setstate.supportedCommands.supportedCommands
+            supported_commands = setstate.supportedCommands.supportedCommands
+            if list(supported_commands) != list(self.supported_commands):
+                self._changes.add(SUPPORTED_COMMANDS)
+            self.supported_commands = supported_commands
 
         if setstate.HasField("playbackQueue"):
+            old_identifier = self.item_identifier
+            old_metadata = self.metadata
+
             queue = setstate.playbackQueue
             self.items = queue.contentItems
             self.location = queue.location
 
+            metadata = self.metadata
+            if old_identifier != self.item_identifier or (old_metadata is None) != (
+                metadata is None
+            ):
+                self._changes.add(CONTENT_ITEM)
+            self._changes.update(_diff_metadata(old_metadata, metadata))
+
     def handle_content_item_update(self, item_update):
         """Update current state with new data from ContentItemUpdate."""
         for updated_item in item_update.contentItems:
-            for existing in self.items:
+            for index, existing in enumerate(self.items):
                 if updated_item.identifier == existing.identifier:
+                    # Only the current item affects what is playing
+                    if index == self.location:
+                        current = dict(existing.metadata.ListFields())
+                        self._changes.update(
+                            field.name
+                            for field, value in updated_item.metadata.ListFields()
+                            if current.get(field) != value
+                        )
+
                     # Other parts of the ContentItem should be merged as
                     # well, but those are not used right now so will do that
                     # when needed.
@@ -128,6 +177,17 @@ class PlayerState:
         return other and self.identifier == other.identifier
 
 
+class PlayerStateChange(NamedTuple):
+    """Fields that changed for a player.
+
+    Field names are either PLAYBACK_STATE, SUPPORTED_COMMANDS, CONTENT_ITEM (current
+    item in queue changed) or a field name in ContentItemMetadata.
+    """
+
+    player: PlayerState
+    fields: FrozenSet[str]
+
+
 class Client:
     """Represent an MRP media player client."""
 
@@ -252,7 +312,9 @@ class PlayerStateManager:
         player = self.get_player(setstate.playerPath)
         player.handle_set_state(setstate)
 
-        await self._state_updated(player=player)
+        await self._state_updated(
+            player=player, change=PlayerStateChange(player, player.pop_changes())
+        )
 
     async def _handle_content_item_update(self, message):
         item_update = pb.extract_inner(message)
@@ -260,7 +322,9 @@ class PlayerStateManager:
         player = self.get_player(item_update.playerPath)
         player.handle_content_item_update(item_update)
 
-        await self._state_updated(player=player)
+        await self._state_updated(
+            player=player, change=PlayerStateChange(player, player.pop_changes())
+        )
 
     async def _handle_set_now_playing_client(self, message):
         self._active_client = self.get_client(pb.extract_inner(message).client)
@@ -317,11 +381,18 @@ class PlayerStateManager:
 
         await self._state_updated(client=client)
 
-    async def _state_updated(self, client=None, player=None):
+    async def _state_updated(
+        self, client=None, player=None, change: Optional[PlayerStateChange] = None
+    ):
+        """Inform listener that state was updated.
+
+        A change is only passed when it is known exactly what fields changed. If
+        change is None, anything might have changed (e.g. a new active player).
+        """
         is_active_client = client == self.client
         is_active_player = player == self.playing
         is_always = client is None and player is None
 
         if is_active_client or is_active_player or is_always:
             if self.listener:
-                await self.listener.state_updated()
+                await self.listener.state_updated(change)
@@ -1,247 +1,373 @@
 """Simplified extension handling for protobuf messages.
 
+Message modules are imported when first used to keep import time down.
+
 THIS CODE IS AUTO-GENERATED - DO NOT EDIT!!!
 """
 
-from typing import Any
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 from .ProtocolMessage_pb2 import ProtocolMessage
 
+if TYPE_CHECKING:
+    from . import AudioFadeMessage_pb2
+    from . import AudioFadeResponseMessage_pb2
+    from . import ClientUpdatesConfigMessage_pb2
+    from . import ConfigureConnectionMessage_pb2
+    from . import CryptoPairingMessage_pb2
+    from . import DeviceInfoMessage_pb2
+    from . import GenericMessage_pb2
+    from . import GetKeyboardSessionMessage_pb2
+    from . import GetRemoteTextInputSessionMessage_pb2
+    from . import GetVolumeMessage_pb2
+    from . import GetVolumeResultMessage_pb2
+    from . import KeyboardMessage_pb2
+    from . import ModifyOutputContextRequestMessage_pb2
+    from . import NotificationMessage_pb2
+    from . import OriginClientPropertiesMessage_pb2
+    from . import PlaybackQueueRequestMessage_pb2
+    from . import PlayerClientPropertiesMessage_pb2
+    from . import RegisterForGameControllerEventsMessage_pb2
+    from . import RegisterHIDDeviceMessage_pb2
+    from . import RegisterHIDDeviceResultMessage_pb2
+    from . import RegisterVoiceInputDeviceMessage_pb2
+    from . import RegisterVoiceInputDeviceResponseMessage_pb2
+    from . import RemoteTextInputMessage_pb2
+    from . import RemoveClientMessage_pb2
+    from . import RemoveEndpointsMessage_pb2
+    from . import RemoveOutputDevicesMessage_pb2
+    from . import RemovePlayerMessage_pb2
+    from . import SendButtonEventMessage_pb2
+    from . import SendCommandMessage_pb2
+    from . import SendCommandResultMessage_pb2
+    from . import SendHIDEventMessage_pb2
+    from . import SendPackedVirtualTouchEventMessage_pb2
+    from . import SendVoiceInputMessage_pb2
+    from . import SetArtworkMessage_pb2
+    from . import SetConnectionStateMessage_pb2
+    from . import SetDefaultSupportedCommandsMessage_pb2
+    from . import SetDiscoveryModeMessage_pb2
+    from . import SetHiliteModeMessage_pb2
+    from . import SetNowPlayingClientMessage_pb2
+    from . import SetNowPlayingPlayerMessage_pb2
+    from . import SetRecordingStateMessage_pb2
+    from . import SetStateMessage_pb2
+    from . import SetVolumeMessage_pb2
+    from . import TextInputMessage_pb2
+    from . import TransactionMessage_pb2
+    from . import UpdateClientMessage_pb2
+    from . import UpdateContentItemArtworkMessage_pb2
+    from . import UpdateContentItemMessage_pb2
+    from . import UpdateEndPointsMessage_pb2
+    from . import UpdateOutputDeviceMessage_pb2
+    from . import VolumeControlAvailabilityMessage_pb2
+    from . import VolumeControlCapabilitiesDidChangeMessage_pb2
+    from . import VolumeDidChangeMessage_pb2
+    from . import WakeDeviceMessage_pb2
 
-from . import AudioFadeMessage_pb2
-from . import AudioFadeResponseMessage_pb2
-from . import ClientUpdatesConfigMessage_pb2
-from . import ConfigureConnectionMessage_pb2
-from . import CryptoPairingMessage_pb2
-from . import DeviceInfoMessage_pb2
-from . import GenericMessage_pb2
-from . import GetKeyboardSessionMessage_pb2
-from . import GetRemoteTextInputSessionMessage_pb2
-from . import GetVolumeMessage_pb2
-from . import GetVolumeResultMessage_pb2
-from . import KeyboardMessage_pb2
-from . import ModifyOutputContextRequestMessage_pb2
-from . import NotificationMessage_pb2
-from . import OriginClientPropertiesMessage_pb2
-from . import PlaybackQueueRequestMessage_pb2
-from . import PlayerClientPropertiesMessage_pb2
-from . import RegisterForGameControllerEventsMessage_pb2
-from . import RegisterHIDDeviceMessage_pb2
-from . import RegisterHIDDeviceResultMessage_pb2
-from . import RegisterVoiceInputDeviceMessage_pb2
-from . import RegisterVoiceInputDeviceResponseMessage_pb2
-from . import RemoteTextInputMessage_pb2
-from . import RemoveClientMessage_pb2
-from . import RemoveEndpointsMessage_pb2
-from . import RemoveOutputDevicesMessage_pb2
-from . import RemovePlayerMessage_pb2
-from . import SendButtonEventMessage_pb2
-from . import SendCommandMessage_pb2
-from . import SendCommandResultMessage_pb2
-from . import SendHIDEventMessage_pb2
-from . import SendPackedVirtualTouchEventMessage_pb2
-from . import SendVoiceInputMessage_pb2
-from . import SetArtworkMessage_pb2
-from . import SetConnectionStateMessage_pb2
-from . import SetDefaultSupportedCommandsMessage_pb2
-from . import SetDiscoveryModeMessage_pb2
-from . import SetHiliteModeMessage_pb2
-from . import SetNowPlayingClientMessage_pb2
-from . import SetNowPlayingPlayerMessage_pb2
-from . import SetRecordingStateMessage_pb2
-from . import SetStateMessage_pb2
-from . import SetVolumeMessage_pb2
-from . import TextInputMessage_pb2
-from . import TransactionMessage_pb2
-from . import UpdateClientMessage_pb2
-from . import UpdateContentItemArtworkMessage_pb2
-from . import UpdateContentItemMessage_pb2
-from . import UpdateEndPointsMessage_pb2
-from . import UpdateOutputDeviceMessage_pb2
-from . import VolumeControlAvailabilityMessage_pb2
-from . import VolumeControlCapabilitiesDidChangeMessage_pb2
-from . import VolumeDidChangeMessage_pb2
-from . import WakeDeviceMessage_pb2
+    from .AudioFadeMessage_pb2 import AudioFadeMessage
+    from .AudioFadeResponseMessage_pb2 import AudioFadeResponseMessage
+    from .AudioFormatSettingsMessage_pb2 import AudioFormatSettings
+    from .ClientUpdatesConfigMessage_pb2 import ClientUpdatesConfigMessage
+    from .CommandInfo_pb2 import CommandInfo
+    from .CommandInfo_pb2 import DisableReason
+    from .CommandInfo_pb2 import PreloadedPlaybackSessionInfo
+    from .CommandInfo_pb2 import QueueEndAction
+    from .CommandOptions_pb2 import CommandOptions
+    from .Common_pb2 import DeviceClass
+    from .Common_pb2 import DeviceSubType
+    from .Common_pb2 import DeviceType
+    from .Common_pb2 import PlaybackState
+    from .Common_pb2 import RepeatMode
+    from .Common_pb2 import ShuffleMode
+    from .ConfigureConnectionMessage_pb2 import ConfigureConnectionMessage
+    from .ContentItemMetadata_pb2 import ActiveFormatJustification
+    from .ContentItemMetadata_pb2 import AlbumTraits
+    from .ContentItemMetadata_pb2 import AudioFormat
+    from .ContentItemMetadata_pb2 import AudioRoute
+    from .ContentItemMetadata_pb2 import AudioRouteType
+    from .ContentItemMetadata_pb2 import AudioTier
+    from .ContentItemMetadata_pb2 import ContentItemMetadata
+    from .ContentItemMetadata_pb2 import FormatTier
+    from .ContentItemMetadata_pb2 import PlaylistTraits
+    from .ContentItemMetadata_pb2 import SongTraits
+    from .ContentItem_pb2 import ContentItem
+    from .ContentItem_pb2 import LanguageOptionGroup
+    from .CryptoPairingMessage_pb2 import CryptoPairingMessage
+    from .DeviceInfoMessage_pb2 import DeviceInfoMessage
+    from .DeviceInfoMessage_pb2 import PreferredEncoding
+    from .GenericMessage_pb2 import GenericMessage
+    from .GetKeyboardSessionMessage_pb2 import GetKeyboardSessionMessage
+    from .GetRemoteTextInputSessionMessage_pb2 import GetRemoteTextInputSessionMessage
+    from .GetVolumeMessage_pb2 import GetVolumeMessage
+    from .GetVolumeResultMessage_pb2 import GetVolumeResultMessage
+    from .KeyboardMessage_pb2 import AutocapitalizationType
+    from .KeyboardMessage_pb2 import KeyboardMessage
+    from .KeyboardMessage_pb2 import KeyboardState
+    from .KeyboardMessage_pb2 import KeyboardType
+    from .KeyboardMessage_pb2 import ReturnKeyType
+    from .KeyboardMessage_pb2 import TextEditingAttributes
+    from .KeyboardMessage_pb2 import TextInputTraits
+    from .LanguageOption_pb2 import LanguageOption
+    from .ModifyOutputContextRequestMessage_pb2 import ModifyOutputContextRequestMessage
+    from .ModifyOutputContextRequestMessage_pb2 import ModifyOutputContextRequestType
+    from .NotificationMessage_pb2 import NotificationMessage
+    from .NowPlayingClient_pb2 import NowPlayingClient
+    from .NowPlayingInfo_pb2 import NowPlayingInfo
+    from .NowPlayingPlayer_pb2 import NowPlayingPlayer
+    from .OriginClientPropertiesMessage_pb2 import OriginClientPropertiesMessage
+    from .Origin_pb2 import Origin
+    from .PlaybackQueueCapabilities_pb2 import PlaybackQueueCapabilities
+    from .PlaybackQueueContext_pb2 import PlaybackQueueContext
+    from .PlaybackQueueRequestMessage_pb2 import PlaybackQueueRequestMessage
+    from .PlaybackQueue_pb2 import PlaybackQueue
+    from .PlayerClientPropertiesMessage_pb2 import PlayerClientPropertiesMessage
+    from .PlayerPath_pb2 import PlayerPath
+    from .RegisterForGameControllerEventsMessage_pb2 import RegisterForGameControllerEventsMessage
+    from .RegisterHIDDeviceMessage_pb2 import RegisterHIDDeviceMessage
+    from .RegisterHIDDeviceResultMessage_pb2 import RegisterHIDDeviceResultMessage
+    from .RegisterVoiceInputDeviceMessage_pb2 import RegisterVoiceInputDeviceMessage
+    from .RegisterVoiceInputDeviceResponseMessage_pb2 import RegisterVoiceInputDeviceResponseMessage
+    from .RemoteTextInputMessage_pb2 import RemoteTextInputMessage
+    from .RemoveClientMessage_pb2 import RemoveClientMessage
+    from .RemoveEndpointsMessage_pb2 import RemoveEndpointsMessage
+    from .RemoveOutputDevicesMessage_pb2 import RemoveOutputDevicesMessage
+    from .RemovePlayerMessage_pb2 import RemovePlayerMessage
+    from .SendButtonEventMessage_pb2 import SendButtonEventMessage
+    from .SendCommandMessage_pb2 import SendCommandMessage
+    from .SendCommandResultMessage_pb2 import HandlerReturnStatus
+    from .SendCommandResultMessage_pb2 import SendCommandResult
+    from .SendCommandResultMessage_pb2 import SendCommandResultMessage
+    from .SendCommandResultMessage_pb2 import SendCommandResultStatus
+    from .SendCommandResultMessage_pb2 import SendCommandResultType
+    from .SendCommandResultMessage_pb2 import SendCommandStatusCode
+    from .SendCommandResultMessage_pb2 import SendError
+    from .SendHIDEventMessage_pb2 import SendHIDEventMessage
+    from .SendPackedVirtualTouchEventMessage_pb2 import SendPackedVirtualTouchEventMessage
+    from .SendVoiceInputMessage_pb2 import AudioBuffer
+    from .SendVoiceInputMessage_pb2 import AudioDataBlock
+    from .SendVoiceInputMessage_pb2 import AudioStreamPacketDescription
+    from .SendVoiceInputMessage_pb2 import AudioTime
+    from .SendVoiceInputMessage_pb2 import SendVoiceInputMessage
+    from .SetArtworkMessage_pb2 import SetArtworkMessage
+    from .SetConnectionStateMessage_pb2 import SetConnectionStateMessage
+    from .SetDefaultSupportedCommandsMessage_pb2 import SetDefaultSupportedCommandsMessage
+    from .SetDiscoveryModeMessage_pb2 import SetDiscoveryModeMessage
+    from .SetHiliteModeMessage_pb2 import SetHiliteModeMessage
+    from .SetNowPlayingClientMessage_pb2 import SetNowPlayingClientMessage
+    from .SetNowPlayingPlayerMessage_pb2 import SetNowPlayingPlayerMessage
+    from .SetRecordingStateMessage_pb2 import SetRecordingStateMessage
+    from .SetStateMessage_pb2 import SetStateMessage
+    from .SetVolumeMessage_pb2 import SetVolumeMessage
+    from .SupportedCommands_pb2 import SupportedCommands
+    from .TextInputMessage_pb2 import ActionType
+    from .TextInputMessage_pb2 import TextInputMessage
+    from .TransactionKey_pb2 import TransactionKey
+    from .TransactionMessage_pb2 import TransactionMessage
+    from .TransactionPacket_pb2 import TransactionPacket
+    from .TransactionPackets_pb2 import TransactionPackets
+    from .UpdateClientMessage_pb2 import UpdateClientMessage
+    from .UpdateContentItemArtworkMessage_pb2 import UpdateContentItemArtworkMessage
+    from .UpdateContentItemMessage_pb2 import UpdateContentItemMessage
+    from .UpdateEndPointsMessage_pb2 import AVEndpointDescriptor
+    from .UpdateEndPointsMessage_pb2 import UpdateEndPointsMessage
+    from .UpdateOutputDeviceMessage_pb2 import AVOutputDeviceDescriptor
+    from .UpdateOutputDeviceMessage_pb2 import AVOutputDeviceSourceInfo
+    from .UpdateOutputDeviceMessage_pb2 import UpdateOutputDeviceMessage
+    from .UpdatePlayerPath_pb2 import UpdatePlayerMessage
+    from .VirtualTouchDeviceDescriptorMessage_pb2 import VirtualTouchDeviceDescriptor
+    from .VoiceInputDeviceDescriptorMessage_pb2 import VoiceInputDeviceDescriptor
+    from .VolumeControlAvailabilityMessage_pb2 import VolumeCapabilities
+    from .VolumeControlAvailabilityMessage_pb2 import VolumeControlAvailabilityMessage
+    from .VolumeControlCapabilitiesDidChangeMessage_pb2 import VolumeControlCapabilitiesDidChangeMessage
+    from .VolumeDidChangeMessage_pb2 import VolumeDidChangeMessage
+    from .WakeDeviceMessage_pb2 import WakeDeviceMessage
 
 
-from .AudioFadeMessage_pb2 import AudioFadeMessage
-from .AudioFadeResponseMessage_pb2 import AudioFadeResponseMessage
-from .AudioFormatSettingsMessage_pb2 import AudioFormatSettings
-from .ClientUpdatesConfigMessage_pb2 import ClientUpdatesConfigMessage
-from .CommandInfo_pb2 import CommandInfo
-from .CommandInfo_pb2 import DisableReason
-from .CommandInfo_pb2 import PreloadedPlaybackSessionInfo
-from .CommandInfo_pb2 import QueueEndAction
-from .CommandOptions_pb2 import CommandOptions
-from .Common_pb2 import DeviceClass
-from .Common_pb2 import DeviceSubType
-from .Common_pb2 import DeviceType
-from .Common_pb2 import PlaybackState
-from .Common_pb2 import RepeatMode
-from .Common_pb2 import ShuffleMode
-from .ConfigureConnectionMessage_pb2 import ConfigureConnectionMessage
-from .ContentItemMetadata_pb2 import ActiveFormatJustification
-from .ContentItemMetadata_pb2 import AlbumTraits
-from .ContentItemMetadata_pb2 import AudioFormat
-from .ContentItemMetadata_pb2 import AudioRoute
-from .ContentItemMetadata_pb2 import AudioRouteType
-from .ContentItemMetadata_pb2 import AudioTier
-from .ContentItemMetadata_pb2 import ContentItemMetadata
-from .ContentItemMetadata_pb2 import FormatTier
-from .ContentItemMetadata_pb2 import PlaylistTraits
-from .ContentItemMetadata_pb2 import SongTraits
-from .ContentItem_pb2 import ContentItem
-from .ContentItem_pb2 import LanguageOptionGroup
-from .CryptoPairingMessage_pb2 import CryptoPairingMessage
-from .DeviceInfoMessage_pb2 import DeviceInfoMessage
-from .DeviceInfoMessage_pb2 import PreferredEncoding
-from .GenericMessage_pb2 import GenericMessage
-from .GetKeyboardSessionMessage_pb2 import GetKeyboardSessionMessage
-from .GetRemoteTextInputSessionMessage_pb2 import GetRemoteTextInputSessionMessage
-from .GetVolumeMessage_pb2 import GetVolumeMessage
-from .GetVolumeResultMessage_pb2 import GetVolumeResultMessage
-from .KeyboardMessage_pb2 import AutocapitalizationType
-from .KeyboardMessage_pb2 import KeyboardMessage
-from .KeyboardMessage_pb2 import KeyboardState
-from .KeyboardMessage_pb2 import KeyboardType
-from .KeyboardMessage_pb2 import ReturnKeyType
-from .KeyboardMessage_pb2 import TextEditingAttributes
-from .KeyboardMessage_pb2 import TextInputTraits
-from .LanguageOption_pb2 import LanguageOption
-from .ModifyOutputContextRequestMessage_pb2 import ModifyOutputContextRequestMessage
-from .ModifyOutputContextRequestMessage_pb2 import ModifyOutputContextRequestType
-from .NotificationMessage_pb2 import NotificationMessage
-from .NowPlayingClient_pb2 import NowPlayingClient
-from .NowPlayingInfo_pb2 import NowPlayingInfo
-from .NowPlayingPlayer_pb2 import NowPlayingPlayer
-from .OriginClientPropertiesMessage_pb2 import OriginClientPropertiesMessage
-from .Origin_pb2 import Origin
-from .PlaybackQueueCapabilities_pb2 import PlaybackQueueCapabilities
-from .PlaybackQueueContext_pb2 import PlaybackQueueContext
-from .PlaybackQueueRequestMessage_pb2 import PlaybackQueueRequestMessage
-from .PlaybackQueue_pb2 import PlaybackQueue
-from .PlayerClientPropertiesMessage_pb2 import PlayerClientPropertiesMessage
-from .PlayerPath_pb2 import PlayerPath
-from .RegisterForGameControllerEventsMessage_pb2 import RegisterForGameControllerEventsMessage
-from .RegisterHIDDeviceMessage_pb2 import RegisterHIDDeviceMessage
-from .RegisterHIDDeviceResultMessage_pb2 import RegisterHIDDeviceResultMessage
-from .RegisterVoiceInputDeviceMessage_pb2 import RegisterVoiceInputDeviceMessage
-from .RegisterVoiceInputDeviceResponseMessage_pb2 import RegisterVoiceInputDeviceResponseMessage
-from .RemoteTextInputMessage_pb2 import RemoteTextInputMessage
-from .RemoveClientMessage_pb2 import RemoveClientMessage
-from .RemoveEndpointsMessage_pb2 import RemoveEndpointsMessage
-from .RemoveOutputDevicesMessage_pb2 import RemoveOutputDevicesMessage
-from .RemovePlayerMessage_pb2 import RemovePlayerMessage
-from .SendButtonEventMessage_pb2 import SendButtonEventMessage
-from .SendCommandMessage_pb2 import SendCommandMessage
-from .SendCommandResultMessage_pb2 import HandlerReturnStatus
-from .SendCommandResultMessage_pb2 import SendCommandResult
-from .SendCommandResultMessage_pb2 import SendCommandResultMessage
-from .SendCommandResultMessage_pb2 import SendCommandResultStatus
-from .SendCommandResultMessage_pb2 import SendCommandResultType
-from .SendCommandResultMessage_pb2 import SendCommandStatusCode
-from .SendCommandResultMessage_pb2 import SendError
-from .SendHIDEventMessage_pb2 import SendHIDEventMessage
-from .SendPackedVirtualTouchEventMessage_pb2 import SendPackedVirtualTouchEventMessage
-from .SendVoiceInputMessage_pb2 import AudioBuffer
-from .SendVoiceInputMessage_pb2 import AudioDataBlock
-from .SendVoiceInputMessage_pb2 import AudioStreamPacketDescription
-from .SendVoiceInputMessage_pb2 import AudioTime
-from .SendVoiceInputMessage_pb2 import SendVoiceInputMessage
-from .SetArtworkMessage_pb2 import SetArtworkMessage
-from .SetConnectionStateMessage_pb2 import SetConnectionStateMessage
-from .SetDefaultSupportedCommandsMessage_pb2 import SetDefaultSupportedCommandsMessage
-from .SetDiscoveryModeMessage_pb2 import SetDiscoveryModeMessage
-from .SetHiliteModeMessage_pb2 import SetHiliteModeMessage
-from .SetNowPlayingClientMessage_pb2 import SetNowPlayingClientMessage
-from .SetNowPlayingPlayerMessage_pb2 import SetNowPlayingPlayerMessage
-from .SetRecordingStateMessage_pb2 import SetRecordingStateMessage
-from .SetStateMessage_pb2 import SetStateMessage
-from .SetVolumeMessage_pb2 import SetVolumeMessage
-from .SupportedCommands_pb2 import SupportedCommands
-from .TextInputMessage_pb2 import ActionType
-from .TextInputMessage_pb2 import TextInputMessage
-from .TransactionKey_pb2 import TransactionKey
-from .TransactionMessage_pb2 import TransactionMessage
-from .TransactionPacket_pb2 import TransactionPacket
-from .TransactionPackets_pb2 import TransactionPackets
-from .UpdateClientMessage_pb2 import UpdateClientMessage
-from .UpdateContentItemArtworkMessage_pb2 import UpdateContentItemArtworkMessage
-from .UpdateContentItemMessage_pb2 import UpdateContentItemMessage
-from .UpdateEndPointsMessage_pb2 import AVEndpointDescriptor
-from .UpdateEndPointsMessage_pb2 import UpdateEndPointsMessage
-from .UpdateOutputDeviceMessage_pb2 import AVOutputDeviceDescriptor
-from .UpdateOutputDeviceMessage_pb2 import AVOutputDeviceSourceInfo
-from .UpdateOutputDeviceMessage_pb2 import UpdateOutputDeviceMessage
-from .UpdatePlayerPath_pb2 import UpdatePlayerMessage
-from .VirtualTouchDeviceDescriptorMessage_pb2 import VirtualTouchDeviceDescriptor
-from .VoiceInputDeviceDescriptorMessage_pb2 import VoiceInputDeviceDescriptor
-from .VolumeControlAvailabilityMessage_pb2 import VolumeCapabilities
-from .VolumeControlAvailabilityMessage_pb2 import VolumeControlAvailabilityMessage
-from .VolumeControlCapabilitiesDidChangeMessage_pb2 import VolumeControlCapabilitiesDidChangeMessage
-from .VolumeDidChangeMessage_pb2 import VolumeDidChangeMessage
-from .WakeDeviceMessage_pb2 import WakeDeviceMessage
+_MESSAGE_MODULES: dict[str, str] = {
+    "AVEndpointDescriptor": "UpdateEndPointsMessage_pb2",
+    "AVOutputDeviceDescriptor": "UpdateOutputDeviceMessage_pb2",
+    "AVOutputDeviceSourceInfo": "UpdateOutputDeviceMessage_pb2",
+    "ActionType": "TextInputMessage_pb2",
+    "ActiveFormatJustification": "ContentItemMetadata_pb2",
+    "AlbumTraits": "ContentItemMetadata_pb2",
+    "AudioBuffer": "SendVoiceInputMessage_pb2",
+    "AudioDataBlock": "SendVoiceInputMessage_pb2",
+    "AudioFadeMessage": "AudioFadeMessage_pb2",
+    "AudioFadeResponseMessage": "AudioFadeResponseMessage_pb2",
+    "AudioFormat": "ContentItemMetadata_pb2",
+    "AudioFormatSettings": "AudioFormatSettingsMessage_pb2",
+    "AudioRoute": "ContentItemMetadata_pb2",
+    "AudioRouteType": "ContentItemMetadata_pb2",
+    "AudioStreamPacketDescription": "SendVoiceInputMessage_pb2",
+    "AudioTier": "ContentItemMetadata_pb2",
+    "AudioTime": "SendVoiceInputMessage_pb2",
+    "AutocapitalizationType": "KeyboardMessage_pb2",
+    "ClientUpdatesConfigMessage": "ClientUpdatesConfigMessage_pb2",
+    "CommandInfo": "CommandInfo_pb2",
+    "CommandOptions": "CommandOptions_pb2",
+    "ConfigureConnectionMessage": "ConfigureConnectionMessage_pb2",
+    "ContentItem": "ContentItem_pb2",
+    "ContentItemMetadata": "ContentItemMetadata_pb2",
+    "CryptoPairingMessage": "CryptoPairingMessage_pb2",
+    "DeviceClass": "Common_pb2",
+    "DeviceInfoMessage": "DeviceInfoMessage_pb2",
+    "DeviceSubType": "Common_pb2",
+    "DeviceType": "Common_pb2",
+    "DisableReason": "CommandInfo_pb2",
+    "FormatTier": "ContentItemMetadata_pb2",
+    "GenericMessage": "GenericMessage_pb2",
+    "GetKeyboardSessionMessage": "GetKeyboardSessionMessage_pb2",
+    "GetRemoteTextInputSessionMessage": "GetRemoteTextInputSessionMessage_pb2",
+    "GetVolumeMessage": "GetVolumeMessage_pb2",
+    "GetVolumeResultMessage": "GetVolumeResultMessage_pb2",
+    "HandlerReturnStatus": "SendCommandResultMessage_pb2",
+    "KeyboardMessage": "KeyboardMessage_pb2",
+    "KeyboardState": "KeyboardMessage_pb2",
+    "KeyboardType": "KeyboardMessage_pb2",
+    "LanguageOption": "LanguageOption_pb2",
+    "LanguageOptionGroup": "ContentItem_pb2",
+    "ModifyOutputContextRequestMessage": "ModifyOutputContextRequestMessage_pb2",
+    "ModifyOutputContextRequestType": "ModifyOutputContextRequestMessage_pb2",
+    "NotificationMessage": "NotificationMessage_pb2",
+    "NowPlayingClient": "NowPlayingClient_pb2",
+    "NowPlayingInfo": "NowPlayingInfo_pb2",
+    "NowPlayingPlayer": "NowPlayingPlayer_pb2",
+    "Origin": "Origin_pb2",
+    "OriginClientPropertiesMessage": "OriginClientPropertiesMessage_pb2",
+    "PlaybackQueue": "PlaybackQueue_pb2",
+    "PlaybackQueueCapabilities": "PlaybackQueueCapabilities_pb2",
+    "PlaybackQueueContext": "PlaybackQueueContext_pb2",
+    "PlaybackQueueRequestMessage": "PlaybackQueueRequestMessage_pb2",
+    "PlaybackState": "Common_pb2",
+    "PlayerClientPropertiesMessage": "PlayerClientPropertiesMessage_pb2",
+    "PlayerPath": "PlayerPath_pb2",
+    "PlaylistTraits": "ContentItemMetadata_pb2",
+    "PreferredEncoding": "DeviceInfoMessage_pb2",
+    "PreloadedPlaybackSessionInfo": "CommandInfo_pb2",
+    "QueueEndAction": "CommandInfo_pb2",
+    "RegisterForGameControllerEventsMessage": "RegisterForGameControllerEventsMessage_pb2",
+    "RegisterHIDDeviceMessage": "RegisterHIDDeviceMessage_pb2",
+    "RegisterHIDDeviceResultMessage": "RegisterHIDDeviceResultMessage_pb2",
+    "RegisterVoiceInputDeviceMessage": "RegisterVoiceInputDeviceMessage_pb2",
+    "RegisterVoiceInputDeviceResponseMessage": "RegisterVoiceInputDeviceResponseMessage_pb2",
+    "RemoteTextInputMessage": "RemoteTextInputMessage_pb2",
+    "RemoveClientMessage": "RemoveClientMessage_pb2",
+    "RemoveEndpointsMessage": "RemoveEndpointsMessage_pb2",
+    "RemoveOutputDevicesMessage": "RemoveOutputDevicesMessage_pb2",
+    "RemovePlayerMessage": "RemovePlayerMessage_pb2",
+    "RepeatMode": "Common_pb2",
+    "ReturnKeyType": "KeyboardMessage_pb2",
+    "SendButtonEventMessage": "SendButtonEventMessage_pb2",
+    "SendCommandMessage": "SendCommandMessage_pb2",
+    "SendCommandResult": "SendCommandResultMessage_pb2",
+    "SendCommandResultMessage": "SendCommandResultMessage_pb2",
+    "SendCommandResultStatus": "SendCommandResultMessage_pb2",
+    "SendCommandResultType": "SendCommandResultMessage_pb2",
+    "SendCommandStatusCode": "SendCommandResultMessage_pb2",
+    "SendError": "SendCommandResultMessage_pb2",
+    "SendHIDEventMessage": "SendHIDEventMessage_pb2",
+    "SendPackedVirtualTouchEventMessage": "SendPackedVirtualTouchEventMessage_pb2",
+    "SendVoiceInputMessage": "SendVoiceInputMessage_pb2",
+    "SetArtworkMessage": "SetArtworkMessage_pb2",
+    "SetConnectionStateMessage": "SetConnectionStateMessage_pb2",
+    "SetDefaultSupportedCommandsMessage": "SetDefaultSupportedCommandsMessage_pb2",
+    "SetDiscoveryModeMessage": "SetDiscoveryModeMessage_pb2",
+    "SetHiliteModeMessage": "SetHiliteModeMessage_pb2",
+    "SetNowPlayingClientMessage": "SetNowPlayingClientMessage_pb2",
+    "SetNowPlayingPlayerMessage": "SetNowPlayingPlayerMessage_pb2",
+    "SetRecordingStateMessage": "SetRecordingStateMessage_pb2",
+    "SetStateMessage": "SetStateMessage_pb2",
+    "SetVolumeMessage": "SetVolumeMessage_pb2",
+    "ShuffleMode": "Common_pb2",
+    "SongTraits": "ContentItemMetadata_pb2",
+    "SupportedCommands": "SupportedCommands_pb2",
+    "TextEditingAttributes": "KeyboardMessage_pb2",
+    "TextInputMessage": "TextInputMessage_pb2",
+    "TextInputTraits": "KeyboardMessage_pb2",
+    "TransactionKey": "TransactionKey_pb2",
+    "TransactionMessage": "TransactionMessage_pb2",
+    "TransactionPacket": "TransactionPacket_pb2",
+    "TransactionPackets": "TransactionPackets_pb2",
+    "UpdateClientMessage": "UpdateClientMessage_pb2",
+    "UpdateContentItemArtworkMessage": "UpdateContentItemArtworkMessage_pb2",
+    "UpdateContentItemMessage": "UpdateContentItemMessage_pb2",
+    "UpdateEndPointsMessage": "UpdateEndPointsMessage_pb2",
+    "UpdateOutputDeviceMessage": "UpdateOutputDeviceMessage_pb2",
+    "UpdatePlayerMessage": "UpdatePlayerPath_pb2",
+    "VirtualTouchDeviceDescriptor": "VirtualTouchDeviceDescriptorMessage_pb2",
+    "VoiceInputDeviceDescriptor": "VoiceInputDeviceDescriptorMessage_pb2",
+    "VolumeCapabilities": "VolumeControlAvailabilityMessage_pb2",
+    "VolumeControlAvailabilityMessage": "VolumeControlAvailabilityMessage_pb2",
+    "VolumeControlCapabilitiesDidChangeMessage": "VolumeControlCapabilitiesDidChangeMessage_pb2",
+    "VolumeDidChangeMessage": "VolumeDidChangeMessage_pb2",
+    "WakeDeviceMessage": "WakeDeviceMessage_pb2",
+}
 
 
-_EXTENSION_LOOKUP: dict[int, Any] = {
-    ProtocolMessage.AUDIO_FADE_MESSAGE: AudioFadeMessage_pb2.audioFadeMessage,
-    ProtocolMessage.AUDIO_FADE_RESPONSE_MESSAGE: AudioFadeResponseMessage_pb2.audioFadeResponseMessage,
-    ProtocolMessage.CLIENT_UPDATES_CONFIG_MESSAGE: ClientUpdatesConfigMessage_pb2.clientUpdatesConfigMessage,
-    ProtocolMessage.CONFIGURE_CONNECTION_MESSAGE: ConfigureConnectionMessage_pb2.configureConnectionMessage,
-    ProtocolMessage.CRYPTO_PAIRING_MESSAGE: CryptoPairingMessage_pb2.cryptoPairingMessage,
-    ProtocolMessage.DEVICE_INFO_MESSAGE: DeviceInfoMessage_pb2.deviceInfoMessage,
-    ProtocolMessage.DEVICE_INFO_UPDATE_MESSAGE: DeviceInfoMessage_pb2.deviceInfoMessage,
-    ProtocolMessage.GENERIC_MESSAGE: GenericMessage_pb2.genericMessage,
-    ProtocolMessage.GET_KEYBOARD_SESSION_MESSAGE: GetKeyboardSessionMessage_pb2.getKeyboardSessionMessage,
-    ProtocolMessage.GET_REMOTE_TEXT_INPUT_SESSION_MESSAGE: GetRemoteTextInputSessionMessage_pb2.getRemoteTextInputSessionMessage,
-    ProtocolMessage.GET_VOLUME_MESSAGE: GetVolumeMessage_pb2.getVolumeMessage,
-    ProtocolMessage.GET_VOLUME_RESULT_MESSAGE: GetVolumeResultMessage_pb2.getVolumeResultMessage,
-    ProtocolMessage.KEYBOARD_MESSAGE: KeyboardMessage_pb2.keyboardMessage,
-    ProtocolMessage.MODIFY_OUTPUT_CONTEXT_REQUEST_MESSAGE: ModifyOutputContextRequestMessage_pb2.modifyOutputContextRequestMessage,
-    ProtocolMessage.NOTIFICATION_MESSAGE: NotificationMessage_pb2.notificationMessage,
-    ProtocolMessage.ORIGIN_CLIENT_PROPERTIES_MESSAGE: OriginClientPropertiesMessage_pb2.originClientPropertiesMessage,
-    ProtocolMessage.PLAYBACK_QUEUE_REQUEST_MESSAGE: PlaybackQueueRequestMessage_pb2.playbackQueueRequestMessage,
-    ProtocolMessage.PLAYER_CLIENT_PROPERTIES_MESSAGE: PlayerClientPropertiesMessage_pb2.playerClientPropertiesMessage,
-    ProtocolMessage.REGISTER_FOR_GAME_CONTROLLER_EVENTS_MESSAGE: RegisterForGameControllerEventsMessage_pb2.registerForGameControllerEventsMessage,
-    ProtocolMessage.REGISTER_HID_DEVICE_MESSAGE: RegisterHIDDeviceMessage_pb2.registerHIDDeviceMessage,
-    ProtocolMessage.REGISTER_HID_DEVICE_RESULT_MESSAGE: RegisterHIDDeviceResultMessage_pb2.registerHIDDeviceResultMessage,
-    ProtocolMessage.REGISTER_VOICE_INPUT_DEVICE_MESSAGE: RegisterVoiceInputDeviceMessage_pb2.registerVoiceInputDeviceMessage,
-    ProtocolMessage.REGISTER_VOICE_INPUT_DEVICE_RESPONSE_MESSAGE: RegisterVoiceInputDeviceResponseMessage_pb2.registerVoiceInputDeviceResponseMessage,
-    ProtocolMessage.REMOTE_TEXT_INPUT_MESSAGE: RemoteTextInputMessage_pb2.remoteTextInputMessage,
-    ProtocolMessage.REMOVE_CLIENT_MESSAGE: RemoveClientMessage_pb2.removeClientMessage,
-    ProtocolMessage.REMOVE_ENDPOINTS_MESSAGE: RemoveEndpointsMessage_pb2.removeEndpointsMessage,
-    ProtocolMessage.REMOVE_OUTPUT_DEVICES_MESSAGE: RemoveOutputDevicesMessage_pb2.removeOutputDevicesMessage,
-    ProtocolMessage.REMOVE_PLAYER_MESSAGE: RemovePlayerMessage_pb2.removePlayerMessage,
-    ProtocolMessage.SEND_BUTTON_EVENT_MESSAGE: SendButtonEventMessage_pb2.sendButtonEventMessage,
-    ProtocolMessage.SEND_COMMAND_MESSAGE: SendCommandMessage_pb2.sendCommandMessage,
-    ProtocolMessage.SEND_COMMAND_RESULT_MESSAGE: SendCommandResultMessage_pb2.sendCommandResultMessage,
-    ProtocolMessage.SEND_HID_EVENT_MESSAGE: SendHIDEventMessage_pb2.sendHIDEventMessage,
-    ProtocolMessage.SEND_PACKED_VIRTUAL_TOUCH_EVENT_MESSAGE: SendPackedVirtualTouchEventMessage_pb2.sendPackedVirtualTouchEventMessage,
-    ProtocolMessage.SEND_VOICE_INPUT_MESSAGE: SendVoiceInputMessage_pb2.sendVoiceInputMessage,
-    ProtocolMessage.SET_ARTWORK_MESSAGE: SetArtworkMessage_pb2.setArtworkMessage,
-    ProtocolMessage.SET_CONNECTION_STATE_MESSAGE: SetConnectionStateMessage_pb2.setConnectionStateMessage,
-    ProtocolMessage.SET_DEFAULT_SUPPORTED_COMMANDS_MESSAGE: SetDefaultSupportedCommandsMessage_pb2.setDefaultSupportedCommandsMessage,
-    ProtocolMessage.SET_DISCOVERY_MODE_MESSAGE: SetDiscoveryModeMessage_pb2.setDiscoveryModeMessage,
-    ProtocolMessage.SET_HILITE_MODE_MESSAGE: SetHiliteModeMessage_pb2.setHiliteModeMessage,
-    ProtocolMessage.SET_NOW_PLAYING_CLIENT_MESSAGE: SetNowPlayingClientMessage_pb2.setNowPlayingClientMessage,
-    ProtocolMessage.SET_NOW_PLAYING_PLAYER_MESSAGE: SetNowPlayingPlayerMessage_pb2.setNowPlayingPlayerMessage,
-    ProtocolMessage.SET_RECORDING_STATE_MESSAGE: SetRecordingStateMessage_pb2.setRecordingStateMessage,
-    ProtocolMessage.SET_STATE_MESSAGE: SetStateMessage_pb2.setStateMessage,
-    ProtocolMessage.SET_VOLUME_MESSAGE: SetVolumeMessage_pb2.setVolumeMessage,
-    ProtocolMessage.TEXT_INPUT_MESSAGE: TextInputMessage_pb2.textInputMessage,
-    ProtocolMessage.TRANSACTION_MESSAGE: TransactionMessage_pb2.transactionMessage,
-    ProtocolMessage.UPDATE_CLIENT_MESSAGE: UpdateClientMessage_pb2.updateClientMessage,
-    ProtocolMessage.UPDATE_CONTENT_ITEM_ARTWORK_MESSAGE: UpdateContentItemArtworkMessage_pb2.updateContentItemArtworkMessage,
-    ProtocolMessage.UPDATE_CONTENT_ITEM_MESSAGE: UpdateContentItemMessage_pb2.updateContentItemMessage,
-    ProtocolMessage.UPDATE_END_POINTS_MESSAGE: UpdateEndPointsMessage_pb2.updateEndPointsMessage,
-    ProtocolMessage.UPDATE_OUTPUT_DEVICE_MESSAGE: UpdateOutputDeviceMessage_pb2.updateOutputDeviceMessage,
-    ProtocolMessage.VOLUME_CONTROL_AVAILABILITY_MESSAGE: VolumeControlAvailabilityMessage_pb2.volumeControlAvailabilityMessage,
-    ProtocolMessage.VOLUME_CONTROL_CAPABILITIES_DID_CHANGE_MESSAGE: VolumeControlCapabilitiesDidChangeMessage_pb2.volumeControlCapabilitiesDidChangeMessage,
-    ProtocolMessage.VOLUME_DID_CHANGE_MESSAGE: VolumeDidChangeMessage_pb2.volumeDidChangeMessage,
-    ProtocolMessage.WAKE_DEVICE_MESSAGE: WakeDeviceMessage_pb2.wakeDeviceMessage,
+_EXTENSION_LOOKUP: dict[int, tuple[str, str]] = {
+    ProtocolMessage.AUDIO_FADE_MESSAGE: ("AudioFadeMessage_pb2", "audioFadeMessage"),
+    ProtocolMessage.AUDIO_FADE_RESPONSE_MESSAGE: ("AudioFadeResponseMessage_pb2", "audioFadeResponseMessage"),
+    ProtocolMessage.CLIENT_UPDATES_CONFIG_MESSAGE: ("ClientUpdatesConfigMessage_pb2", "clientUpdatesConfigMessage"),
+    ProtocolMessage.CONFIGURE_CONNECTION_MESSAGE: ("ConfigureConnectionMessage_pb2", "configureConnectionMessage"),
+    ProtocolMessage.CRYPTO_PAIRING_MESSAGE: ("CryptoPairingMessage_pb2", "cryptoPairingMessage"),
+    ProtocolMessage.DEVICE_INFO_MESSAGE: ("DeviceInfoMessage_pb2", "deviceInfoMessage"),
+    ProtocolMessage.DEVICE_INFO_UPDATE_MESSAGE: ("DeviceInfoMessage_pb2", "deviceInfoMessage"),
+    ProtocolMessage.GENERIC_MESSAGE: ("GenericMessage_pb2", "genericMessage"),
+    ProtocolMessage.GET_KEYBOARD_SESSION_MESSAGE: ("GetKeyboardSessionMessage_pb2", "getKeyboardSessionMessage"),
+    ProtocolMessage.GET_REMOTE_TEXT_INPUT_SESSION_MESSAGE: ("GetRemoteTextInputSessionMessage_pb2", "getRemoteTextInputSessionMessage"),
+    ProtocolMessage.GET_VOLUME_MESSAGE: ("GetVolumeMessage_pb2", "getVolumeMessage"),
+    ProtocolMessage.GET_VOLUME_RESULT_MESSAGE: ("GetVolumeResultMessage_pb2", "getVolumeResultMessage"),
+    ProtocolMessage.KEYBOARD_MESSAGE: ("KeyboardMessage_pb2", "keyboardMessage"),
+    ProtocolMessage.MODIFY_OUTPUT_CONTEXT_REQUEST_MESSAGE: ("ModifyOutputContextRequestMessage_pb2", "modifyOutputContextRequestMessage"),
+    ProtocolMessage.NOTIFICATION_MESSAGE: ("NotificationMessage_pb2", "notificationMessage"),
+    ProtocolMessage.ORIGIN_CLIENT_PROPERTIES_MESSAGE: ("OriginClientPropertiesMessage_pb2", "originClientPropertiesMessage"),
+    ProtocolMessage.PLAYBACK_QUEUE_REQUEST_MESSAGE: ("PlaybackQueueRequestMessage_pb2", "playbackQueueRequestMessage"),
+    ProtocolMessage.PLAYER_CLIENT_PROPERTIES_MESSAGE: ("PlayerClientPropertiesMessage_pb2", "playerClientPropertiesMessage"),
+    ProtocolMessage.REGISTER_FOR_GAME_CONTROLLER_EVENTS_MESSAGE: ("RegisterForGameControllerEventsMessage_pb2", "registerForGameControllerEventsMessage"),
+    ProtocolMessage.REGISTER_HID_DEVICE_MESSAGE: ("RegisterHIDDeviceMessage_pb2", "registerHIDDeviceMessage"),
+    ProtocolMessage.REGISTER_HID_DEVICE_RESULT_MESSAGE: ("RegisterHIDDeviceResultMessage_pb2", "registerHIDDeviceResultMessage"),
+    ProtocolMessage.REGISTER_VOICE_INPUT_DEVICE_MESSAGE: ("RegisterVoiceInputDeviceMessage_pb2", "registerVoiceInputDeviceMessage"),
+    ProtocolMessage.REGISTER_VOICE_INPUT_DEVICE_RESPONSE_MESSAGE: ("RegisterVoiceInputDeviceResponseMessage_pb2", "registerVoiceInputDeviceResponseMessage"),
+    ProtocolMessage.REMOTE_TEXT_INPUT_MESSAGE: ("RemoteTextInputMessage_pb2", "remoteTextInputMessage"),
+    ProtocolMessage.REMOVE_CLIENT_MESSAGE: ("RemoveClientMessage_pb2", "removeClientMessage"),
+    ProtocolMessage.REMOVE_ENDPOINTS_MESSAGE: ("RemoveEndpointsMessage_pb2", "removeEndpointsMessage"),
+    ProtocolMessage.REMOVE_OUTPUT_DEVICES_MESSAGE: ("RemoveOutputDevicesMessage_pb2", "removeOutputDevicesMessage"),
+    ProtocolMessage.REMOVE_PLAYER_MESSAGE: ("RemovePlayerMessage_pb2", "removePlayerMessage"),
+    ProtocolMessage.SEND_BUTTON_EVENT_MESSAGE: ("SendButtonEventMessage_pb2", "sendButtonEventMessage"),
+    ProtocolMessage.SEND_COMMAND_MESSAGE: ("SendCommandMessage_pb2", "sendCommandMessage"),
+    ProtocolMessage.SEND_COMMAND_RESULT_MESSAGE: ("SendCommandResultMessage_pb2", "sendCommandResultMessage"),
+    ProtocolMessage.SEND_HID_EVENT_MESSAGE: ("SendHIDEventMessage_pb2", "sendHIDEventMessage"),
+    ProtocolMessage.SEND_PACKED_VIRTUAL_TOUCH_EVENT_MESSAGE: ("SendPackedVirtualTouchEventMessage_pb2", "sendPackedVirtualTouchEventMessage"),
+    ProtocolMessage.SEND_VOICE_INPUT_MESSAGE: ("SendVoiceInputMessage_pb2", "sendVoiceInputMessage"),
+    ProtocolMessage.SET_ARTWORK_MESSAGE: ("SetArtworkMessage_pb2", "setArtworkMessage"),
+    ProtocolMessage.SET_CONNECTION_STATE_MESSAGE: ("SetConnectionStateMessage_pb2", "setConnectionStateMessage"),
+    ProtocolMessage.SET_DEFAULT_SUPPORTED_COMMANDS_MESSAGE: ("SetDefaultSupportedCommandsMessage_pb2", "setDefaultSupportedCommandsMessage"),
+    ProtocolMessage.SET_DISCOVERY_MODE_MESSAGE: ("SetDiscoveryModeMessage_pb2", "setDiscoveryModeMessage"),
+    ProtocolMessage.SET_HILITE_MODE_MESSAGE: ("SetHiliteModeMessage_pb2", "setHiliteModeMessage"),
+    ProtocolMessage.SET_NOW_PLAYING_CLIENT_MESSAGE: ("SetNowPlayingClientMessage_pb2", "setNowPlayingClientMessage"),
+    ProtocolMessage.SET_NOW_PLAYING_PLAYER_MESSAGE: ("SetNowPlayingPlayerMessage_pb2", "setNowPlayingPlayerMessage"),
+    ProtocolMessage.SET_RECORDING_STATE_MESSAGE: ("SetRecordingStateMessage_pb2", "setRecordingStateMessage"),
+    ProtocolMessage.SET_STATE_MESSAGE: ("SetStateMessage_pb2", "setStateMessage"),
+    ProtocolMessage.SET_VOLUME_MESSAGE: ("SetVolumeMessage_pb2", "setVolumeMessage"),
+    ProtocolMessage.TEXT_INPUT_MESSAGE: ("TextInputMessage_pb2", "textInputMessage"),
+    ProtocolMessage.TRANSACTION_MESSAGE: ("TransactionMessage_pb2", "transactionMessage"),
+    ProtocolMessage.UPDATE_CLIENT_MESSAGE: ("UpdateClientMessage_pb2", "updateClientMessage"),
+    ProtocolMessage.UPDATE_CONTENT_ITEM_ARTWORK_MESSAGE: ("UpdateContentItemArtworkMessage_pb2", "updateContentItemArtworkMessage"),
+    ProtocolMessage.UPDATE_CONTENT_ITEM_MESSAGE: ("UpdateContentItemMessage_pb2", "updateContentItemMessage"),
+    ProtocolMessage.UPDATE_END_POINTS_MESSAGE: ("UpdateEndPointsMessage_pb2", "updateEndPointsMessage"),
+    ProtocolMessage.UPDATE_OUTPUT_DEVICE_MESSAGE: ("UpdateOutputDeviceMessage_pb2", "updateOutputDeviceMessage"),
+    ProtocolMessage.VOLUME_CONTROL_AVAILABILITY_MESSAGE: ("VolumeControlAvailabilityMessage_pb2", "volumeControlAvailabilityMessage"),
+    ProtocolMessage.VOLUME_CONTROL_CAPABILITIES_DID_CHANGE_MESSAGE: ("VolumeControlCapabilitiesDidChangeMessage_pb2", "volumeControlCapabilitiesDidChangeMessage"),
+    ProtocolMessage.VOLUME_DID_CHANGE_MESSAGE: ("VolumeDidChangeMessage_pb2", "volumeDidChangeMessage"),
+    ProtocolMessage.WAKE_DEVICE_MESSAGE: ("WakeDeviceMessage_pb2", "wakeDeviceMessage"),
 }
 
 
+_EXTENSIONS: dict[int, Any] = {}
+
+
 AUDIO_FADE_MESSAGE = ProtocolMessage.AUDIO_FADE_MESSAGE
 AUDIO_FADE_RESPONSE_MESSAGE = ProtocolMessage.AUDIO_FADE_RESPONSE_MESSAGE
 CLIENT_UPDATES_CONFIG_MESSAGE = ProtocolMessage.CLIENT_UPDATES_CONFIG_MESSAGE
@@ -299,10 +425,36 @@ VOLUME_DID_CHANGE_MESSAGE = ProtocolMessage.VOLUME_DID_CHANGE_MESSAGE
 WAKE_DEVICE_MESSAGE = ProtocolMessage.WAKE_DEVICE_MESSAGE
 
 
+def __getattr__(name: str) -> Any:
+    """Import message modules on first access."""
+    if name.endswith("_pb2"):
+        try:
+            return import_module("." + name, __name__)
+        except ModuleNotFoundError:
+            pass
+    elif module_name := _MESSAGE_MODULES.get(name):
+        value = getattr(import_module("." + module_name, __name__), name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__} has no attribute {name}")
+
+
 def extract_inner(message: ProtocolMessage):
     """Extract inner message based on type."""
-    if extension := _EXTENSION_LOOKUP.get(message.type, None):
-        return message.Extensions[extension]
+    extension = _EXTENSIONS.get(message.type)
+    if extension is None:
+        if lookup := _EXTENSION_LOOKUP.get(message.type, None):
+            module_name, accessor = lookup
+            extension = getattr(import_module("." + module_name, __name__), accessor)
+            _EXTENSIONS[message.type] = extension
+        else:
+            raise Exception('unknown type: ' + str(message.type))
+
+    # If the message was parsed before the extension was imported, the inner message
+    # is stored as an unknown field. Parse it again to pick it up.
+    if not message.HasExtension(extension):
+        message.ParseFromString(message.SerializeToString())
 
-    raise Exception('unknown type: ' + str(message.type))
+    return message.Extensions[extension]
 
@@ -3,20 +3,22 @@
 import asyncio
 from collections import namedtuple
 from enum import Enum
+import heapq
+import itertools
 import logging
-from typing import Dict, NamedTuple, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 import uuid
 
 from pyatv import exceptions
 from pyatv.auth.hap_pairing import parse_credentials
 from pyatv.auth.hap_srp import SRPAuthHandler
-from pyatv.core.protocol import MessageDispatcher, heartbeater
+from pyatv.core.protocol import Heartbeat, MessageDispatcher, get_heartbeat_scheduler
 from pyatv.interface import BaseService
 from pyatv.protocols.mrp import messages, protobuf
 from pyatv.protocols.mrp.auth import MrpPairVerifyProcedure
 from pyatv.protocols.mrp.connection import AbstractMrpConnection
 from pyatv.settings import InfoSettings
-from pyatv.support import async_timeout, error_handler
+from pyatv.support import error_handler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,11 +32,89 @@ SRP_INPUT_INFO = "MediaRemote-Read-Encryption-Key"
 Listener = namedtuple("Listener", "func data")
 
 
-class OutstandingMessage(NamedTuple):
-    """Sent message waiting for response."""
+class PendingRequests:
+    """Keep track of sent messages waiting for a response.
 
-    semaphore: asyncio.Semaphore
-    response: protobuf.ProtocolMessage
+    Each request is represented by a future that is resolved when the response
+    arrives. Timeouts for all requests are kept in a single heap, served by one timer
+    that is re-armed for the earliest deadline.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a new PendingRequests instance."""
+        self._futures: Dict[str, asyncio.Future] = {}
+        self._deadlines: List[Tuple[float, int, str, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def __len__(self) -> int:
+        """Return number of requests waiting for a response."""
+        return len(self._futures)
+
+    def add(self, identifier: str, timeout: float) -> asyncio.Future:
+        """Add a new request and return future resolved with the response."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._futures[identifier] = future
+
+        # Entries for requests that already got a response are removed lazily, but
+        # throw them away if they start to dominate the heap
+        if len(self._deadlines) > 2 * len(self._futures) + 64:
+            self._deadlines = [
+                entry for entry in self._deadlines if not entry[3].done()
+            ]
+            heapq.heapify(self._deadlines)
+
+        deadline = loop.time() + timeout
+        heapq.heappush(
+            self._deadlines, (deadline, next(self._sequence), identifier, future)
+        )
+        if self._timer is None or deadline < self._timer.when():
+            self._arm(loop)
+        return future
+
+    def resolve(self, identifier: str, message: protobuf.ProtocolMessage) -> bool:
+        """Resolve a request with a response.
+
+        Returns False if no one is waiting for the response.
+        """
+        future = self._futures.get(identifier)
+        if future is None or future.done():
+            return False
+        del self._futures[identifier]
+        future.set_result(message)
+        return True
+
+    def fail_all(self, exception: Exception) -> None:
+        """Fail all pending requests with an exception."""
+        futures = self._futures
+        self._futures = {}
+        self._deadlines = []
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        for future in futures.values():
+            if not future.done():
+                future.set_exception(exception)
+
+    def _arm(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._deadlines:
+            self._timer = loop.call_at(self._deadlines[0][0], self._expire)
+
+    def _expire(self) -> None:
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        while self._deadlines and self._deadlines[0][0] <= now:
+            _, _, identifier, future = heapq.heappop(self._deadlines)
+            if self._futures.get(identifier) is future:
+                del self._futures[identifier]
+            if not future.done():
+                future.set_exception(asyncio.TimeoutError())
+        self._timer = None
+        self._arm(loop)
 
 
 class ProtocolState(Enum):
@@ -56,39 +136,6 @@ class ProtocolState(Enum):
     """Protocol state is stopped."""
 
 
-async def heartbeat_loop(protocol):
-    """Periodically send heartbeat messages to device."""
-    _LOGGER.debug("Starting heartbeat loop")
-    count = 0
-    attempts = 0
-    message = messages.create(protobuf.GENERIC_MESSAGE)
-    while True:
-        try:
-            # Re-attempts are made with no initial delay to more quickly
-            # recover a failed heartbeat (if possible)
-            if attempts == 0:
-                await asyncio.sleep(HEARTBEAT_INTERVAL)
-
-            _LOGGER.debug("Sending periodic heartbeat %d", count)
-            await protocol.send_and_receive(message)
-            _LOGGER.debug("Got heartbeat %d", count)
-        except asyncio.CancelledError:
-            break
-        except Exception:
-            attempts += 1
-            if attempts > HEARTBEAT_RETRIES:
-                _LOGGER.error("heartbeat %d failed after %d tries", count, attempts)
-                protocol.connection.close()
-                break
-            _LOGGER.debug("heartbeat %d failed", count)
-        else:
-            attempts = 0
-        finally:
-            count += 1
-
-    _LOGGER.debug("Stopping heartbeat loop at %d", count)
-
-
 # pylint: disable=too-many-instance-attributes
 class MrpProtocol(MessageDispatcher[int, protobuf.ProtocolMessage]):
     """Protocol logic related to MRP.
@@ -116,8 +163,10 @@ class MrpProtocol(MessageDispatcher[int, protobuf.ProtocolMessage]):
         self.service = service
         self.info = info
         self.device_info: Optional[protobuf.ProtocolMessage] = None
-        self._heartbeat_task: Optional[asyncio.Task] = None
-        self._outstanding: Dict[str, OutstandingMessage] = {}
+        self._heartbeat: Optional[Heartbeat] = None
+        self._outstanding = PendingRequests()
+        self._identifier_prefix = str(uuid.uuid4()).upper()[:24]
+        self._identifier_counter = itertools.count()
         self._state: ProtocolState = ProtocolState.NOT_CONNECTED
 
     async def start(self, skip_initial_messages: bool = False) -> None:
@@ -178,10 +227,12 @@ class MrpProtocol(MessageDispatcher[int, protobuf.ProtocolMessage]):
                 "There were %d outstanding requests", len(self._outstanding)
             )
 
-        if self._heartbeat_task is not None:
-            self._heartbeat_task.cancel()
-            self._heartbeat_task = None
-        self._outstanding = {}
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            self._heartbeat = None
+        self._outstanding.fail_all(
+            exceptions.ConnectionLostError("connection was closed")
+        )
         self.connection.close()
         self._state = ProtocolState.STOPPED
 
@@ -195,13 +246,13 @@ class MrpProtocol(MessageDispatcher[int, protobuf.ProtocolMessage]):
         def _failure_func(exc: Exception):
             self.connection.close()
 
-        self._heartbeat_task = asyncio.ensure_future(
-            heartbeater(
-                name=str(self.connection),
-                sender_func=_sender_func,
-                failure_func=_failure_func,
-                message_factory=lambda: messages.create(protobuf.GENERIC_MESSAGE),
-            )
+        self._heartbeat = get_heartbeat_scheduler().schedule(
+            name=str(self.connection),
+            sender_func=_sender_func,
+            failure_func=_failure_func,
+            message_factory=lambda: messages.create(protobuf.GENERIC_MESSAGE),
+            retries=HEARTBEAT_RETRIES,
+            interval=HEARTBEAT_INTERVAL,
         )
 
     async def _enable_encryption(self) -> None:
@@ -222,12 +273,7 @@ class MrpProtocol(MessageDispatcher[int, protobuf.ProtocolMessage]):
 
     async def send(self, message: protobuf.ProtocolMessage) -> None:
         """Send a message and expect no response."""
-        if self._state not in [
-            ProtocolState.CONNECTED,
-            ProtocolState.READY,
-        ]:
-            raise exceptions.InvalidStateError(self._state.name)
-
+        self._verify_can_send()
         self.connection.send(message)
 
     async def send_and_receive(
@@ -237,12 +283,68 @@ class MrpProtocol(MessageDispatcher[int, protobuf.ProtocolMessage]):
         timeout: float = 5.0,
     ) -> protobuf.ProtocolMessage:
         """Send a message and wait for a response."""
+        return await self.send_request(message, generate_identifier, timeout)
+
+    def send_request(
+        self,
+        message: protobuf.ProtocolMessage,
+        generate_identifier: bool = True,
+        timeout: float = 5.0,
+    ) -> asyncio.Future:
+        """Send a message and return a future resolved with the response.
+
+        This makes it possible to have several requests in flight without waiting for
+        each response in turn. The returned future must be awaited, otherwise errors
+        (e.g. timeouts) will be logged as never retrieved.
+        """
+        self._verify_can_send()
+        future = self._add_request(message, generate_identifier, timeout)
+        try:
+            self.connection.send(message)
+        except Exception:
+            future.cancel()
+            raise
+        return future
+
+    def send_batch(
+        self,
+        requests: Sequence[Tuple[protobuf.ProtocolMessage, bool]],
+        timeout: float = 5.0,
+    ) -> List[asyncio.Future]:
+        """Send several messages at once and return futures for responses.
+
+        Each request is a message and whether a response is expected or not. All
+        messages are written to the device in one go and a future is returned for each
+        message expecting a response (in the same order as the messages). Just like
+        with `send_request`, all returned futures must be awaited.
+        """
+        self._verify_can_send()
+        futures = [
+            self._add_request(message, True, timeout)
+            for message, expect_response in requests
+            if expect_response
+        ]
+        try:
+            self.connection.send_many([message for message, _ in requests])
+        except Exception:
+            for future in futures:
+                future.cancel()
+            raise
+        return futures
+
+    def _verify_can_send(self) -> None:
         if self._state not in [
             ProtocolState.CONNECTED,
             ProtocolState.READY,
         ]:
             raise exceptions.InvalidStateError(self._state.name)
 
+    def _add_request(
+        self,
+        message: protobuf.ProtocolMessage,
+        generate_identifier: bool,
+        timeout: float,
+    ) -> asyncio.Future:
         # Some messages will respond with the same identifier as used in the
         # corresponding request. Others will not and one example is the crypto
         # message (for pairing). They will never include an identifier, but it
@@ -251,45 +353,24 @@ class MrpProtocol(MessageDispatcher[int, protobuf.ProtocolMessage]):
         # those cases, a "fake" identifier is used that includes the message
         # type instead.
         if generate_identifier:
-            identifier = str(uuid.uuid4()).upper()
+            # Identifiers look like UUIDs but only the last part changes between
+            # messages, which is a lot cheaper than generating a new UUID each time
+            identifier = (
+                f"{self._identifier_prefix}{next(self._identifier_counter):012X}"
+            )
             message.identifier = identifier
         else:
             identifier = "type_" + str(message.type)
 
-        self.connection.send(message)
-        return await self._receive(identifier, timeout)
-
-    async def _receive(
-        self, identifier: str, timeout: float
-    ) -> protobuf.ProtocolMessage:
-        semaphore = asyncio.Semaphore(value=0)
-        self._outstanding[identifier] = OutstandingMessage(
-            semaphore, protobuf.ProtocolMessage()
-        )
-
-        try:
-            # The connection instance will dispatch the message
-            async with async_timeout(timeout):
-                await semaphore.acquire()
-
-        except Exception:
-            del self._outstanding[identifier]
-            raise
-
-        response = self._outstanding[identifier].response
-        del self._outstanding[identifier]
-        return response
+        return self._outstanding.add(identifier, timeout)
 
     def message_received(self, message: protobuf.ProtocolMessage, _) -> None:
         """Message was received from device."""
+        if self._heartbeat is not None:
+            self._heartbeat.touch()
+
         # If the message identifier is outstanding, then someone is
-        # waiting for the response so we save it here
+        # waiting for the response so we hand it over here
         identifier = message.identifier or "type_" + str(message.type)
-        if identifier in self._outstanding:
-            outstanding = OutstandingMessage(
-                self._outstanding[identifier].semaphore, message
-            )
-            self._outstanding[identifier] = outstanding
-            self._outstanding[identifier].semaphore.release()
-        else:
+        if not self._outstanding.resolve(identifier, message):
             self.dispatch(message.type, message)
@@ -58,7 +58,7 @@ from pyatv.protocols.raop.protocols import StreamContext, airplayv1, airplayv2
 from pyatv.protocols.raop.stream_client import PlaybackInfo, RaopListener, StreamClient
 from pyatv.support.collections import dict_merge
 from pyatv.support.device_info import lookup_model, lookup_os
-from pyatv.support.http import HttpConnection, http_connect
+from pyatv.support.http import HttpConnection
 from pyatv.support.metadata import EMPTY_METADATA, MediaMetadata, merge_into
 from pyatv.support.rtsp import RtspSession
 
@@ -140,8 +140,12 @@ class RaopPlaybackManager:
         if self._stream_client and self._rtsp and self._context:
             return self._stream_client, self._context
 
-        self._connection = await http_connect(
-            str(self.core.config.address), self.core.service.port
+        # Connections are pooled per credentials, so a connection already verified
+        # (and encrypted) by a previous session can be reused
+        self._connection = await self.core.session_manager.http_pool.acquire(
+            str(self.core.config.address),
+            self.core.service.port,
+            context=self.core.service.credentials,
         )
         self._rtsp = RtspSession(self._connection)
 
@@ -169,7 +173,7 @@ class RaopPlaybackManager:
         if self._stream_client:
             self._stream_client.close()
         if self._connection:
-            self._connection.close()
+            self.core.session_manager.http_pool.release(self._connection)
             self._connection = None
         self._stream_client = None
         self._context.reset()
@@ -7,6 +7,7 @@ from typing import List, Mapping, Optional, Tuple
 from uuid import uuid4
 
 from pyatv import exceptions
+from pyatv.core.protocol import Heartbeat, get_heartbeat_scheduler
 from pyatv.protocols.airplay.auth import pair_verify
 from pyatv.protocols.raop.protocols import StreamContext, StreamProtocol
 from pyatv.support.rtsp import RtspSession
@@ -42,7 +43,7 @@ class AirPlayV1(StreamProtocol):
         super().__init__()
         self.context = context
         self.rtsp = rtsp
-        self._keep_alive_task: Optional[asyncio.Future] = None
+        self._keep_alive: Optional[Heartbeat] = None
 
     async def setup(self, timing_server_port: int, control_client_port: int) -> None:
         """To setup connection prior to starting to stream."""
@@ -80,33 +81,28 @@ class AirPlayV1(StreamProtocol):
 
     def teardown(self) -> None:
         """Teardown resources allocated by setup efter streaming finished."""
-        if self._keep_alive_task:
-            self._keep_alive_task.cancel()
-            self._keep_alive_task = None
+        if self._keep_alive:
+            self._keep_alive.cancel()
+            self._keep_alive = None
 
     async def start_feedback(self) -> None:
         """Start to send feedback (if supported and required)."""
         feedback = await self.rtsp.feedback(allow_error=True)
         if feedback.code == 200:
-            self._keep_alive_task = asyncio.ensure_future(self._send_keep_alive())
+            self._keep_alive = get_heartbeat_scheduler().schedule(
+                name=f"RAOP:{self.rtsp.connection.remote_ip}",
+                sender_func=self._send_keep_alive,
+                interval=KEEP_ALIVE_INTERVAL,
+            )
         else:
             _LOGGER.debug("Keep-alive not supported, not starting task")
 
-    async def _send_keep_alive(self) -> None:
-        _LOGGER.debug("Starting keep-alive task")
-
-        while True:
-            try:
-                await asyncio.sleep(KEEP_ALIVE_INTERVAL)
-
-                _LOGGER.debug("Sending keep-alive feedback")
-                await self.rtsp.feedback()
-            except asyncio.CancelledError:
-                break
-            except exceptions.ProtocolError:
-                _LOGGER.exception("feedback failed")
-
-        _LOGGER.debug("Feedback task finished")
+    async def _send_keep_alive(self, _) -> None:
+        try:
+            _LOGGER.debug("Sending keep-alive feedback")
+            await self.rtsp.feedback()
+        except exceptions.ProtocolError:
+            _LOGGER.exception("feedback failed")
 
     async def send_audio_packet(
         self, transport: asyncio.DatagramTransport, rtp_header: bytes, audio: bytes
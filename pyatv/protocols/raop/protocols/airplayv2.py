@@ -9,6 +9,7 @@ from uuid import uuid4
 from pyatv import exceptions
 from pyatv.auth.hap_channel import setup_channel
 from pyatv.auth.hap_pairing import PairVerifyProcedure
+from pyatv.core.protocol import Heartbeat, get_heartbeat_scheduler
 from pyatv.protocols.airplay.auth import verify_connection
 from pyatv.protocols.airplay.channels import EventChannel
 from pyatv.protocols.raop.protocols import StreamContext, StreamProtocol
@@ -44,7 +45,7 @@ class AirPlayV2(StreamProtocol):
         self.event_channel: Optional[asyncio.BaseTransport] = None
         self._verifier: Optional[PairVerifyProcedure] = None
         self._cipher: Optional[Chacha20Cipher] = None
-        self._feedback_task: Optional[asyncio.Task] = None
+        self._feedback: Optional[Heartbeat] = None
 
         self.uuid = str(uuid4())
 
@@ -157,28 +158,29 @@ class AirPlayV2(StreamProtocol):
 
     def teardown(self) -> None:
         """Teardown resources allocated by setup efter streaming finished."""
-        if self._feedback_task:
-            self._feedback_task.cancel()
-            self._feedback_task = None
+        if self._feedback:
+            self._feedback.cancel()
+            self._feedback = None
         if self.event_channel:
             self.event_channel.close()
             self.event_channel = None
 
     async def start_feedback(self) -> None:
         """Start to send feedback (if supported and required)."""
-        if self._feedback_task is None:
-            self._feedback_task = asyncio.create_task(self._feedback_task_loop())
-
-    async def _feedback_task_loop(self) -> None:
-        _LOGGER.debug("Starting feedback task")
-        # TODO: Better end condition here to not risk infinite runs?
-        while True:
-            try:
-                await self.rtsp.feedback()
-            except Exception as ex:
-                # Treat feedback as "best effort" and don't raise any errors
-                _LOGGER.debug("Feedback failed: %s", ex)
-            await asyncio.sleep(FEEDBACK_INTERVAL)
+        if self._feedback is None:
+            self._feedback = get_heartbeat_scheduler().schedule(
+                name=f"RAOP:{self.rtsp.connection.remote_ip}",
+                sender_func=self._send_feedback,
+                interval=FEEDBACK_INTERVAL,
+                initial_delay=0.0,
+            )
+
+    async def _send_feedback(self, _) -> None:
+        try:
+            await self.rtsp.feedback()
+        except Exception as ex:
+            # Treat feedback as "best effort" and don't raise any errors
+            _LOGGER.debug("Feedback failed: %s", ex)
 
     async def send_audio_packet(
         self, transport: asyncio.DatagramTransport, rtp_header: bytes, audio: bytes
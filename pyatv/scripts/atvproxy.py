@@ -76,6 +76,7 @@ from pyatv.support.http import (
     HttpConnection,
     HttpRequest,
     HttpResponse,
+    HttpStreamResponse,
     http_connect,
 )
 
@@ -1269,7 +1270,7 @@ class AirPlayAppleTVProxy(BasicHttpServer, BaseAirPlayServerAuth):
 
     def handle_request(
         self, request: HttpRequest
-    ) -> Optional[Union[HttpResponse, asyncio.Task]]:
+    ) -> Optional[Union[HttpResponse, HttpStreamResponse, asyncio.Task]]:
         """Dispatch request to correct handler method or proxy to remote device."""
         log_request(_LOGGER, request)
         response = super().handle_request(request)
@@ -0,0 +1,281 @@
+"""Cache for artwork shared between protocols.
+
+Artwork is cached per identifier and requested size. The in-memory tier is bounded
+by total number of bytes (not number of entries), so a few large images cannot pin
+an unbounded amount of memory. An optional on-disk tier keeps artwork across
+restarts.
+
+If Pillow is installed, a request for a size not in the cache can be served by
+downscaling a larger cached image with the same identifier.
+"""
+
+import asyncio
+from collections import OrderedDict
+import hashlib
+import io
+import json
+import logging
+import os
+from typing import Dict, Optional, Set, Tuple
+
+from pyatv.interface import ArtworkInfo
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+DEFAULT_MAX_DISK_BYTES = 64 * 1024 * 1024
+
+CacheKey = Tuple[str, Optional[int], Optional[int]]
+
+
+def _target_size(
+    artwork: ArtworkInfo, width: Optional[int], height: Optional[int]
+) -> Optional[Tuple[int, int]]:
+    """Return size to scale artwork to or None if not possible."""
+    if artwork.width <= 0 or artwork.height <= 0:
+        return None
+
+    requested_width = width if width and width > 0 else None
+    requested_height = height if height and height > 0 else None
+    if requested_width is None and requested_height is None:
+        return None
+
+    # Keep aspect ratio and never upscale
+    scale = min(
+        requested_width / artwork.width if requested_width else 1.0,
+        requested_height / artwork.height if requested_height else 1.0,
+    )
+    if scale > 1.0:
+        return None
+    return (
+        max(1, round(artwork.width * scale)),
+        max(1, round(artwork.height * scale)),
+    )
+
+
+def _downscale(artwork: ArtworkInfo, size: Tuple[int, int]) -> ArtworkInfo:
+    with Image.open(io.BytesIO(artwork.bytes)) as image:
+        image_format = image.format
+        scaled = image.resize(size)
+    output = io.BytesIO()
+    scaled.save(output, format=image_format)
+    return ArtworkInfo(
+        bytes=output.getvalue(),
+        mimetype=artwork.mimetype,
+        width=size[0],
+        height=size[1],
+    )
+
+
+class ArtworkCache:
+    """Byte bounded LRU cache for artwork with an optional disk tier."""
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        directory: Optional[str] = None,
+        max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES,
+    ) -> None:
+        """Initialize a new ArtworkCache instance.
+
+        If `directory` is set, artwork is also stored in that directory (which will
+        be created if needed), using at most `max_disk_bytes`.
+        """
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self._data: "OrderedDict[CacheKey, ArtworkInfo]" = OrderedDict()
+        self._sizes: Dict[str, Set[CacheKey]] = {}
+        self._size = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.scaled_hits = 0
+        self.misses = 0
+
+    @property
+    def size(self) -> int:
+        """Return number of bytes cached in memory."""
+        return self._size
+
+    @property
+    def hit_rate(self) -> float:
+        """Return ratio of requests served from cache (any tier)."""
+        total = self.hits + self.disk_hits + self.scaled_hits + self.misses
+        if total == 0:
+            return 0.0
+        return (self.hits + self.disk_hits + self.scaled_hits) / total
+
+    async def get(
+        self, identifier: str, width: Optional[int], height: Optional[int]
+    ) -> Optional[ArtworkInfo]:
+        """Return cached artwork or None if not in cache."""
+        key = (identifier, width, height)
+        artwork = self._data.get(key)
+        if artwork is not None:
+            self._data.move_to_end(key)
+            self.hits += 1
+            return artwork
+
+        loop = asyncio.get_running_loop()
+        if self.directory:
+            artwork = await loop.run_in_executor(None, self._read_file, key)
+            if artwork is not None:
+                self._put_memory(key, artwork)
+                self.disk_hits += 1
+                return artwork
+
+        if Image is not None:
+            artwork = await self._scale_cached(identifier, width, height)
+            if artwork is not None:
+                self._put_memory(key, artwork)
+                self.scaled_hits += 1
+                return artwork
+
+        self.misses += 1
+        return None
+
+    async def put(
+        self,
+        identifier: str,
+        width: Optional[int],
+        height: Optional[int],
+        artwork: ArtworkInfo,
+    ) -> None:
+        """Put artwork in cache."""
+        key = (identifier, width, height)
+        self._put_memory(key, artwork)
+        if self.directory:
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._write_file, key, artwork
+            )
+
+    def clear(self) -> None:
+        """Remove everything cached in memory."""
+        self._data.clear()
+        self._sizes.clear()
+        self._size = 0
+
+    def __contains__(self, identifier: str) -> bool:
+        """Return if any size of artwork is cached in memory for an identifier."""
+        return identifier in self._sizes
+
+    def __len__(self) -> int:
+        """Return number of artworks cached in memory."""
+        return len(self._data)
+
+    def _put_memory(self, key: CacheKey, artwork: ArtworkInfo) -> None:
+        self._remove(key)
+        if len(artwork.bytes) > self.max_bytes:
+            return
+
+        self._data[key] = artwork
+        self._sizes.setdefault(key[0], set()).add(key)
+        self._size += len(artwork.bytes)
+
+        while self._size > self.max_bytes:
+            self._remove(next(iter(self._data)))
+
+    def _remove(self, key: CacheKey) -> None:
+        artwork = self._data.pop(key, None)
+        if artwork is None:
+            return
+
+        self._size -= len(artwork.bytes)
+        keys = self._sizes[key[0]]
+        keys.discard(key)
+        if not keys:
+            del self._sizes[key[0]]
+
+    async def _scale_cached(
+        self, identifier: str, width: Optional[int], height: Optional[int]
+    ) -> Optional[ArtworkInfo]:
+        candidates = []
+        for key in self._sizes.get(identifier, set()):
+            artwork = self._data[key]
+            size = _target_size(artwork, width, height)
+            if size is not None:
+                candidates.append((len(artwork.bytes), artwork, size))
+        if not candidates:
+            return None
+
+        # Scale the smallest image that is large enough
+        _, artwork, size = min(candidates, key=lambda candidate: candidate[0])
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                None, _downscale, artwork, size
+            )
+        except Exception as ex:  # pylint: disable=broad-except
+            _LOGGER.debug("Failed to scale artwork %s: %s", identifier, ex)
+            return None
+
+    def _filename(self, key: CacheKey) -> str:
+        digest = hashlib.sha256(json.dumps(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory or "", f"{digest}.artwork")
+
+    def _read_file(self, key: CacheKey) -> Optional[ArtworkInfo]:
+        filename = self._filename(key)
+        try:
+            with open(filename, "rb") as _fh:
+                header = json.loads(_fh.readline())
+                data = _fh.read()
+            # Update modification time to use it for LRU eviction
+            os.utime(filename)
+        except (OSError, ValueError) as ex:
+            if not isinstance(ex, FileNotFoundError):
+                _LOGGER.debug("Failed to read artwork from %s: %s", filename, ex)
+            return None
+
+        return ArtworkInfo(
+            bytes=data,
+            mimetype=header["mimetype"],
+            width=header["width"],
+            height=header["height"],
+        )
+
+    def _write_file(self, key: CacheKey, artwork: ArtworkInfo) -> None:
+        header = {
+            "mimetype": artwork.mimetype,
+            "width": artwork.width,
+            "height": artwork.height,
+        }
+        try:
+            os.makedirs(self.directory or "", exist_ok=True)
+            filename = self._filename(key)
+            with open(filename, "wb") as _fh:
+                _fh.write(json.dumps(header).encode("utf-8") + b"\n")
+                _fh.write(artwork.bytes)
+            self._evict_files(filename)
+        except OSError as ex:
+            _LOGGER.debug("Failed to write artwork to %s: %s", self.directory, ex)
+
+    def _evict_files(self, keep: str) -> None:
+        entries = []
+        total = 0
+        with os.scandir(self.directory) as files:
+            for entry in files:
+                if entry.name.endswith(".artwork") and entry.is_file():
+                    stat = entry.stat()
+                    total += stat.st_size
+                    # Never evict the file just written, even if modification
+                    # times are equal
+                    if entry.path != keep:
+                        entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_disk_bytes:
+                break
+            os.remove(path)
+            total -= size
+
+    def __str__(self) -> str:
+        """Return string representation of object."""
+        return (
+            f"entries={len(self)}, bytes={self.size}, hits={self.hits}, "
+            f"disk_hits={self.disk_hits}, scaled_hits={self.scaled_hits}, "
+            f"misses={self.misses}, hit_rate={self.hit_rate:.2f}"
+        )
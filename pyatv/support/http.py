@@ -3,30 +3,39 @@
 from abc import ABC, abstractmethod
 import asyncio
 from collections import deque
+from collections.abc import AsyncIterable as AsyncIterableABC
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 import logging
-import pathlib
+import os
 import plistlib
 import re
 from typing import (
     Any,
+    AsyncIterable,
+    AsyncIterator,
+    BinaryIO,
     Callable,
+    Deque,
     Dict,
+    Generic,
+    Hashable,
+    List,
     Mapping,
     NamedTuple,
     Optional,
+    Set,
     Tuple,
+    TypeVar,
     Union,
     cast,
 )
 
-from aiohttp import ClientSession, web
-from aiohttp.web import middleware
+from aiohttp import ClientSession
 from requests.structures import CaseInsensitiveDict
 
 from pyatv import const, exceptions
 from pyatv.support import async_timeout, log_binary
-from pyatv.support.net import unused_port
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,9 +47,22 @@ SERVER_NAME = f"pyatv-www/{const.__version__}"
 # have been seen. So to deal with that, keep this high.
 DEFAULT_TIMEOUT = 25.0  # Seconds
 
+# Default limits for HttpConnectionPool
+DEFAULT_MAX_CONNECTIONS = 4  # Per host and port
+DEFAULT_IDLE_TIMEOUT = 30.0  # Seconds
+
+# Size of chunks read from a stream body before writing them
+STREAM_CHUNK_SIZE = 64 * 1024  # Bytes
+
+# Largest body accepted in a received message
+MAX_BODY_SIZE = 64 * 1024 * 1024  # Bytes
+
 # Used for pre/post processing in HTTP
 DataProcessor = Callable[[bytes], bytes]
 
+# Body that is written in chunks instead of being formatted into the message
+StreamBody = Union[memoryview, BinaryIO, AsyncIterable[bytes]]
+
 
 def _null_processor(data: bytes) -> bytes:
     """Data processor not doing any processing (just returning data)."""
@@ -91,6 +113,20 @@ class HttpResponse(NamedTuple):
     body: Union[str, bytes, dict]
 
 
+class HttpStreamResponse(NamedTuple):
+    """HTTP response message with a body written in chunks (see `StreamBody`).
+
+    Only used for outgoing responses, received responses are always `HttpResponse`.
+    """
+
+    protocol: str
+    version: str
+    code: int
+    message: str
+    headers: Mapping[str, str]
+    body: StreamBody
+
+
 class HttpRequest(NamedTuple):
     """Generic HTTP request message."""
 
@@ -107,41 +143,327 @@ def _key_value(line: str) -> Tuple[str, str]:
     return split[0], split[1]
 
 
+def _parse_headers(header: bytes) -> Tuple[str, CaseInsensitiveDict]:
+    """Parse first line and headers of a message (without empty line)."""
+    lines = header.decode("utf-8").split("\r\n")
+    return lines[0], CaseInsensitiveDict(_key_value(line) for line in lines[1:] if line)
+
+
+def _decode_body(headers: Mapping[str, str], body: bytes) -> Union[str, bytes]:
+    # Assume body is text unless content type is application/octet-stream
+    if not headers.get("Content-Type", "").startswith("application"):
+        try:
+            return body.decode("utf-8")
+        except UnicodeDecodeError:
+            pass
+    return body
+
+
 def _parse_http_message(
     message: bytes,
 ) -> Tuple[Optional[str], CaseInsensitiveDict, Union[bytes, str], bytes]:
     """Parse HTTP response."""
     try:
-        header_str, body = message.split(b"\r\n\r\n", maxsplit=1)
+        header, body = message.split(b"\r\n\r\n", maxsplit=1)
     except ValueError:
         return None, CaseInsensitiveDict(), b"", message
-    headers = header_str.decode("utf-8").split("\r\n")
 
-    msg_headers = CaseInsensitiveDict(_key_value(line) for line in headers[1:] if line)
+    first_line, msg_headers = _parse_headers(header)
 
     content_length = int(msg_headers.get("Content-Length", 0))
     if len(body or []) < content_length:
         return None, CaseInsensitiveDict(), b"", message
 
-    msg_body: Union[str, bytes] = body[0:content_length]
-
-    # Assume body is text unless content type is application/octet-stream
-    if not msg_headers.get("Content-Type", "").startswith("application"):
-        try:
-            msg_body = cast(bytes, msg_body).decode("utf-8")  # We know it's bytes here
-        except UnicodeDecodeError:
-            pass
-
     return (
-        headers[0],
+        first_line,
         msg_headers,
-        msg_body,
+        _decode_body(msg_headers, body[0:content_length]),
         body[content_length:],
     )
 
 
-def format_response(response: HttpResponse) -> bytes:
-    """Encode HTTP response."""
+def _create_response(
+    first_line: str, headers: CaseInsensitiveDict, body: Union[str, bytes]
+) -> HttpResponse:
+    # <protocol>/<version> <code> <message>
+    # E.g. HTTP/1.1 200 OK
+    protocol, _, rest = first_line.partition("/")
+    version, _, rest = rest.partition(" ")
+    code, separator, message = rest.partition(" ")
+    if not (protocol and version and separator and code.isdigit()):
+        raise ValueError(f"bad first line: {first_line}")
+
+    return HttpResponse(protocol, version, int(code), message, headers, body)
+
+
+def _create_request(
+    first_line: str, headers: CaseInsensitiveDict, body: Union[str, bytes]
+) -> HttpRequest:
+    # <method> <path> <protocol>/<version>
+    # E.g. GET / HTTP/1.1
+    method, _, rest = first_line.partition(" ")
+    path, _, rest = rest.partition(" ")
+    protocol, separator, version = rest.partition("/")
+    if not (method and path and protocol and separator and version):
+        raise ValueError(f"bad first line: {first_line}")
+
+    return HttpRequest(method, path, protocol, version, headers, body)
+
+
+class _BodyTooLargeError(ValueError):
+    """Raised when a received message has a body larger than MAX_BODY_SIZE."""
+
+
+def _content_length(headers: Mapping[str, str]) -> int:
+    value = headers.get("Content-Length", "0")
+    try:
+        length = int(value)
+    except ValueError as ex:
+        raise ValueError(f"invalid Content-Length: {value}") from ex
+    if length < 0:
+        raise ValueError(f"invalid Content-Length: {value}")
+    if length > MAX_BODY_SIZE:
+        raise _BodyTooLargeError(f"body too large: {length} bytes")
+    return length
+
+
+MessageT = TypeVar("MessageT")
+
+
+class HttpParser(Generic[MessageT]):
+    """Incremental parser for HTTP (and RTSP) messages.
+
+    Data is fed as it is received and complete messages are returned. Only new data
+    is searched for the end of headers. Once headers are parsed, the body is copied
+    into a buffer growing as data arrives (never beyond Content-Length). This way
+    received data is never scanned more than once, regardless of how it is split.
+
+    ValueError is raised for malformed messages and bodies larger than MAX_BODY_SIZE.
+    """
+
+    def __init__(
+        self,
+        create_message: Callable[
+            [str, CaseInsensitiveDict, Union[str, bytes]], MessageT
+        ],
+    ) -> None:
+        """Initialize a new HttpParser instance."""
+        self._create_message = create_message
+        self._header = bytearray()
+        self._scanned = 0
+        self._first_line = ""
+        self._headers: CaseInsensitiveDict = CaseInsensitiveDict()
+        self._body: Optional[bytearray] = None
+        self._body_length = 0
+
+    def reset(self) -> None:
+        """Drop partially received message."""
+        self._header = bytearray()
+        self._scanned = 0
+        self._body = None
+
+    def feed(self, data: bytes) -> List[MessageT]:
+        """Add received data and return messages completed by it."""
+        messages: List[MessageT] = []
+        view = memoryview(data)
+        while True:
+            if self._body is not None:
+                size = min(len(view), self._body_length - len(self._body))
+                self._body += view[0:size]
+                view = view[size:]
+                if len(self._body) < self._body_length:
+                    break
+
+                body = bytes(self._body)
+                self._body = None
+                messages.append(self._complete(body))
+                continue
+
+            if not view:
+                break
+
+            self._header += view
+            view = memoryview(b"")
+
+            # End of headers might be split between previous and new data
+            end = self._header.find(b"\r\n\r\n", max(0, self._scanned - 3))
+            if end == -1:
+                self._scanned = len(self._header)
+                break
+
+            header, rest = self._header[0:end], self._header[end + 4 :]
+            self._header = bytearray()
+            self._scanned = 0
+
+            self._first_line, self._headers = _parse_headers(header)
+            content_length = _content_length(self._headers)
+            if content_length > 0:
+                self._body = bytearray()
+                self._body_length = content_length
+            else:
+                messages.append(self._complete(b""))
+            view = memoryview(rest)
+
+        return messages
+
+    def _complete(self, body: bytes) -> MessageT:
+        return self._create_message(
+            self._first_line, self._headers, _decode_body(self._headers, body)
+        )
+
+
+def is_stream_body(body: object) -> bool:
+    """Return if body is written in chunks rather than formatted into the message."""
+    return body is not None and not isinstance(body, (str, bytes, dict))
+
+
+def _stream_length(body: StreamBody) -> Optional[int]:
+    """Return number of bytes left in a stream body or None if unknown."""
+    if isinstance(body, memoryview):
+        return body.nbytes
+    if isinstance(body, AsyncIterableABC):
+        return None
+
+    stream = cast(BinaryIO, body)
+    if not stream.seekable():
+        return None
+    position = stream.tell()
+    end = stream.seek(0, os.SEEK_END)
+    stream.seek(position)
+    return end - position
+
+
+def _stream_headers(
+    protocol: str, headers: Optional[Mapping[str, object]], body: StreamBody
+) -> Tuple[CaseInsensitiveDict, Optional[int]]:
+    """Add headers needed to frame a stream body.
+
+    Content-Length is used when the size of the body is known (or already present in
+    headers), otherwise chunked transfer encoding. Returns new headers and number of
+    bytes to write from body, which is None if chunked encoding shall be used.
+    """
+    msg_headers = CaseInsensitiveDict(headers)
+    if "Content-Length" in msg_headers:
+        return msg_headers, int(str(msg_headers["Content-Length"]))
+
+    length = _stream_length(body)
+    if length is not None:
+        msg_headers["Content-Length"] = length
+        return msg_headers, length
+
+    # Chunked transfer encoding is not supported by RTSP or HTTP/1.0
+    if protocol != "HTTP/1.1":
+        raise ValueError(f"length of body must be known for {protocol}")
+    msg_headers["Transfer-Encoding"] = "chunked"
+    return msg_headers, None
+
+
+async def _iter_stream(body: StreamBody) -> AsyncIterator[Union[bytes, memoryview]]:
+    """Yield chunks of at most STREAM_CHUNK_SIZE bytes from a stream body."""
+    if isinstance(body, memoryview):
+        view = body.cast("B") if body.ndim != 1 or body.itemsize != 1 else body
+        for offset in range(0, len(view), STREAM_CHUNK_SIZE):
+            yield view[offset : offset + STREAM_CHUNK_SIZE]
+    elif isinstance(body, AsyncIterableABC):
+        async for data in body:
+            # Large chunks are split so that flow control is applied to them
+            view = memoryview(data)
+            for offset in range(0, len(view), STREAM_CHUNK_SIZE):
+                yield view[offset : offset + STREAM_CHUNK_SIZE]
+    else:
+        # Reading files might block, so do that in an executor
+        loop = asyncio.get_running_loop()
+        stream = cast(BinaryIO, body)
+        while data := await loop.run_in_executor(None, stream.read, STREAM_CHUNK_SIZE):
+            yield data
+
+
+def _is_file(body: StreamBody) -> bool:
+    return not isinstance(body, (memoryview, AsyncIterableABC)) and hasattr(
+        body, "fileno"
+    )
+
+
+class _StreamWriter:
+    """Write messages and stream bodies to the transport of a protocol.
+
+    Chunks are only written when the transport accepts more data, so memory usage is
+    bounded by the write buffer limits of the transport regardless of body size. The
+    owning protocol must call `pause` and `resume` from pause_writing and
+    resume_writing (see asyncio.Protocol). Writes are serialized by `lock` so that
+    messages written concurrently are not interleaved.
+    """
+
+    def __init__(self, get_transport: Callable[[], Optional[asyncio.Transport]]):
+        """Initialize a new _StreamWriter instance."""
+        self.lock = asyncio.Lock()
+        self._get_transport = get_transport
+        self._can_write = asyncio.Event()
+        self._can_write.set()
+
+    @property
+    def _transport(self) -> asyncio.Transport:
+        transport = self._get_transport()
+        if transport is None:
+            raise exceptions.ConnectionLostError("connection was lost")
+        return transport
+
+    def pause(self) -> None:
+        """Stop writing chunks when transport buffer is full."""
+        self._can_write.clear()
+
+    def resume(self) -> None:
+        """Resume writing chunks when transport buffer has drained."""
+        self._can_write.set()
+
+    def write(
+        self,
+        data: List[Union[bytes, memoryview]],
+        processor: Optional[DataProcessor],
+    ) -> None:
+        """Write data to transport, processed by processor (if any)."""
+        # A data processor (e.g. encryption) must see all data, otherwise buffers can
+        # be passed to the transport as-is
+        if processor is None:
+            self._transport.writelines(data)
+        else:
+            self._transport.write(processor(b"".join(data)))
+
+    async def write_stream(
+        self,
+        body: StreamBody,
+        length: Optional[int],
+        processor: Optional[DataProcessor],
+    ) -> None:
+        """Write a stream body, using chunked encoding if length is None."""
+        chunked = length is None
+
+        # Files are sent with sendfile (zero-copy) when data is not processed. The
+        # event loop falls back to reading the file if that is not possible.
+        if processor is None and length is not None and _is_file(body):
+            stream = cast(BinaryIO, body)
+            await asyncio.get_running_loop().sendfile(
+                self._transport, stream, stream.tell(), length
+            )
+            return
+
+        async for chunk in _iter_stream(body):
+            await self._can_write.wait()
+            if chunked:
+                self.write([b"%X\r\n" % len(chunk), chunk, b"\r\n"], processor)
+            else:
+                self.write([chunk], processor)
+
+        if chunked:
+            self.write([b"0\r\n\r\n"], processor)
+
+
+def format_response(response: Union[HttpResponse, HttpStreamResponse]) -> bytes:
+    """Encode HTTP response.
+
+    Only the header is encoded for a `HttpStreamResponse`. The body must then be
+    written separately.
+    """
     headers = response.headers
     if not isinstance(headers, CaseInsensitiveDict):
         headers = CaseInsensitiveDict(headers)
@@ -154,6 +476,9 @@ def format_response(response: HttpResponse) -> bytes:
     for key, value in headers.items():
         output += f"{key}: {value}\r\n"
 
+    if isinstance(response, HttpStreamResponse):
+        return output.encode("utf-8") + b"\r\n"
+
     body = response.body or b""
     if body:
         if isinstance(body, str):
@@ -172,19 +497,7 @@ def parse_response(response: bytes) -> Tuple[Optional[HttpResponse], bytes]:
     first_line, msg_headers, msg_body, rest = _parse_http_message(response)
     if first_line is None:
         return None, rest
-
-    # <method> <path> <protocol>/<version
-    # E.g. GET / HTTP/1.1
-    match = re.match(r"([^/]+)/([0-9.]+) ([0-9]+) (.*)", first_line)
-    if not match:
-        raise ValueError(f"bad first line: {first_line}")
-
-    protocol, version, code, message = match.groups()
-
-    return (
-        HttpResponse(protocol, version, int(code), message, msg_headers, msg_body),
-        rest,
-    )
+    return _create_response(first_line, msg_headers, msg_body), rest
 
 
 def format_request(request: HttpRequest) -> bytes:
@@ -203,19 +516,7 @@ def parse_request(request: bytes) -> Tuple[Optional[HttpRequest], bytes]:
     first_line, msg_headers, msg_body, rest = _parse_http_message(request)
     if not first_line:
         return None, rest
-
-    # <method> <path> <protocol>/<version>
-    # E.g. GET / HTTP/1.1
-    match = re.match(r"([A-Z_]+) ([^ ]+) ([^/]+)/([0-9.]+)", first_line)
-    if not match:
-        raise ValueError(f"bad first line: {first_line}")
-
-    method, path, protocol, version = match.groups()
-
-    return (
-        HttpRequest(method, path, protocol, version, msg_headers, msg_body),
-        rest,
-    )
+    return _create_request(first_line, msg_headers, msg_body), rest
 
 
 def decode_bplist_from_body(response: HttpResponse) -> Dict[str, Any]:
@@ -230,12 +531,22 @@ def decode_bplist_from_body(response: HttpResponse) -> Dict[str, Any]:
 
 
 class ClientSessionManager:
-    """Manages an aiohttp ClientSession instance."""
+    """Manages an aiohttp ClientSession instance.
+
+    Also owns a pool of keep-alive connections (see `HttpConnectionPool`) used by
+    protocols talking HTTP or RTSP directly.
+    """
 
-    def __init__(self, session: ClientSession, should_close: bool) -> None:
+    def __init__(
+        self,
+        session: ClientSession,
+        should_close: bool,
+        http_pool: Optional["HttpConnectionPool"] = None,
+    ) -> None:
         """Initialize a new ClientSessionManager."""
         self._session = session
         self._should_close = should_close
+        self.http_pool = http_pool if http_pool is not None else HttpConnectionPool()
 
     @property
     def session(self) -> ClientSession:
@@ -244,6 +555,7 @@ class ClientSessionManager:
 
     async def close(self) -> None:
         """Close session."""
+        self.http_pool.close()
         if self._should_close:
             await self.session.close()
 
@@ -333,6 +645,8 @@ class HttpConnection(asyncio.Protocol):
         event: asyncio.Event
         response: Optional[HttpResponse] = None
         connection_closed: bool = False
+        abandoned: bool = False
+        error: Optional[Exception] = None
 
     def __init__(
         self,
@@ -340,6 +654,7 @@ class HttpConnection(asyncio.Protocol):
         send_processor: Optional[Callable[[bytes], bytes]] = None,
     ) -> None:
         """Initialize a new ."""
+        super().__init__()
         self.transport: Optional[asyncio.Transport] = None
         self.receive_processor: Callable[[bytes], bytes] = (
             receive_processor or _null_processor
@@ -350,7 +665,31 @@ class HttpConnection(asyncio.Protocol):
         self._local_ip: Optional[str] = None
         self._remote_ip: Optional[str] = None
         self._requests: deque = deque()
-        self._buffer = b""
+        self._parser = HttpParser(_create_response)
+        self._writer = _StreamWriter(lambda: self.transport)
+        self._keep_alive = True
+
+        # Set by HttpConnectionPool for connections it hands out
+        self.pooled = False
+
+        # State established on the connection that is kept while the connection is
+        # pooled, e.g. a pair-verify procedure used to enable encryption
+        self.session_data: Dict[str, Any] = {}
+
+    @property
+    def pending_requests(self) -> int:
+        """Return number of requests waiting for a response."""
+        return len(self._requests)
+
+    @property
+    def reusable(self) -> bool:
+        """Return if connection can be reused for new requests after current ones."""
+        return self.usable and not self._requests
+
+    @property
+    def usable(self) -> bool:
+        """Return if new requests can be sent (pipelined after pending ones)."""
+        return self.transport is not None and self._keep_alive
 
     @property
     def local_ip(self) -> str:
@@ -387,17 +726,28 @@ class HttpConnection(asyncio.Protocol):
         data = self.receive_processor(data)
 
         _LOGGER.debug("Received: %s", data)
-        self._buffer += data
-        while self._buffer:
-            # Try to parse a complete response
-            parsed, self._buffer = parse_response(self._buffer)
-            if parsed is None:
-                _LOGGER.debug("Not enough data to decode message")
-                break
+        try:
+            responses = self._parser.feed(data)
+        except (ValueError, MemoryError) as ex:
+            # Not possible to know where next response starts, so give up on connection
+            _LOGGER.warning("Failed to parse response: %s", ex)
+            for pending_request in self._requests:
+                pending_request.error = ex
+                pending_request.event.set()
+            self.close()
+            return
+
+        for parsed in responses:
+            if parsed.headers.get("Connection", "").lower() == "close":
+                self._keep_alive = False
 
-            # Dispatch message to first receiver
+            # Dispatch message to first receiver. Responses arrive in the same order
+            # as requests were sent, so pipelined requests are matched correctly.
             if self._requests:
                 pending_request = self._requests.pop()
+                if pending_request.abandoned:
+                    _LOGGER.debug("Dropping response to abandoned request: %s", parsed)
+                    continue
                 pending_request.response = parsed
                 pending_request.event.set()
             else:
@@ -416,6 +766,15 @@ class HttpConnection(asyncio.Protocol):
             pending_request.event.set()
         self._requests.clear()
         self.transport = None
+        self._writer.resume()
+
+    def pause_writing(self) -> None:
+        """Transport buffer is full, stop writing."""
+        self._writer.pause()
+
+    def resume_writing(self) -> None:
+        """Transport buffer has drained, resume writing."""
+        self._writer.resume()
 
     async def get(self, path: str, allow_error: bool = False) -> HttpResponse:
         """Make a GET request and return response."""
@@ -425,7 +784,7 @@ class HttpConnection(asyncio.Protocol):
         self,
         path: str,
         headers: Optional[Mapping[str, object]] = None,
-        body: Optional[Union[str, bytes]] = None,
+        body: Optional[Union[str, bytes, StreamBody]] = None,
         allow_error: bool = False,
     ) -> HttpResponse:
         """Make a POST request and return response."""
@@ -433,7 +792,7 @@ class HttpConnection(asyncio.Protocol):
             "POST", path, headers=headers, body=body, allow_error=allow_error
         )
 
-    async def send_and_receive(
+    async def send_and_receive(  # pylint: disable=too-many-locals
         self,
         method: str,
         uri: str,
@@ -441,27 +800,53 @@ class HttpConnection(asyncio.Protocol):
         user_agent: str = USER_AGENT,
         content_type: Optional[str] = None,
         headers: Optional[Mapping[str, object]] = None,
-        body: Optional[Union[str, bytes]] = None,
+        body: Optional[Union[str, bytes, StreamBody]] = None,
         allow_error: bool = False,
-        timeout: int = 10,
+        timeout: Optional[float] = 10,
     ) -> HttpResponse:
-        """Send a HTTP message and return response."""
+        """Send a HTTP message and return response.
+
+        A stream body (see `StreamBody`) is written in chunks as the transport accepts
+        data. The timeout only applies to waiting for the response, not to writing the
+        body. No timeout is used if timeout is None.
+        """
+        stream: Optional[StreamBody] = None
+        length: Optional[int] = None
+        if is_stream_body(body):
+            stream = cast(StreamBody, body)
+            headers, length = _stream_headers(protocol, headers, stream)
+            body = None
+
         output = _format_message(
-            method, uri, protocol, user_agent, content_type, headers, body
+            method,
+            uri,
+            protocol,
+            user_agent,
+            content_type,
+            headers,
+            cast(Optional[Union[str, bytes]], body),
         )
 
         _LOGGER.debug("Sending %s message: %s", protocol, output)
         if self.transport is None:
             raise RuntimeError("not connected to remote")
 
-        self.transport.write(self.send_processor(output))
-
         pending_request = HttpConnection.PendingRequest(event=asyncio.Event())
-        self._requests.appendleft(pending_request)
         try:
+            async with self._writer.lock:
+                self._writer.write([output], self._processor)
+                self._requests.appendleft(pending_request)
+                if stream is not None:
+                    await self._write_body(stream, length)
+
             async with async_timeout(timeout):
                 await pending_request.event.wait()
 
+            if pending_request.error is not None:
+                raise exceptions.InvalidResponseError(
+                    f"invalid response: {pending_request.error}"
+                ) from pending_request.error
+
             if pending_request.connection_closed:
                 raise exceptions.ConnectionLostError("connection was lost")
 
@@ -473,12 +858,24 @@ class HttpConnection(asyncio.Protocol):
         except asyncio.TimeoutError as ex:
             raise TimeoutError(f"no response to {method} {uri} ({protocol})") from ex
         finally:
-            # If request failed and event is still in request queue, remove it
+            # If request failed and is still in request queue, a response might still
+            # arrive. Pooled connections keep it in queue (and drop the response) so
+            # that responses to requests sent after this one are not mixed up. The
+            # connection is then not reusable and closed when released. Other
+            # connections are owned by the caller, so only remove the request.
             if pending_request in self._requests:
-                self._requests.remove(pending_request)
+                if self.pooled:
+                    pending_request.abandoned = True
+                else:
+                    self._requests.remove(pending_request)
 
         _LOGGER.debug("Got %s response: %s:", response.protocol, response)
+        return self._check_response(response, method, protocol, allow_error)
 
+    @staticmethod
+    def _check_response(
+        response: HttpResponse, method: str, protocol: str, allow_error: bool
+    ) -> HttpResponse:
         if response.code == 403:
             raise exceptions.AuthenticationError("not authenticated")
 
@@ -498,6 +895,21 @@ class HttpConnection(asyncio.Protocol):
             response.code,
         )
 
+    @property
+    def _processor(self) -> Optional[DataProcessor]:
+        if self.send_processor is _null_processor:
+            return None
+        return self.send_processor
+
+    async def _write_body(self, body: StreamBody, length: Optional[int]) -> None:
+        try:
+            await self._writer.write_stream(body, length, self._processor)
+        except Exception:
+            # Connection is in an unknown state if body was partially written
+            self._keep_alive = False
+            self.close()
+            raise
+
 
 class AbstractHttpServerHandler(ABC):
     """Abstract base class for handling HTTP requests."""
@@ -505,7 +917,7 @@ class AbstractHttpServerHandler(ABC):
     @abstractmethod
     def handle_request(
         self, request: HttpRequest
-    ) -> Optional[Union[HttpResponse, asyncio.Task]]:
+    ) -> Optional[Union[HttpResponse, HttpStreamResponse, asyncio.Task]]:
         """Handle incoming request and return response."""
 
 
@@ -526,7 +938,7 @@ class HttpSimpleRouter(AbstractHttpServerHandler):
 
     def handle_request(
         self, request: HttpRequest
-    ) -> Optional[Union[HttpResponse, asyncio.Task]]:
+    ) -> Optional[Union[HttpResponse, HttpStreamResponse, asyncio.Task]]:
         """Dispatch request to correct handler method."""
         for path, target in self._routes.get(request.method, {}).items():
             if re.match(path, request.path):
@@ -535,32 +947,74 @@ class HttpSimpleRouter(AbstractHttpServerHandler):
 
 
 class BasicHttpServer(asyncio.Protocol):
-    """Super basic HTTP server." """
+    """Super basic HTTP server.
+
+    Handlers may return a `HttpStreamResponse`, in which case the body is written in
+    chunks after the headers. File objects are closed once written.
+    """
 
     def __init__(self, handler: AbstractHttpServerHandler) -> None:
         """Initialize a new BasicHttpServer instance."""
+        super().__init__()
         self.handler: AbstractHttpServerHandler = handler
-        self.transport = None
-        self._request_buffer = b""
+        self.transport: Optional[asyncio.Transport] = None
+        self._parser = HttpParser(_create_request)
+        self._writer = _StreamWriter(lambda: self.transport)
+        self._stream_tasks: Set[asyncio.Task] = set()
 
     def connection_made(self, transport):
         """Handle that a connection has been made."""
         _LOGGER.debug("Connection from %s", transport.get_extra_info("peername"))
         self.transport = transport
 
+    def connection_lost(self, exc) -> None:
+        """Handle that connection was lost."""
+        self.transport = None
+        self._writer.resume()
+
+    def pause_writing(self) -> None:
+        """Transport buffer is full, stop writing."""
+        self._writer.pause()
+
+    def resume_writing(self) -> None:
+        """Transport buffer has drained, resume writing."""
+        self._writer.resume()
+
     def data_received(self, data: bytes):
         """Handle incoming HTTP request."""
         _LOGGER.debug("Received: %s", data)
         data = self.process_received(data)
 
         # Process all requests in packet
-        self._request_buffer += data
-        while self._request_buffer:
-            if (
-                rest := self._parse_and_send_next(self._request_buffer)
-            ) == self._request_buffer:
-                break
-            self._request_buffer = rest
+        try:
+            requests = self._parser.feed(data)
+        except _BodyTooLargeError as ex:
+            _LOGGER.warning("Rejecting request: %s", ex)
+            self._reject(413, "Payload too large", str(ex))
+            return
+        except Exception as ex:
+            _LOGGER.exception("failed to parse request")
+            self._reject(500, "Internal server error", str(ex))
+            return
+
+        for request in requests:
+            self._handle_request(request)
+
+    def _reject(self, code: int, message: str, body: str) -> None:
+        # Remaining data can not be parsed, so close connection after responding
+        self._parser.reset()
+        self._send_response(
+            HttpResponse("HTTP", "1.1", code, message, {"Connection": "close"}, body)
+        )
+        task = asyncio.ensure_future(self._close_after_writes())
+        self._stream_tasks.add(task)
+        task.add_done_callback(self._stream_tasks.discard)
+
+    async def _close_after_writes(self) -> None:
+        # Lock is acquired in order, so queued responses are written before closing
+        async with self._writer.lock:
+            if self.transport:
+                self.transport.close()
 
     def process_received(self, data: bytes) -> bytes:
         """Process incoming data."""
@@ -570,15 +1024,9 @@ class BasicHttpServer(asyncio.Protocol):
         """Process outgoing data."""
         return data
 
-    def _parse_and_send_next(self, data: bytes):
-        resp: Optional[Union[HttpResponse, asyncio.Task]] = None
-        rest: bytes = b""
+    def _handle_request(self, request: HttpRequest) -> None:
+        resp: Optional[Union[HttpResponse, HttpStreamResponse, asyncio.Task]] = None
         try:
-            request, rest = parse_request(data)
-
-            if not request:
-                return data
-
             resp = self.handler.handle_request(request)
         except Exception as ex:
             _LOGGER.exception("failed to process request")
@@ -594,64 +1042,243 @@ class BasicHttpServer(asyncio.Protocol):
         else:
             self._send_response(resp)
 
-        return rest
+    def _send_response(self, resp: Union[HttpResponse, HttpStreamResponse]) -> None:
+        if not self.transport:
+            return
 
-    def _send_response(self, resp: HttpResponse) -> None:
-        if self.transport:
+        # Responses must be written in order, so if a stream body is being written,
+        # this response has to wait for that to finish
+        if isinstance(resp, HttpStreamResponse) or self._writer.lock.locked():
+            task = asyncio.ensure_future(self._send_stream_response(resp))
+            self._stream_tasks.add(task)
+            task.add_done_callback(self._stream_tasks.discard)
+        else:
             self.transport.write(self.process_sent(format_response(resp)))
 
+    async def _send_stream_response(
+        self, resp: Union[HttpResponse, HttpStreamResponse]
+    ) -> None:
+        if type(self).process_sent is BasicHttpServer.process_sent:
+            processor: Optional[DataProcessor] = None
+        else:
+            processor = self.process_sent
+
+        async with self._writer.lock:
+            try:
+                if not isinstance(resp, HttpStreamResponse):
+                    self._writer.write([format_response(resp)], processor)
+                    return
+
+                headers, length = _stream_headers(
+                    f"{resp.protocol}/{resp.version}", resp.headers, resp.body
+                )
+                self._writer.write(
+                    [format_response(resp._replace(headers=headers))], processor
+                )
+                await self._writer.write_stream(resp.body, length, processor)
+            except (ConnectionError, exceptions.ConnectionLostError) as ex:
+                _LOGGER.debug("Connection lost while sending response: %s", ex)
+                if self.transport:
+                    self.transport.close()
+            except Exception:
+                _LOGGER.exception("failed to send response")
+                if self.transport:
+                    self.transport.close()
+            finally:
+                if isinstance(resp, HttpStreamResponse) and _is_file(resp.body):
+                    cast(BinaryIO, resp.body).close()
+
     def _send_task_response(self, task: asyncio.Task) -> None:
         if response := task.result():
             self._send_response(response)
 
 
-class StaticFileWebServer:
-    """Web server serving only a single file."""
+async def http_connect(address: str, port: int) -> HttpConnection:
+    """Open connection to a remote host."""
+    loop = asyncio.get_event_loop()
+    _, connection = await loop.create_connection(HttpConnection, address, port)
+    return cast(HttpConnection, connection)
+
+
+PoolKey = Tuple[str, int, Optional[Hashable]]
 
-    def __init__(self, file_to_serve: str, address: str, port: Optional[int] = None):
-        """Initialize a new StaticFileWebServer."""
-        self.path = pathlib.Path(file_to_serve)
-        self.app = web.Application(middlewares=[self._middleware])
-        self.app.router.add_static("/", self.path.parent, show_index=False)
-        self.runner = web.AppRunner(self.app)
-        self.site: Optional[web.TCPSite] = None
-        self._address = address  # Local address to bind to
-        self._port = port
 
-    async def start(self) -> None:
-        """Start the web server."""
-        if not self._port:
-            self._port = unused_port()
+class HttpConnectionPool:
+    """Pool of keep-alive HTTP (or RTSP) connections.
 
-        _LOGGER.debug("Starting AirPlay file server on port %d", self._port)
-        await self.runner.setup()
-        self.site = web.TCPSite(self.runner, str(self._address), self._port)
-        await self.site.start()  # type: ignore
+    Connections are pooled per host, port and context. The context identifies state
+    established on a connection, e.g. encryption enabled by pair-verify with a set of
+    credentials, so that a warm connection is only handed out to someone expecting the
+    same state. At most `max_connections` connections are open to the same host and
+    port, additional callers wait until a connection is released. Connections idle for
+    more than `idle_timeout` seconds are closed.
 
-    async def close(self) -> None:
-        """Stop the web server and free resources."""
-        _LOGGER.debug("Closing local AirPlay web server")
-        await self.runner.cleanup()
+    A connection is used by one caller at a time, but requests can be pipelined on it
+    as responses are matched to requests in the order they were sent.
+    """
 
-    @property
-    def file_address(self) -> str:
-        """Address to the file being served."""
-        return f"http://{self._address}:{self._port}/{self.path.name}"
+    def __init__(
+        self,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+    ) -> None:
+        """Initialize a new HttpConnectionPool instance."""
+        self.max_connections = max_connections
+        self.idle_timeout = idle_timeout
+        self._idle: Dict[PoolKey, List[Tuple[HttpConnection, asyncio.TimerHandle]]] = {}
+        self._in_use: Dict[HttpConnection, PoolKey] = {}
+        self._open: Dict[Tuple[str, int], int] = {}
+        self._waiters: Dict[Tuple[str, int], Deque[asyncio.Future]] = {}
+        self._closed = False
+        self.created = 0
+        self.reused = 0
+
+    def __len__(self) -> int:
+        """Return number of idle connections."""
+        return sum(len(connections) for connections in self._idle.values())
+
+    async def acquire(
+        self, address: str, port: int, context: Optional[Hashable] = None
+    ) -> HttpConnection:
+        """Return an idle connection or open a new one.
+
+        Every acquired connection must be given back with `release`.
+        """
+        if self._closed:
+            raise exceptions.InvalidStateError("connection pool is closed")
+
+        key = (address, port, context)
+        host = (address, port)
+        while True:
+            connection = self._take_idle(key)
+            if connection is not None:
+                self.reused += 1
+                break
 
-    # This middleware makes sure only the specified file is accessible. This is needed
-    # since aiohttp only supports serving an entire directory.
-    @middleware
-    async def _middleware(self, request, handler):
-        if request.rel_url.path == f"/{self.path.name}":
-            return await handler(request)
-        return web.Response(body="Permission denied", status=401)
+            # Make room by closing an idle connection with a different context
+            if self._open.get(host, 0) >= self.max_connections:
+                self._close_idle(host)
+
+            if self._open.get(host, 0) < self.max_connections:
+                self._open[host] = self._open.get(host, 0) + 1
+                try:
+                    connection = await http_connect(address, port)
+                except BaseException:
+                    self._connection_closed(host)
+                    raise
+                self.created += 1
+                break
 
+            waiter = asyncio.get_running_loop().create_future()
+            waiters = self._waiters.setdefault(host, deque())
+            waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if waiter in waiters:
+                    waiters.remove(waiter)
+
+        connection.pooled = True
+        self._in_use[connection] = key
+        return connection
+
+    def release(self, connection: HttpConnection) -> None:
+        """Give back an acquired connection to the pool.
+
+        The connection is kept for reuse if it is still open, the remote end did not
+        ask to close it and there are no outstanding requests. Otherwise it is closed.
+        """
+        key = self._in_use.pop(connection, None)
+        if key is None:
+            connection.close()
+            return
+
+        if connection.reusable and not self._closed:
+            handle = asyncio.get_running_loop().call_later(
+                self.idle_timeout, self._expire, key, connection
+            )
+            self._idle.setdefault(key, []).append((connection, handle))
+            self._wake((key[0], key[1]))
+        else:
+            connection.close()
+            self._connection_closed((key[0], key[1]))
+
+    @asynccontextmanager
+    async def connection(
+        self, address: str, port: int, context: Optional[Hashable] = None
+    ) -> AsyncIterator[HttpConnection]:
+        """Acquire a connection and release it when done."""
+        connection = await self.acquire(address, port, context)
+        try:
+            yield connection
+        finally:
+            self.release(connection)
 
-async def http_connect(address: str, port: int) -> HttpConnection:
-    """Open connection to a remote host."""
-    loop = asyncio.get_event_loop()
-    _, connection = await loop.create_connection(HttpConnection, address, port)
-    return cast(HttpConnection, connection)
+    def close(self) -> None:
+        """Close all idle connections and stop pooling."""
+        self._closed = True
+        for key in list(self._idle):
+            for connection, handle in self._idle.pop(key):
+                handle.cancel()
+                connection.close()
+                self._connection_closed((key[0], key[1]))
+        for waiters in self._waiters.values():
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_exception(
+                        exceptions.InvalidStateError("connection pool is closed")
+                    )
+
+    def _take_idle(self, key: PoolKey) -> Optional[HttpConnection]:
+        connections = self._idle.get(key, [])
+        while connections:
+            # Most recently used connection is least likely to have been closed
+            connection, handle = connections.pop()
+            handle.cancel()
+            if connection.reusable:
+                return connection
+            connection.close()
+            self._connection_closed((key[0], key[1]))
+        self._idle.pop(key, None)
+        return None
+
+    def _close_idle(self, host: Tuple[str, int]) -> None:
+        for key, connections in self._idle.items():
+            if (key[0], key[1]) == host and connections:
+                connection, handle = connections.pop(0)
+                handle.cancel()
+                connection.close()
+                self._connection_closed(host)
+                return
+
+    def _expire(self, key: PoolKey, connection: HttpConnection) -> None:
+        connections = self._idle.get(key, [])
+        for index, (idle_connection, _) in enumerate(connections):
+            if idle_connection is connection:
+                del connections[index]
+                _LOGGER.debug("Closing idle connection to %s:%d", key[0], key[1])
+                connection.close()
+                self._connection_closed((key[0], key[1]))
+                return
+
+    def _connection_closed(self, host: Tuple[str, int]) -> None:
+        self._open[host] -= 1
+        if self._open[host] == 0:
+            del self._open[host]
+        self._wake(host)
+
+    def _wake(self, host: Tuple[str, int]) -> None:
+        for waiter in self._waiters.get(host, []):
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    def __str__(self) -> str:
+        """Return string representation of object."""
+        return (
+            f"open={sum(self._open.values())}, idle={len(self)}, "
+            f"created={self.created}, reused={self.reused}"
+        )
 
 
 async def http_server(
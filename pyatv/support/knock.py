@@ -9,9 +9,12 @@ are accessed, something this module will try to emulate.
 import asyncio
 from asyncio.tasks import FIRST_EXCEPTION
 import errno
+import heapq
 from ipaddress import IPv4Address
+import itertools
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Tuple
+import weakref
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,6 +23,12 @@ _ABORT_KNOCK_ERRNOS = {errno.EHOSTDOWN, errno.EHOSTUNREACH}
 _SLEEP_AFTER_CONNECT = 0.1
 _KNOCK_TIMEOUT_BUFFER = _SLEEP_AFTER_CONNECT * 2
 
+# Maximum number of connection attempts per second made by KnockScheduler
+KNOCK_RATE = 100
+
+# Seconds between knocks on the same host made by KnockScheduler
+KNOCK_INTERVAL = 2.0
+
 
 async def _async_knock(address: IPv4Address, port: int, timeout: float) -> None:
     """Open a connection to the device to wake a given host."""
@@ -77,3 +86,202 @@ async def knocker(
     two knocks.
     """
     return asyncio.ensure_future(knock(address, ports, timeout))
+
+
+class _KnockHost:  # pylint: disable=too-few-public-methods
+    """Knock state for a host in KnockScheduler."""
+
+    __slots__ = (
+        "address",
+        "ports",
+        "refs",
+        "deadline",
+        "next_knock",
+        "first_knock",
+        "tasks",
+    )
+
+    def __init__(self, address: IPv4Address, now: float) -> None:
+        """Initialize a new _KnockHost."""
+        self.address = address
+        self.ports: Dict[int, None] = {}  # Used as an ordered set
+        self.refs: int = 0
+        self.deadline: float = now
+        self.next_knock: float = now
+        self.first_knock: Optional[float] = None
+        self.tasks: Set[asyncio.Future] = set()
+
+
+class KnockScheduler:
+    """Knock on ports for many hosts, shared between everything that wants to knock.
+
+    Hosts are deduplicated, so a host added by several concurrent scans is only
+    knocked once per interval. Connection attempts are globally rate limited and
+    knocking on a host stops as soon as it responds (see `responded`), which is also
+    used to measure how long it took for a host to wake up.
+    """
+
+    def __init__(
+        self, rate: float = KNOCK_RATE, interval: float = KNOCK_INTERVAL
+    ) -> None:
+        """Initialize a new KnockScheduler."""
+        self.rate = rate
+        self.interval = interval
+        self.wake_latencies: Dict[IPv4Address, float] = {}
+        self._hosts: Dict[IPv4Address, _KnockHost] = {}
+        self._queue: List[Tuple[float, int, IPv4Address]] = []
+        self._counter = itertools.count()
+        self._tokens: float = rate
+        self._last_refill: float = 0.0
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Future] = None
+
+    @property
+    def hosts(self) -> Set[IPv4Address]:
+        """Return hosts currently being knocked on."""
+        return set(self._hosts)
+
+    def add(self, address: IPv4Address, ports: List[int], timeout: float) -> None:
+        """Start knocking on a set of ports for a host for a period of time.
+
+        Each call must be paired with a call to `remove` once knocking is no longer
+        needed.
+        """
+        now = asyncio.get_running_loop().time()
+        host = self._hosts.get(address)
+        if host is None:
+            host = self._hosts[address] = _KnockHost(address, now)
+            self._schedule(host, now)
+        host.refs += 1
+        host.ports.update(dict.fromkeys(ports))
+        host.deadline = max(host.deadline, now + timeout)
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+        self._wakeup.set()
+
+    def remove(self, address: IPv4Address) -> None:
+        """Release interest in knocking on a host."""
+        host = self._hosts.get(address)
+        if host is not None:
+            host.refs -= 1
+            if host.refs <= 0:
+                self._stop(host)
+
+    def responded(self, address: IPv4Address) -> None:
+        """Stop knocking on a host as it has responded."""
+        host = self._hosts.get(address)
+        if host is None:
+            return
+
+        if host.first_knock is not None and address not in self.wake_latencies:
+            latency = asyncio.get_running_loop().time() - host.first_knock
+            self.wake_latencies[address] = latency
+            _LOGGER.debug("Host %s responded %.3fs after first knock", address, latency)
+        self._stop(host)
+
+    def close(self) -> None:
+        """Stop knocking on all hosts."""
+        for host in list(self._hosts.values()):
+            self._stop(host)
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    def _schedule(self, host: _KnockHost, when: float) -> None:
+        host.next_knock = when
+        heapq.heappush(self._queue, (when, next(self._counter), host.address))
+
+    def _stop(self, host: _KnockHost) -> None:
+        if self._hosts.get(host.address) is host:
+            del self._hosts[host.address]
+        for task in host.tasks:
+            task.cancel()
+        self._wakeup.set()
+
+    async def _acquire(self, tokens: int) -> None:
+        loop = asyncio.get_running_loop()
+        tokens = min(tokens, int(self.rate))
+        while True:
+            now = loop.time()
+            self._tokens = min(
+                self.rate, self._tokens + (now - self._last_refill) * self.rate
+            )
+            self._last_refill = now
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return
+            await asyncio.sleep((tokens - self._tokens) / self.rate)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._last_refill = loop.time()
+        while self._hosts:
+            self._wakeup.clear()
+            if not self._queue:
+                await self._wakeup.wait()
+                continue
+
+            when, _, address = self._queue[0]
+            host = self._hosts.get(address)
+            if host is None or host.next_knock != when:
+                heapq.heappop(self._queue)
+                continue
+
+            delay = when - loop.time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(self._queue)
+            await self._acquire(len(host.ports))
+            if self._hosts.get(address) is not host:
+                continue
+
+            now = loop.time()
+            remaining = host.deadline - now
+            if remaining <= _KNOCK_TIMEOUT_BUFFER:
+                self._stop(host)
+                continue
+
+            self._knock(host, min(remaining, self.interval))
+            self._schedule(host, now + self.interval)
+
+    def _knock(self, host: _KnockHost, timeout: float) -> None:
+        if host.first_knock is None:
+            host.first_knock = asyncio.get_running_loop().time()
+
+        _LOGGER.debug("Knocking on %s (ports: %s)", host.address, list(host.ports))
+        task = asyncio.ensure_future(knock(host.address, list(host.ports), timeout))
+        host.tasks.add(task)
+
+        def _done(task: asyncio.Future) -> None:
+            host.tasks.discard(task)
+            if task.cancelled():
+                return
+
+            exc = task.exception()
+            if isinstance(exc, OSError):
+                _LOGGER.debug("Giving up knocking on %s: %s", host.address, exc)
+                self._stop(host)
+            elif exc is not None:
+                _LOGGER.error("Failed to knock on %s: %s", host.address, exc)
+
+        task.add_done_callback(_done)
+
+
+_SCHEDULERS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, KnockScheduler]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_scheduler() -> KnockScheduler:
+    """Return knock scheduler shared by everything running in the current loop."""
+    loop = asyncio.get_running_loop()
+    scheduler = _SCHEDULERS.get(loop)
+    if scheduler is None:
+        scheduler = _SCHEDULERS[loop] = KnockScheduler()
+    return scheduler
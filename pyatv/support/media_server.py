@@ -0,0 +1,292 @@
+"""Local web server sharing files with devices.
+
+When playing a local file with AirPlay, the device fetches the file over HTTP from a
+web server running in pyatv. A single server is shared by everything running in the
+same event loop and bound to the same local address (see `get_media_server`), so
+casting the same file to several devices does not start several servers. Every file is
+published under a random token, making only added files accessible.
+
+Devices seek a lot, so single byte ranges (Range and If-Range headers) are supported.
+File data is sent using sendfile (zero-copy) and connections are kept alive between
+requests.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from email.utils import formatdate
+import logging
+import mimetypes
+import os
+import re
+import secrets
+from typing import Callable, Dict, Mapping, Optional, Set, Tuple, Union
+from urllib.parse import quote
+import weakref
+
+from pyatv.support.http import (
+    AbstractHttpServerHandler,
+    BasicHttpServer,
+    HttpRequest,
+    HttpResponse,
+    HttpStreamResponse,
+    http_server,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_CONTENT_TYPE = "application/octet-stream"
+
+_RANGE_RE = re.compile(r"bytes=(\d*)-(\d*)$")
+
+
+@dataclass
+class MediaFile:
+    """File published by a MediaServer."""
+
+    path: str
+    token: str
+    content_type: str
+    users: int = 0
+    requests_served: int = 0
+    bytes_served: int = 0
+
+
+def _parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """Parse a Range header and return first and last byte (inclusive).
+
+    Raises ValueError if range cannot be satisfied. None is returned if header should
+    be ignored, e.g. if multiple ranges are requested (not supported).
+    """
+    match = _RANGE_RE.match(header.strip())
+    if not match:
+        return None
+
+    first, last = match.groups()
+    if not first:
+        # Suffix range, e.g. bytes=-500 (last 500 bytes)
+        if not last or int(last) == 0:
+            raise ValueError(f"unsatisfiable range: {header}")
+        return max(0, size - int(last)), size - 1
+
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or end < start:
+        raise ValueError(f"unsatisfiable range: {header}")
+    return start, end
+
+
+def _response(
+    code: int, message: str, headers: Optional[Dict[str, str]] = None
+) -> HttpResponse:
+    return HttpResponse("HTTP", "1.1", code, message, headers or {}, b"")
+
+
+class MediaServer(AbstractHttpServerHandler):
+    """Web server serving added files to devices.
+
+    The server is started when the first file is added and stopped when the last file
+    is removed. Files are reference counted, so adding the same file multiple times
+    (e.g. when casting to several devices) gives the same URL and the file stays
+    accessible until all users have removed it.
+    """
+
+    def __init__(self, address: str, port: int = 0) -> None:
+        """Initialize a new MediaServer instance."""
+        self._address = address
+        self._requested_port = port
+        self._port = port
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connections: Set[BasicHttpServer] = set()
+        self._files: Dict[str, MediaFile] = {}  # path -> file
+        self._tokens: Dict[str, MediaFile] = {}  # token -> file
+        self._lock = asyncio.Lock()
+        self.requests_served = 0
+        self.bytes_served = 0
+
+    @property
+    def address(self) -> str:
+        """Return local address server is bound to."""
+        return self._address
+
+    @property
+    def port(self) -> int:
+        """Return port server listens on (zero if not started)."""
+        return self._port if self._server else 0
+
+    @property
+    def files(self) -> Mapping[str, MediaFile]:
+        """Return published files (by path)."""
+        return self._files
+
+    def file_address(self, path: str) -> str:
+        """Return URL to a published file."""
+        media_file = self._files[os.path.realpath(path)]
+        name = quote(os.path.basename(media_file.path))
+        return f"http://{self._address}:{self.port}/{media_file.token}/{name}"
+
+    async def add_file(self, path: str) -> str:
+        """Publish a file and return URL to it."""
+        async with self._lock:
+            real_path = os.path.realpath(path)
+            if not os.path.isfile(real_path):
+                raise FileNotFoundError(f"no such file: {path}")
+
+            media_file = self._files.get(real_path)
+            if media_file is None:
+                content_type, _ = mimetypes.guess_type(real_path)
+                media_file = MediaFile(
+                    real_path,
+                    secrets.token_urlsafe(16),
+                    content_type or DEFAULT_CONTENT_TYPE,
+                )
+                self._files[real_path] = media_file
+                self._tokens[media_file.token] = media_file
+            media_file.users += 1
+
+            if self._server is None:
+                self._server, self._port = await http_server(
+                    self._create_connection, self._address, self._requested_port
+                )
+                _LOGGER.debug(
+                    "Started media server on %s:%d", self._address, self._port
+                )
+
+        return self.file_address(path)
+
+    async def remove_file(self, path: str) -> None:
+        """Stop publishing a file (when removed by all users)."""
+        async with self._lock:
+            media_file = self._files.get(os.path.realpath(path))
+            if media_file is None:
+                return
+
+            media_file.users -= 1
+            if media_file.users > 0:
+                return
+
+            del self._files[media_file.path]
+            del self._tokens[media_file.token]
+            _LOGGER.debug(
+                "Removed %s (served %d bytes in %d requests)",
+                media_file.path,
+                media_file.bytes_served,
+                media_file.requests_served,
+            )
+
+            if not self._files:
+                await self.close()
+
+    async def close(self) -> None:
+        """Stop the server and close all connections."""
+        if self._server is not None:
+            _LOGGER.debug("Closing media server on %s:%d", self._address, self._port)
+            self._server.close()
+            self._server = None
+        for connection in list(self._connections):
+            if connection.transport:
+                connection.transport.close()
+        self._connections.clear()
+
+    def _create_connection(self) -> BasicHttpServer:
+        connection = _MediaConnection(self, self._connections.discard)
+        self._connections.add(connection)
+        return connection
+
+    def handle_request(
+        self, request: HttpRequest
+    ) -> Optional[Union[HttpResponse, HttpStreamResponse]]:
+        """Handle incoming request."""
+        if request.method not in ("GET", "HEAD"):
+            return _response(405, "Method Not Allowed", {"Allow": "GET, HEAD"})
+
+        media_file = self._tokens.get(request.path.lstrip("/").split("/")[0])
+        if media_file is None:
+            return None
+
+        try:
+            stat = os.stat(media_file.path)
+        except OSError:
+            _LOGGER.exception("Failed to access %s", media_file.path)
+            return None
+
+        size = stat.st_size
+        headers: Dict[str, str] = {
+            "Content-Type": media_file.content_type,
+            "Accept-Ranges": "bytes",
+            "ETag": f'"{stat.st_mtime_ns:x}-{size:x}"',
+            "Last-Modified": formatdate(stat.st_mtime, usegmt=True),
+        }
+
+        try:
+            byte_range = self._requested_range(request, headers, size)
+        except ValueError:
+            headers["Content-Range"] = f"bytes */{size}"
+            return _response(416, "Range Not Satisfiable", headers)
+
+        if byte_range is None:
+            code, message, start, length = 200, "OK", 0, size
+        else:
+            start, end = byte_range
+            code, message, length = 206, "Partial Content", end - start + 1
+            headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+        headers["Content-Length"] = str(length)
+
+        self.requests_served += 1
+        media_file.requests_served += 1
+        if request.method == "HEAD" or length == 0:
+            return _response(code, message, headers)
+
+        # File is closed by BasicHttpServer once it has been sent
+        file = open(media_file.path, "rb")  # pylint: disable=consider-using-with
+        file.seek(start)
+        self.bytes_served += length
+        media_file.bytes_served += length
+        return HttpStreamResponse("HTTP", "1.1", code, message, headers, file)
+
+    @staticmethod
+    def _requested_range(
+        request: HttpRequest, headers: Mapping[str, str], size: int
+    ) -> Optional[Tuple[int, int]]:
+        range_header = request.headers.get("Range")
+        if not range_header:
+            return None
+
+        # Only honor range if file has not changed, otherwise send everything
+        if_range = request.headers.get("If-Range")
+        if if_range and if_range not in (headers["ETag"], headers["Last-Modified"]):
+            return None
+
+        return _parse_range(range_header, size)
+
+
+class _MediaConnection(BasicHttpServer):
+    """Connection to a MediaServer, kept alive until closed by either side."""
+
+    def __init__(
+        self, server: MediaServer, closed: Callable[[BasicHttpServer], None]
+    ) -> None:
+        """Initialize a new _MediaConnection instance."""
+        super().__init__(server)
+        self._closed = closed
+
+    def connection_lost(self, exc) -> None:
+        """Handle that connection was lost."""
+        super().connection_lost(exc)
+        self._closed(self)
+
+
+_ServersByAddress = Dict[str, MediaServer]
+
+_SERVERS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _ServersByAddress]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_media_server(address: str) -> MediaServer:
+    """Return media server bound to an address shared within the current loop."""
+    loop = asyncio.get_running_loop()
+    servers = _SERVERS.setdefault(loop, {})
+    server = servers.get(address)
+    if server is None:
+        server = servers[address] = MediaServer(address)
+    return server
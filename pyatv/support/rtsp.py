@@ -13,7 +13,12 @@ from typing import Any, Dict, Mapping, NamedTuple, Optional, Tuple, Union
 
 from pyatv.protocols.dmap import tags
 from pyatv.support import async_timeout
-from pyatv.support.http import HttpConnection, HttpResponse, decode_bplist_from_body
+from pyatv.support.http import (
+    HttpConnection,
+    HttpResponse,
+    StreamBody,
+    decode_bplist_from_body,
+)
 from pyatv.support.metadata import MediaMetadata
 
 _LOGGER = logging.getLogger(__name__)
@@ -230,9 +235,13 @@ class RtspSession:
         rtsp_session: int,
         rtpseq: int,
         rtptime: int,
-        artwork: bytes,
+        artwork: Union[bytes, StreamBody],
     ) -> HttpResponse:
-        """Change artwork for what is playing."""
+        """Change artwork for what is playing.
+
+        Artwork is written in chunks directly from the provided buffer (or stream)
+        rather than being copied into the message.
+        """
         return await self.exchange(
             "SET_PARAMETER",
             content_type="image/jpeg",
@@ -240,7 +249,7 @@ class RtspSession:
                 "Session": rtsp_session,
                 "RTP-Info": f"seq={rtpseq};rtptime={rtptime}",
             },
-            body=artwork,
+            body=memoryview(artwork) if isinstance(artwork, bytes) else artwork,
         )
 
     async def feedback(self, allow_error=False) -> HttpResponse:
@@ -257,7 +266,7 @@ class RtspSession:
         uri: Optional[str] = None,
         content_type: Optional[str] = None,
         headers: Optional[Mapping[str, object]] = None,
-        body: Optional[Union[str, bytes, dict]] = None,
+        body: Optional[Union[str, bytes, dict, StreamBody]] = None,
         allow_error: bool = False,
         protocol: str = "RTSP/1.0",
     ) -> HttpResponse:
@@ -0,0 +1,172 @@
+"""Outgoing message queue with backpressure and coalescing."""
+
+import asyncio
+import itertools
+import logging
+from typing import Callable, Dict, Generic, Hashable, Iterable, Optional, Tuple, TypeVar
+
+_LOGGER = logging.getLogger(__name__)
+
+MAX_WRITE_SIZE = 64 * 1024
+
+T = TypeVar("T")
+
+
+class SendQueue(Generic[T]):
+    """Queue of outgoing messages for a transport.
+
+    A message put in an empty queue is written immediately. Messages put after that
+    in the same loop iteration are written together in a single write once the event
+    loop gets a chance. When the transport asks to pause writing (see
+    `asyncio.Protocol.pause_writing`), messages are kept in the queue until writing
+    is resumed.
+
+    A message can be put with a coalesce key, in which case it replaces a queued
+    message with the same key. Use this for messages superseded by later ones, e.g.
+    volume changes or touch movements.
+
+    Messages are encoded right before they are written. This keeps encryption, which
+    relies on nonce counters, in the same order as messages appear on the wire.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        encode: Callable[[T], bytes],
+        max_write_size: int = MAX_WRITE_SIZE,
+    ) -> None:
+        """Initialize a new SendQueue instance."""
+        self.loop = loop
+        self._encode = encode
+        self._max_write_size = max_write_size
+        self._transport: Optional[asyncio.WriteTransport] = None
+        self._pending: Dict[Hashable, T] = {}
+        self._sequence = itertools.count()
+        self._flush_handle: Optional[asyncio.Handle] = None
+        self._paused = False
+        self.sent = 0
+        self.writes = 0
+        self.coalesced = 0
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        """Return number of queued messages."""
+        return len(self._pending)
+
+    @property
+    def paused(self) -> bool:
+        """Return if writing is paused by the transport."""
+        return self._paused
+
+    def attach(self, transport: asyncio.WriteTransport) -> None:
+        """Start writing messages to a transport."""
+        self._transport = transport
+        self._paused = False
+        self._schedule()
+
+    def detach(self) -> None:
+        """Stop writing to transport and drop all queued messages."""
+        if self._pending:
+            _LOGGER.debug("Dropping %d queued messages", len(self._pending))
+            self.dropped += len(self._pending)
+            self._pending = {}
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._transport = None
+        self._paused = False
+
+    def put(self, message: T, coalesce_key: Optional[Hashable] = None) -> None:
+        """Put a message in the queue.
+
+        If nothing is queued and writing is not paused, the message is written right
+        away to not add any latency.
+        """
+        if (
+            self._transport is not None
+            and not self._pending
+            and not self._paused
+            and self._flush_handle is None
+        ):
+            self._transport.write(self._encode(message))
+            self.writes += 1
+            self.sent += 1
+            # Messages put until the loop runs again are written together
+            self._flush_handle = self.loop.call_soon(self.flush)
+            return
+
+        self._enqueue(message, coalesce_key)
+        self._schedule()
+
+    def put_many(self, messages: Iterable[Tuple[T, Optional[Hashable]]]) -> None:
+        """Put several messages (with coalesce keys) in queue and write them at once."""
+        for message, coalesce_key in messages:
+            self._enqueue(message, coalesce_key)
+        self.flush()
+        self._schedule()
+
+    def _enqueue(self, message: T, coalesce_key: Optional[Hashable]) -> None:
+        if coalesce_key is None:
+            key: Hashable = next(self._sequence)
+        else:
+            # Wrap key in a tuple to never collide with sequence numbers. Removing
+            # the old message makes the new one end up last in queue.
+            key = (coalesce_key,)
+            if self._pending.pop(key, None) is not None:
+                self.coalesced += 1
+        self._pending[key] = message
+
+    def pause(self) -> None:
+        """Pause writing to transport."""
+        self._paused = True
+
+    def resume(self) -> None:
+        """Resume writing to transport."""
+        self._paused = False
+        self._schedule()
+
+    def flush(self, force: bool = False) -> None:
+        """Write queued messages to transport.
+
+        Writing stops if the transport asks to pause, unless `force` is set. Forcing
+        is used when all queued messages must be encoded immediately, e.g. before
+        changing encryption keys.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        if self._transport is None or not self._pending:
+            return
+
+        messages = list(self._pending.items())
+        self._pending = {}
+
+        index = 0
+        while index < len(messages) and (force or not self._paused):
+            chunks = []
+            size = 0
+            while index < len(messages) and size < self._max_write_size:
+                data = self._encode(messages[index][1])
+                chunks.append(data)
+                size += len(data)
+                index += 1
+
+            self._transport.write(b"".join(chunks))
+            self.writes += 1
+            self.sent += len(chunks)
+
+        # Writing was paused, put back what is left (keeping order)
+        if index < len(messages):
+            self._pending = dict(messages[index:])
+
+    def _schedule(self) -> None:
+        if self._flush_handle is None and not self._paused and self._pending:
+            self._flush_handle = self.loop.call_soon(self.flush)
+
+    def __str__(self) -> str:
+        """Return string representation of object."""
+        return (
+            f"depth={len(self)}, sent={self.sent}, writes={self.writes}, "
+            f"coalesced={self.coalesced}, dropped={self.dropped}"
+        )
@@ -1,12 +1,18 @@
 """State producer module."""
 
-from typing import Generic, Optional, TypeVar, cast
+from typing import Any, Generic, Optional, Set, TypeVar, cast
 import weakref
 
 NO_MAX_CALLS = 0
 
 StateListener = TypeVar("StateListener")
 
+_MISSING = object()
+
+
+def _noop(*args, **kwargs) -> None:
+    """Do nothing, returned in place of missing listener methods."""
+
 
 class _ListenerProxy:
     """Proxy to call functions in a listener.
@@ -16,36 +22,53 @@ class _ListenerProxy:
     a null-function (doing nothing) is returned so that nothing happens. This makes it
     safe to call functions without having to check if either a listener has been set at
     all or if the listener implements the called function.
+
+    One proxy is created per listener and reused for all calls. Bound methods are not
+    cached as they would keep the listener alive, but names missing in the listener
+    are remembered to not look them up again.
     """
 
-    def __init__(self, producer, listener: StateListener):
+    def __init__(
+        self,
+        producer: "weakref.ReferenceType[StateProducer]",
+        listener: Optional["weakref.ReferenceType[Any]"],
+    ):
         """Initialize a new ListenerProxy instance."""
         self.__producer = producer
-        self.__listener: StateListener = listener
+        self.__listener = listener
+        self.__missing: Set[str] = set()
 
     def __getattr__(self, attr):
         """Dynamically find target method in listener."""
         producer = self.__producer()
 
-        if producer:
+        if producer is not None:
             # Count number of calls to _any_ method and if total count exceeds the
             # given max limit, then bail out
             producer.calls_made += 1
             if producer.max_calls and producer.calls_made > producer.max_calls:
-                return lambda *args, **kwargs: None
+                return _noop
 
-        if self.__listener is not None:
-            listener = self.__listener()
-            if hasattr(listener, attr):
-                producer.state_was_updated()
-                return getattr(listener, attr)
-        else:
+        if self.__listener is None:
             # If no listener is set, still annonunce that state was changed. Setting
             # a listener is optional but the outcome of announcing a new state is still
             # likely expected to be the same no matter if a listener is set or not.
-            producer.state_was_updated()
+            if producer is not None:
+                producer.state_was_updated()
+            return _noop
+
+        listener = self.__listener()
+        if listener is None or attr in self.__missing:
+            return _noop
 
-        return lambda *args, **kwargs: None
+        method = getattr(listener, attr, _MISSING)
+        if method is _MISSING:
+            self.__missing.add(attr)
+            return _noop
+
+        if producer is not None:
+            producer.state_was_updated()
+        return method
 
 
 class StateProducer(Generic[StateListener]):
@@ -54,13 +77,14 @@ class StateProducer(Generic[StateListener]):
     def __init__(self, max_calls: int = NO_MAX_CALLS) -> None:
         """Initialize a new StateProducer instance."""
         self.__listener: Optional[weakref.ReferenceType[StateListener]] = None
+        self.__proxy = _ListenerProxy(weakref.ref(self), None)
         self.max_calls = max_calls
         self.calls_made = 0
 
     @property
     def listener(self) -> StateListener:
         """Return current listener object."""
-        return cast(StateListener, _ListenerProxy(weakref.ref(self), self.__listener))
+        return cast(StateListener, self.__proxy)
 
     @listener.setter
     def listener(self, target: StateListener) -> None:
@@ -69,6 +93,7 @@ class StateProducer(Generic[StateListener]):
         Set to None to remove active listener.
         """
         self.__listener = weakref.ref(target) if target is not None else None
+        self.__proxy = _ListenerProxy(weakref.ref(self), self.__listener)
 
     def state_was_updated(self) -> None:
         """Call when state was updated."""
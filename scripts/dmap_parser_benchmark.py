@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Measure time to parse a DMAP playstatus response and extract what is playing."""
+import argparse
+import timeit
+
+from pyatv.protocols.dmap import build_playing_instance, parser, tags
+from pyatv.protocols.dmap.tag_definitions import lookup_tag
+
+PLAYSTATUS = tags.container_tag(
+    "cmst",
+    tags.uint32_tag("mstt", 200)
+    + tags.uint32_tag("cmsr", 42)
+    + tags.uint8_tag("caps", 4)
+    + tags.uint8_tag("cash", 1)
+    + tags.uint8_tag("carp", 2)
+    + tags.uint8_tag("cafs", 0)
+    + tags.uint8_tag("cavs", 0)
+    + tags.uint8_tag("cavc", 1)
+    + tags.uint32_tag("caas", 2)
+    + tags.uint32_tag("caar", 6)
+    + tags.raw_tag("canp", b"\x00" * 16)
+    + tags.string_tag("cann", "Song title")
+    + tags.string_tag("cana", "Some artist")
+    + tags.string_tag("canl", "Some album")
+    + tags.string_tag("cang", "Some genre")
+    + tags.uint64_tag("asai", 123456789)
+    + tags.uint32_tag("cmmk", 2)
+    + tags.uint32_tag("cant", 120000)
+    + tags.uint32_tag("cast", 240000),
+)
+
+
+def _print(name, count, seconds):
+    print(f"{name:<32} {seconds / count * 1e6:8.2f} us/call")
+
+
+def main():
+    """Script starts here."""
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--count", type=int, default=20000, help="calls per test")
+    args = arg_parser.parse_args()
+
+    _print(
+        "parse(playstatus)",
+        args.count,
+        timeit.timeit(lambda: parser.parse(PLAYSTATUS, lookup_tag), number=args.count),
+    )
+    _print(
+        "build_playing_instance",
+        args.count,
+        timeit.timeit(
+            lambda: build_playing_instance(parser.parse(PLAYSTATUS, lookup_tag)),
+            number=args.count,
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Measure memory and task usage of DeviceManager with many fake devices."""
+import argparse
+import asyncio
+from ipaddress import IPv4Address
+import os
+import sys
+import time
+import tracemalloc
+
+from pyatv.conf import AppleTV, ManualService
+from pyatv.const import Protocol
+from pyatv.manager import DeviceManager
+
+sys.path.insert(0, os.path.dirname(os.path.realpath(__file__)) + "/..")  # noqa
+
+from tests.fake_device import (  # pylint: disable=wrong-import-position  # noqa
+    FakeAppleTV,
+)
+
+
+async def _start_fake_devices(loop, count):
+    devices = []
+    for _ in range(count):
+        fake_atv = FakeAppleTV(loop, test_mode=False)
+        fake_atv.add_service(Protocol.MRP)
+        await fake_atv.start()
+        devices.append(fake_atv)
+    return devices
+
+
+async def _measure(loop, count, concurrency):
+    fake_devices = await _start_fake_devices(loop, count)
+    tasks_before = len(asyncio.all_tasks())
+
+    tracemalloc.start()
+    start_time = time.monotonic()
+
+    manager = DeviceManager(loop, max_concurrent_connects=concurrency)
+    for index, fake_atv in enumerate(fake_devices):
+        config = AppleTV(IPv4Address("127.0.0.1"), f"Device {index}")
+        config.add_service(
+            ManualService(
+                f"mrp_{index}", Protocol.MRP, fake_atv.get_port(Protocol.MRP), {}
+            )
+        )
+        await manager.add(config)
+    await manager.wait_connected()
+
+    elapsed = time.monotonic() - start_time
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    tasks = len(asyncio.all_tasks()) - tasks_before
+
+    await manager.close()
+    for fake_atv in fake_devices:
+        await fake_atv.stop()
+
+    print(
+        f"{count:>5} devices: connect {elapsed:6.2f}s, "
+        f"memory {current / 1024 / 1024:7.2f} MiB (peak {peak / 1024 / 1024:7.2f}), "
+        f"tasks {tasks:>5} ({tasks / count:.1f}/device)"
+    )
+
+
+async def appstart(loop):
+    """Script starts here."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "counts", nargs="*", type=int, default=[10, 100, 500], help="device counts"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=10, help="concurrent handshakes"
+    )
+    args = parser.parse_args()
+
+    for count in args.counts:
+        await _measure(loop, count, args.concurrency)
+
+    return 0
+
+
+def main():
+    """Application start here."""
+
+    async def _run_application():
+        return await appstart(asyncio.get_running_loop())
+
+    try:
+        return asyncio.run(_run_application())
+    except KeyboardInterrupt:
+        pass
+
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
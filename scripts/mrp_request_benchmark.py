@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Measure MRP request round trip and throughput against a fake device."""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+from pyatv.auth.hap_srp import SRPAuthHandler
+from pyatv.conf import ManualService
+from pyatv.const import Protocol
+from pyatv.protocols.mrp import messages, protobuf
+from pyatv.protocols.mrp.connection import MrpConnection
+from pyatv.protocols.mrp.protocol import MrpProtocol
+from pyatv.settings import InfoSettings
+
+sys.path.insert(0, os.path.dirname(os.path.realpath(__file__)) + "/..")  # noqa
+
+from tests.fake_device import (  # pylint: disable=wrong-import-position  # noqa
+    FakeAppleTV,
+)
+
+
+def _request():
+    return messages.create(protobuf.GENERIC_MESSAGE)
+
+
+async def _sequential(protocol, count):
+    start_time = time.monotonic()
+    for _ in range(count):
+        await protocol.send_and_receive(_request())
+    return time.monotonic() - start_time
+
+
+async def _pipelined(protocol, count, window):
+    start_time = time.monotonic()
+    for offset in range(0, count, window):
+        await asyncio.gather(
+            *[
+                protocol.send_and_receive(_request())
+                for _ in range(min(window, count - offset))
+            ]
+        )
+    return time.monotonic() - start_time
+
+
+async def appstart(loop):
+    """Script starts here."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=5000, help="requests per run")
+    parser.add_argument("--window", type=int, default=100, help="requests in flight")
+    args = parser.parse_args()
+
+    fake_atv = FakeAppleTV(loop, test_mode=False)
+    fake_atv.add_service(Protocol.MRP)
+    await fake_atv.start()
+
+    port = fake_atv.get_port(Protocol.MRP)
+    service = ManualService("mrp_id", Protocol.MRP, port, {})
+    connection = MrpConnection("127.0.0.1", port, loop)
+    protocol = MrpProtocol(connection, SRPAuthHandler(), service, InfoSettings())
+    await protocol.start()
+
+    try:
+        elapsed = await _sequential(protocol, args.count)
+        print(
+            f"sequential: {elapsed / args.count * 1e6:8.1f} us/request, "
+            f"{args.count / elapsed:8.0f} requests/s"
+        )
+
+        elapsed = await _pipelined(protocol, args.count, args.window)
+        print(
+            f"pipelined ({args.window} in flight): "
+            f"{args.count / elapsed:8.0f} requests/s"
+        )
+    finally:
+        protocol.stop()
+        await fake_atv.stop()
+
+    return 0
+
+
+def main():
+    """Application start here."""
+
+    async def _run_application():
+        return await appstart(asyncio.get_running_loop())
+
+    try:
+        return asyncio.run(_run_application())
+    except KeyboardInterrupt:
+        pass
+
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -24,34 +24,70 @@ REUSED_MESSAGES = {"DEVICE_INFO_MESSAGE": "DEVICE_INFO_UPDATE_MESSAGE"}
 BASE_PATH = os.path.join("pyatv", "protocols", "mrp", "protobuf")
 OUTPUT_TEMPLATE = """\"\"\"Simplified extension handling for protobuf messages.
 
+Message modules are imported when first used to keep import time down.
+
 THIS CODE IS AUTO-GENERATED - DO NOT EDIT!!!
 \"\"\"
 
-from typing import Any
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 from .ProtocolMessage_pb2 import ProtocolMessage
 
+if TYPE_CHECKING:
+    {packages}
 
-{packages}
+    {messages}
 
 
-{messages}
+_MESSAGE_MODULES: dict[str, str] = {{
+    {message_modules}
+}}
 
 
-_EXTENSION_LOOKUP: dict[int, Any] = {{
+_EXTENSION_LOOKUP: dict[int, tuple[str, str]] = {{
     {extensions}
 }}
 
 
+_EXTENSIONS: dict[int, Any] = {{}}
+
+
 {constants}
 
 
+def __getattr__(name: str) -> Any:
+    \"\"\"Import message modules on first access.\"\"\"
+    if name.endswith("_pb2"):
+        try:
+            return import_module("." + name, __name__)
+        except ModuleNotFoundError:
+            pass
+    elif module_name := _MESSAGE_MODULES.get(name):
+        value = getattr(import_module("." + module_name, __name__), name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {{__name__}} has no attribute {{name}}")
+
+
 def extract_inner(message: ProtocolMessage):
     \"\"\"Extract inner message based on type.\"\"\"
-    if extension := _EXTENSION_LOOKUP.get(message.type, None):
-        return message.Extensions[extension]
-
-    raise Exception('unknown type: ' + str(message.type))
+    extension = _EXTENSIONS.get(message.type)
+    if extension is None:
+        if lookup := _EXTENSION_LOOKUP.get(message.type, None):
+            module_name, accessor = lookup
+            extension = getattr(import_module("." + module_name, __name__), accessor)
+            _EXTENSIONS[message.type] = extension
+        else:
+            raise Exception('unknown type: ' + str(message.type))
+
+    # If the message was parsed before the extension was imported, the inner message
+    # is stored as an unknown field. Parse it again to pick it up.
+    if not message.HasExtension(extension):
+        message.ParseFromString(message.SerializeToString())
+
+    return message.Extensions[extension]
 
 """
 
@@ -196,20 +232,23 @@ def generate_module_code():
     extensions = []
     constants = []
 
+    message_modules = []
+
     # Extract everything needed to generate output file
     for info in extract_message_info():
         message_names.add(info.title)
         packages.append("from . import " + info.module)
         messages.append(f"from .{info.module} import {info.title}")
+        message_modules.append(f'"{info.title}": "{info.module}",')
         extensions.append(
-            f"ProtocolMessage.{info.const}: {info.module}.{info.accessor},"
+            f'ProtocolMessage.{info.const}: ("{info.module}", "{info.accessor}"),'
         )
         constants.append(f"{info.const} = ProtocolMessage.{info.const}")
 
         reused = REUSED_MESSAGES.get(info.const)
         if reused:
             extensions.append(
-                f"ProtocolMessage.{reused}: {info.module}.{info.accessor},"
+                f'ProtocolMessage.{reused}: ("{info.module}", "{info.accessor}"),'
             )
             constants.append(f"{reused} = ProtocolMessage.{reused}")
 
@@ -218,10 +257,12 @@ def generate_module_code():
         if message_name not in message_names:
             message_names.add(message_name)
             messages.append(f"from .{module_name} import {message_name}")
+            message_modules.append(f'"{message_name}": "{module_name}",')
 
     return OUTPUT_TEMPLATE.format(
-        packages="\n".join(sorted(packages)),
-        messages="\n".join(sorted(messages)),
+        packages="\n    ".join(sorted(packages)),
+        messages="\n    ".join(sorted(messages)),
+        message_modules="\n    ".join(sorted(message_modules)),
         extensions="\n    ".join(sorted(extensions)),
         constants="\n".join(sorted(constants)),
     )
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Measure overhead of relaying calls through facade interfaces."""
+import argparse
+import asyncio
+import timeit
+
+from pyatv import interface
+from pyatv.const import Protocol
+from pyatv.core.facade import FacadeMetadata, FacadePushUpdater, FacadeRemoteControl
+
+
+class _RemoteControl(interface.RemoteControl):
+    async def up(self, action=interface.InputAction.SingleTap) -> None:
+        """Press key up."""
+
+
+class _Metadata(interface.Metadata):
+    @property
+    def device_id(self):
+        """Return a unique identifier for current device."""
+        return "id"
+
+
+class _PushUpdater(interface.PushUpdater):
+    @property
+    def active(self):
+        """Return if push updater has been started."""
+        return True
+
+    def start(self, initial_delay=0):
+        """Begin to listen to updates."""
+
+    def stop(self):
+        """No longer forward updates to listener."""
+
+
+class _PushListener(interface.PushListener):
+    def playstatus_update(self, updater, playstatus):
+        """Inform about changes to what is currently playing."""
+
+    def playstatus_error(self, updater, exception):
+        """Inform about an error when updating play status."""
+
+
+def _print(name, count, seconds):
+    print(f"{name:<32} {seconds / count * 1e9:8.0f} ns/call")
+
+
+async def appstart(count):
+    """Script starts here."""
+    remote_control = FacadeRemoteControl()
+    metadata = FacadeMetadata()
+    push_updater = FacadePushUpdater()
+
+    # Register a couple of protocols (low priority first) to resemble a device
+    for protocol in [Protocol.AirPlay, Protocol.Companion, Protocol.MRP]:
+        remote_control.register(_RemoteControl(), protocol)
+        metadata.register(_Metadata(), protocol)
+        push_updater.register(_PushUpdater(), protocol)
+    push_updater.listener = _PushListener()
+    updater = push_updater.main_instance
+    playing = interface.Playing()
+
+    _print(
+        "relay('up')",
+        count,
+        timeit.timeit(lambda: remote_control.relay("up"), number=count),
+    )
+    _print(
+        "metadata.device_id",
+        count,
+        timeit.timeit(lambda: metadata.device_id, number=count),
+    )
+    _print(
+        "push_updater.playstatus_update",
+        count,
+        timeit.timeit(
+            lambda: push_updater.playstatus_update(updater, playing), number=count
+        ),
+    )
+
+
+def main():
+    """Script starts here."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=200000, help="calls per test")
+    args = parser.parse_args()
+    asyncio.run(appstart(args.count))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Measure rate of listener notifications via StateProducer."""
+import argparse
+import timeit
+
+from pyatv.support.state_producer import StateProducer
+
+
+class _Listener:
+    def playstatus_update(self, updater, playstatus):
+        """Receive a notification."""
+
+
+class _Producer(StateProducer):
+    def __init__(self, listener=None):
+        super().__init__()
+        # Set here rather than on a StateProducer instance, as pylint would otherwise
+        # infer _Listener as listener type for every StateProducer
+        if listener is not None:
+            self.listener = listener
+
+
+def _print(name, count, seconds):
+    print(f"{name:<24} {count / seconds / 1e6:6.2f} M notifications/s")
+
+
+def main():
+    """Script starts here."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=500000, help="calls per test")
+    args = parser.parse_args()
+
+    listener = _Listener()
+    with_listener = _Producer(listener)
+    without_listener = _Producer()
+
+    _print(
+        "listener",
+        args.count,
+        timeit.timeit(
+            lambda: with_listener.listener.playstatus_update(None, None),
+            number=args.count,
+        ),
+    )
+    _print(
+        "missing method",
+        args.count,
+        timeit.timeit(
+            lambda: with_listener.listener.volume_update(None, None),
+            number=args.count,
+        ),
+    )
+    _print(
+        "no listener",
+        args.count,
+        timeit.timeit(
+            lambda: without_listener.listener.playstatus_update(None, None),
+            number=args.count,
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Unit tests for pyatv.auth.hap_srp."""
+
+import asyncio
+
+import pytest
+
+from pyatv.auth.hap_srp import KeyPool, SRPAuthHandler
+
+from tests.utils import until
+
+
+def test_key_pool_generates_when_empty():
+    pool = KeyPool(size=2)
+
+    keys = pool.take()
+
+    assert pool.misses == 1
+    assert pool.hits == 0
+    assert len(keys.auth_public) == 32
+    assert len(keys.verify_public) == 32
+
+
+def test_key_pool_fill():
+    pool = KeyPool(size=3)
+    pool.fill()
+
+    assert len(pool) == 3
+    pool.take()
+    assert pool.hits == 1
+    assert len(pool) == 2
+
+
+def test_key_pool_never_reuses_keys():
+    pool = KeyPool(size=2)
+    pool.fill()
+
+    public_keys = {pool.take().verify_public for _ in range(5)}
+
+    assert len(public_keys) == 5
+
+
+@pytest.mark.asyncio
+async def test_key_pool_refills_in_background():
+    pool = KeyPool(size=2)
+
+    pool.take()
+    assert len(pool) == 0
+
+    await until(lambda: len(pool) == 2)
+
+    pool.take()
+    assert pool.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_handlers_get_different_keys():
+    first = SRPAuthHandler().initialize()
+    await asyncio.sleep(0)
+    second = SRPAuthHandler().initialize()
+
+    assert first[0] != second[0]
+    assert first[1] != second[1]
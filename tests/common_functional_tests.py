@@ -167,7 +167,8 @@ class CommonFunctionalTests(AioHTTPTestCase):
         await self.atv.stream.play_url(data_path("testfile.txt"))
 
         self.assertRegex(
-            self.airplay_state.last_airplay_url, r"http://127.0.0.1:[0-9]+/testfile.txt"
+            self.airplay_state.last_airplay_url,
+            r"http://127.0.0.1:[0-9]+/[^/]+/testfile.txt",
         )
         self.assertEqual(self.airplay_state.last_airplay_start, 0)
         self.assertIsNotNone(self.airplay_state.last_airplay_uuid)
@@ -31,10 +31,6 @@ _LOGGER = logging.getLogger(__name__)
 Scanner = typing.Callable[..., typing.Awaitable[typing.List[BaseConfig]]]
 
 
-def pytest_configure(config):
-    config.addinivalue_line("markers", "use_heartbeat: enable MRP heart beata")
-
-
 @pytest.fixture(autouse=True)
 def stub_ifaddr():
     methods = {
@@ -56,24 +52,6 @@ def stub_sleep_fixture():
     unstub_sleep()
 
 
-# The heartbeat loop uses sleep between each heartbeat, which causes a hogging
-# loop in tests since sleep is stubbed. So always stub heartbeats in functional
-# tests and rely on unit tests (which can enable heartbeats via the use_heartbeats
-# marker in pytest).
-@pytest.fixture(autouse=True)
-def stub_heartbeat_loop(request):
-    if "use_heartbeat" not in request.keywords:
-
-        async def _stub_heartbeat_loop(*args, **kwargs):
-            _LOGGER.debug("Using stub for heartbeat")
-
-        with patch("pyatv.protocols.mrp.protocol.heartbeater") as mock_heartbeat:
-            mock_heartbeat.side_effect = _stub_heartbeat_loop
-            yield
-    else:
-        yield
-
-
 @pytest_asyncio.fixture
 async def session_manager():
     session_manager = await create_session()
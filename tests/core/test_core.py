@@ -4,6 +4,7 @@ from unittest.mock import ANY, MagicMock
 
 import pytest
 
+from pyatv.conf import AppleTV, ManualService
 from pyatv.const import Protocol
 from pyatv.core import (
     AbstractPushUpdater,
@@ -11,8 +12,12 @@ from pyatv.core import (
     ProtocolStateDispatcher,
     StateMessage,
     UpdatedState,
+    create_core,
 )
-from pyatv.interface import Playing
+from pyatv.interface import Metadata, Playing
+from pyatv.protocols import dmap
+from pyatv.protocols.mrp import MrpMetadata
+from pyatv.support.artwork_cache import ArtworkCache
 
 
 @pytest.fixture(name="state_dispatcher")
@@ -60,3 +65,20 @@ def test_post_ignore_duplicate_update(event_loop, state_dispatcher, updates):
     assert listener.playstatus_update.call_count == 1
     listener.playstatus_update.assert_called_once_with(ANY, playing)
     listener.state_updated.assert_called_once_with(playing)
+
+
+@pytest.mark.asyncio
+async def test_empty_artwork_cache_is_shared():
+    # An empty cache is falsy (has a length), make sure it is not replaced
+    cache = ArtworkCache()
+    config = AppleTV("127.0.0.1", "test")
+    service = ManualService("id", Protocol.DMAP, 3689, {})
+    config.add_service(service)
+
+    core = await create_core(config, service, artwork_cache=cache)
+    assert core.artwork_cache is cache
+
+    interfaces = next(iter(dmap.setup(core))).interfaces
+    assert interfaces[Metadata].artwork_cache is cache
+    assert MrpMetadata(None, None, None, None, cache).artwork_cache is cache
+    await core.session_manager.close()
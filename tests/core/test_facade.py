@@ -198,6 +198,15 @@ class SavingPushListener(PushListener):
         pass
 
 
+class SavingDiffPushListener(SavingPushListener):
+    def __init__(self):
+        super().__init__()
+        self.all_changes = []
+
+    def playstatus_diff(self, updater, playstatus: Playing, changes) -> None:
+        self.all_changes.append(changes)
+
+
 class SavingAudioListener(AudioListener):
     def __init__(self):
         self.last_update = None
@@ -316,6 +325,145 @@ async def test_ignore_already_connected_protocol(facade_dummy, register_interfac
     assert feat.get_feature(FeatureName.Pause).state == FeatureState.Unsupported
 
 
+async def test_try_next_implementation_if_connect_fails(
+    facade_dummy, register_interface
+):
+    _, sdg = register_interface(
+        FeatureName.Play, DummyFeatures(FeatureName.Play), Protocol.DMAP
+    )
+    sdg.connect_succeeded = False
+    register_interface(
+        FeatureName.Pause, DummyFeatures(FeatureName.Pause), Protocol.DMAP
+    )
+
+    await facade_dummy.connect()
+    feat = facade_dummy.features
+
+    assert feat.get_feature(FeatureName.Play).state == FeatureState.Unsupported
+    assert feat.get_feature(FeatureName.Pause).state == FeatureState.Available
+
+
+async def test_connect_protocols_concurrently(facade_dummy):
+    connecting: Set[Protocol] = set()
+    all_connecting = asyncio.Event()
+
+    def _add_protocol(protocol):
+        async def _connect():
+            connecting.add(protocol)
+            if len(connecting) == 2:
+                all_connecting.set()
+            await all_connecting.wait()
+            return True
+
+        sdg = SetupDataGenerator(protocol)
+        facade_dummy.add_protocol(sdg.get_setup_data()._replace(connect=_connect))
+
+    _add_protocol(Protocol.MRP)
+    _add_protocol(Protocol.DMAP)
+
+    # Would dead-lock if protocols were connected one after another
+    await asyncio.wait_for(facade_dummy.connect(), timeout=5)
+
+
+async def test_connect_protocol_after_dependencies(facade_dummy):
+    order: List[Protocol] = []
+
+    def _add_protocol(protocol, **kwargs):
+        async def _connect():
+            await asyncio.sleep(0)
+            order.append(protocol)
+            return True
+
+        sdg = SetupDataGenerator(protocol)
+        facade_dummy.add_protocol(
+            sdg.get_setup_data()._replace(connect=_connect, **kwargs)
+        )
+
+    _add_protocol(Protocol.AirPlay)
+    _add_protocol(Protocol.MRP, depends_on=frozenset([Protocol.AirPlay]))
+
+    await facade_dummy.connect()
+    assert order == [Protocol.AirPlay, Protocol.MRP]
+
+
+async def test_ignore_protocol_if_dependency_fails(facade_dummy):
+    airplay = SetupDataGenerator(Protocol.AirPlay)
+    airplay.connect_succeeded = False
+    mrp = SetupDataGenerator(Protocol.MRP)
+
+    facade_dummy.add_protocol(airplay.get_setup_data())
+    facade_dummy.add_protocol(
+        mrp.get_setup_data()._replace(depends_on=frozenset([Protocol.AirPlay]))
+    )
+
+    await facade_dummy.connect()
+    assert airplay.connect_called
+    assert not mrp.connect_called
+
+
+async def test_connect_ready_when_first_protocol_usable(facade_dummy):
+    dmap_connect = asyncio.Event()
+
+    async def _slow_connect():
+        await dmap_connect.wait()
+        return True
+
+    mrp = SetupDataGenerator(Protocol.MRP, FeatureName.Pause)
+    mrp.interfaces[Features] = DummyFeatures(FeatureName.Pause)
+    facade_dummy.add_protocol(mrp.get_setup_data())
+
+    dmap = SetupDataGenerator(Protocol.DMAP, FeatureName.Play)
+    dmap.interfaces[Features] = DummyFeatures(FeatureName.Play)
+    dmap.device_info = {DeviceInfo.BUILD_NUMBER: "123"}
+    facade_dummy.add_protocol(dmap.get_setup_data()._replace(connect=_slow_connect))
+
+    await facade_dummy.connect(wait_for_all_protocols=False)
+    feat = facade_dummy.features
+    assert feat.get_feature(FeatureName.Pause).state == FeatureState.Available
+    assert feat.get_feature(FeatureName.Play).state == FeatureState.Unsupported
+
+    dmap_connect.set()
+    await until(
+        lambda: feat.get_feature(FeatureName.Play).state == FeatureState.Available
+    )
+    assert facade_dummy.device_info.build_number == "123"
+
+
+async def test_close_while_protocols_connecting(facade_dummy):
+    never_connect = asyncio.Event()
+
+    async def _slow_connect():
+        await never_connect.wait()
+        return True
+
+    mrp = SetupDataGenerator(Protocol.MRP)
+    facade_dummy.add_protocol(mrp.get_setup_data())
+
+    dmap = SetupDataGenerator(Protocol.DMAP)
+    facade_dummy.add_protocol(dmap.get_setup_data()._replace(connect=_slow_connect))
+
+    await facade_dummy.connect(wait_for_all_protocols=False)
+    await asyncio.gather(*facade_dummy.close())
+
+    assert mrp.close_called
+    await until(lambda: dmap.close_called)
+
+
+async def test_connect_raises_protocol_error(facade_dummy):
+    async def _fail():
+        raise exceptions.ProtocolError("failed")
+
+    mrp = SetupDataGenerator(Protocol.MRP)
+    facade_dummy.add_protocol(mrp.get_setup_data()._replace(connect=_fail))
+
+    dmap = SetupDataGenerator(Protocol.DMAP)
+    facade_dummy.add_protocol(dmap.get_setup_data())
+
+    with pytest.raises(exceptions.ProtocolError):
+        await facade_dummy.connect()
+    assert dmap.connect_called
+
+
 async def test_features_feature_overlap_uses_priority(facade_dummy, register_interface):
     # Pause available for DMAP but not MRP -> pause is unavailable because MRP prio
     register_interface(
@@ -637,6 +785,27 @@ async def test_takeover_push_updates(
     await _perform_update(3, "mrp")
 
 
+async def test_push_updates_with_diff(
+    facade_dummy, register_interface, mrp_state_dispatcher
+):
+    listener = SavingDiffPushListener()
+    mrp_pusher = DummyPushUpdater(mrp_state_dispatcher)
+    register_interface(FeatureName.PushUpdates, mrp_pusher, Protocol.MRP)
+
+    await facade_dummy.connect()
+    push_updater = facade_dummy.push_updater
+    push_updater.listener = listener
+    push_updater.start()
+
+    mrp_pusher.post_update(Playing(title="title", position=1, hash="h"))
+    await until(lambda: len(listener.all_changes) == 1)
+    assert len(listener.all_changes[0]) == 16
+
+    mrp_pusher.post_update(Playing(title="title", position=2, hash="h"))
+    await until(lambda: len(listener.all_changes) == 2)
+    assert listener.all_changes[1] == {"position": 2}
+
+
 # All push updaters must be started and stopped in parallel, otherwise updates will
 # not be pushed when performing a takeover (as the protocol taken over was never
 # started)
@@ -264,3 +264,61 @@ def test_parse_ignore_duplicate_records():
     records = parser.table["service._abc._tcp.local"]
     assert mdns.QueryType.SRV in records
     assert len(records[mdns.QueryType.SRV]) == 1
+
+
+def test_parse_is_cached_until_new_records():
+    service_params = ("_abc._tcp.local", "service", [], 0, {})
+    message = dns_utils.add_service(dns.DnsMessage(), *service_params)
+
+    parser = mdns.ServiceParser()
+    parser.add_message(message)
+    parsed = parser.parse()
+    assert parser.parse() is parsed
+
+    # Duplicate records does not invalidate cache
+    parser.add_message(message)
+    assert parser.parse() is parsed
+
+
+def test_parse_updates_address_from_later_message():
+    service_params = ("_abc._tcp.local", "service", [], 123, {})
+    message = dns_utils.add_service(dns.DnsMessage(), *service_params)
+
+    parser = mdns.ServiceParser()
+    parsed = parser.add_message(message).parse()
+    assert parsed[0].address is None
+
+    address_message = dns.DnsMessage()
+    address_message.resources.append(
+        dns_utils.resource("service.local", mdns.QueryType.A, "10.0.0.1")
+    )
+    parsed = parser.add_message(address_message).parse()
+    assert len(parsed) == 1
+    assert parsed[0].address == IPv4Address("10.0.0.1")
+    assert parsed[0].port == 123
+
+
+def test_parse_keeps_service_order_across_messages():
+    service1_params = ("_abc._tcp.local", "service1", [], 0, {})
+    service2_params = ("_def._tcp.local", "service2", [], 0, {})
+
+    parser = mdns.ServiceParser()
+    parser.add_message(dns_utils.add_service(dns.DnsMessage(), *service1_params))
+    parser.add_message(dns_utils.add_service(dns.DnsMessage(), *service2_params))
+    parser.add_message(dns_utils.add_service(dns.DnsMessage(), *service1_params))
+
+    parsed = parser.parse()
+    assert len(parsed) == 2
+    dns_utils.assert_service(parsed[0], *service1_params)
+    dns_utils.assert_service(parsed[1], *service2_params)
+
+
+def test_parse_model_from_device_info():
+    service_params = ("_device-info._tcp.local", "service", [], 0, {"model": "J105"})
+    message = dns_utils.add_service(dns.DnsMessage(), *service_params)
+
+    parser = mdns.ServiceParser()
+    assert parser.model is None
+
+    parser.add_message(message)
+    assert parser.model == "J105"
@@ -1,8 +1,9 @@
 """Functional tests pyatv.core.mdns."""
 
 import asyncio
-from ipaddress import IPv4Address
+from ipaddress import IPv4Address, IPv4Network
 import logging
+import time
 import typing
 from unittest.mock import MagicMock, patch
 
@@ -186,6 +187,98 @@ async def test_unicast_includes_sleep_proxy_service(udns_server):
     assert proxy.port == 5678
 
 
+async def sweep(udns_server, addresses, service_names, timeout=1, **kwargs):
+    return [
+        response
+        async for response in mdns.unicast_sweep(
+            asyncio.get_running_loop(),
+            addresses,
+            service_names,
+            port=udns_server.port,
+            timeout=timeout,
+            **kwargs,
+        )
+    ]
+
+
+async def test_unicast_sweep_has_valid_service(udns_server):
+    responses = await sweep(udns_server, ["127.0.0.1"], [MEDIAREMOTE_SERVICE])
+    assert len(responses) == 1
+
+    address, resp = responses[0]
+    service = TEST_SERVICES.get(MEDIAREMOTE_SERVICE)
+    assert address == "127.0.0.1"
+    assert len(resp.services) == 1
+    assert resp.services[0].type == MEDIAREMOTE_SERVICE
+    assert resp.services[0].name == service.name
+    assert resp.services[0].port == service.port
+
+
+@pytest.mark.parametrize(
+    "service_count,expected_requests",
+    [
+        (1, 1),
+        (SERVICES_PER_REQUEST + 1, 2),
+    ],
+)
+async def test_unicast_sweep_multiple_requests(
+    service_count, expected_requests, udns_server
+):
+    await sweep(udns_server, ["127.0.0.1"], gen_test_services(service_count))
+    assert udns_server.request_count == expected_requests
+
+
+async def test_unicast_sweep_resend_if_no_response(udns_server):
+    udns_server.skip_count = 1
+    responses = await sweep(udns_server, ["127.0.0.1"], [MEDIAREMOTE_SERVICE], 3)
+    assert len(responses) == 1
+    assert len(responses[0][1].services) == 1
+
+
+async def test_unicast_sweep_no_response(udns_server):
+    udns_server.skip_count = 10
+    assert await sweep(udns_server, ["127.0.0.1"], [MEDIAREMOTE_SERVICE], 0.5) == []
+
+
+async def test_unicast_sweep_large_subnet_bounded_concurrency():
+    # Responder listening on all addresses receives requests sent to any loopback
+    # address, replying from 127.0.0.1 (responses are mapped by transaction id)
+    responder = fake_udns.FakeUdns(asyncio.get_running_loop(), dict(TEST_SERVICES))
+    await responder.start("0.0.0.0")
+
+    addresses = [str(addr) for addr in IPv4Network("127.0.0.0/22").hosts()]
+    active: typing.Set[str] = set()
+    max_active = 0
+
+    def _on_query(address):
+        nonlocal max_active
+        active.add(address)
+        max_active = max(max_active, len(active))
+
+    try:
+        start = time.monotonic()
+        responses = await sweep(
+            responder,
+            addresses,
+            [MEDIAREMOTE_SERVICE],
+            timeout=2,
+            concurrency=32,
+            on_query=_on_query,
+            on_finished=active.remove,
+        )
+        elapsed = time.monotonic() - start
+    finally:
+        responder.close()
+
+    assert len(responses) == len(addresses)
+    assert {address for address, _ in responses} == set(addresses)
+    assert all(len(resp.services) == 1 for _, resp in responses)
+    assert max_active == 32
+
+    # Worst case is ceil(hosts / concurrency) * timeout, but all hosts respond here
+    assert elapsed < 10
+
+
 async def test_multicast_no_response(udns_server, multicast_fastexit):
     multicast_fastexit(responses=0, requests=0)
 
@@ -296,3 +389,48 @@ async def test_multicast_device_model(udns_server, multicast_fastexit):
     )
 
     assert resp[0].model == "dummy"
+
+
+async def test_multicast_transport_reused_while_open(udns_server, multicast_fastexit):
+    multicast_fastexit(responses=1, requests=0)
+
+    loop = asyncio.get_running_loop()
+    transport = mdns.get_multicast_transport(loop)
+    await transport.open()
+
+    with patch("pyatv.support.net.mcast_socket") as mcast_socket:
+        for _ in range(2):
+            resp = await mdns.multicast(
+                loop, [MEDIAREMOTE_SERVICE], "127.0.0.1", udns_server.port
+            )
+            assert len(resp) == 1
+            assert transport.is_open
+
+        mcast_socket.assert_not_called()
+
+    transport.close()
+    assert not transport.is_open
+
+
+async def test_multicast_transport_closed_after_request(
+    udns_server, multicast_fastexit
+):
+    multicast_fastexit(responses=1, requests=0)
+
+    loop = asyncio.get_running_loop()
+    await mdns.multicast(loop, [MEDIAREMOTE_SERVICE], "127.0.0.1", udns_server.port)
+    assert not mdns.get_multicast_transport(loop).is_open
+
+
+async def test_multicast_transport_shared_by_concurrent_requests(
+    udns_server, multicast_fastexit
+):
+    multicast_fastexit(responses=1, requests=0)
+
+    loop = asyncio.get_running_loop()
+    responses = await asyncio.gather(
+        mdns.multicast(loop, [MEDIAREMOTE_SERVICE], "127.0.0.1", udns_server.port),
+        mdns.multicast(loop, [MEDIAREMOTE_SERVICE], "127.0.0.1", udns_server.port),
+    )
+    assert all(len(resp) == 1 for resp in responses)
+    assert not mdns.get_multicast_transport(loop).is_open
@@ -2,59 +2,70 @@
 
 import asyncio
 from functools import partial
-import math
-from typing import Any, Optional
+from typing import Any, List, Optional
 from unittest.mock import MagicMock
 
 import pytest
 import pytest_asyncio
 
-from pyatv.core.protocol import MessageDispatcher, heartbeater
+from pyatv.core.protocol import (
+    HEARTBEAT_COALESCE,
+    HEARTBEAT_JITTER,
+    Heartbeat,
+    HeartbeatScheduler,
+    MessageDispatcher,
+)
 
-from tests.utils import total_sleep_time, until
+from tests.utils import until
 
 pytestmark = pytest.mark.asyncio
 
 # heartbeat
 
+INTERVAL = 0.05
+
 
 class HeartbeatMonitor:
     def __init__(self) -> None:
-        self.task: Optional[asyncio.Task] = None
+        self.scheduler = HeartbeatScheduler()
+        self.heartbeat: Optional[Heartbeat] = None
         self.send_call_count: int = 0
+        self.send_times: List[float] = []
         self.send_event: asyncio.Event = asyncio.Event()
         self.send_message: Optional[Any] = None
         self.finish_called: bool = False
         self.failure_called: bool = False
         self.make_send_fail: bool = False
-
-    def start(self, message_factory=None, retries=0, interval=5):
-        self.task = asyncio.ensure_future(
-            heartbeater(
-                "name",
-                self.send,
-                self.finish,
-                self.failure,
-                message_factory=message_factory or (lambda: None),
-                retries=retries,
-                interval=interval,
-            )
+        self.block_send: bool = True
+
+    def start(self, message_factory=None, retries=0, interval=INTERVAL, **kwargs):
+        self.heartbeat = self.scheduler.schedule(
+            "name",
+            self.send,
+            self.finish,
+            self.failure,
+            message_factory=message_factory or (lambda: None),
+            retries=retries,
+            interval=interval,
+            **kwargs,
         )
 
     async def stop(self) -> None:
-        self.task.cancel()
-        await self.task
+        task = self.heartbeat.cancel()
+        if task:
+            await asyncio.gather(task, return_exceptions=True)
 
     def next_lap(self) -> None:
         self.send_event.set()
 
     async def send(self, message) -> None:
         self.send_call_count += 1
+        self.send_times.append(asyncio.get_running_loop().time())
         self.send_message = message
 
         if self.make_send_fail:
             raise Exception("send failed")
-        else:
+        elif self.block_send:
             await self.send_event.wait()
             self.send_event.clear()
 
@@ -86,6 +97,7 @@ async def test_failure_called_on_send_error(monitor):
 
     await until(lambda: monitor.failure_called)
     assert monitor.send_call_count == 1
+    assert not monitor.heartbeat.active
 
 
 async def test_finish_called_on_cancel(monitor):
@@ -96,36 +108,34 @@ async def test_finish_called_on_cancel(monitor):
 
     await until(lambda: monitor.finish_called)
     assert not monitor.failure_called
+    assert not monitor.heartbeat.active
 
 
 async def test_retry_before_failure(monitor):
     monitor.make_send_fail = True
-    monitor.start(retries=3, interval=5)
+    monitor.start(retries=3)
 
     await until(lambda: monitor.send_call_count == 4)
-    assert monitor.failure_called
+    await until(lambda: monitor.failure_called)
     assert not monitor.finish_called
 
 
-async def test_sleep_between_send(monitor):
-    monitor.start(interval=5)
-
-    await until(lambda: monitor.send_call_count == 1)
-    assert math.isclose(total_sleep_time(), 5)
-    monitor.next_lap()
+async def test_wait_interval_between_send(monitor):
+    monitor.block_send = False
+    monitor.start(initial_delay=0.0)
 
-    await until(lambda: monitor.send_call_count == 2)
-    assert math.isclose(total_sleep_time(), 10)
+    await until(lambda: monitor.send_call_count == 3)
+    first, second, third = monitor.send_times[:3]
+    assert second - first >= INTERVAL * (1.0 - HEARTBEAT_JITTER) - HEARTBEAT_COALESCE
+    assert third - second >= INTERVAL * (1.0 - HEARTBEAT_JITTER) - HEARTBEAT_COALESCE
 
 
-async def test_no_sleep_for_first_retry(monitor):
+async def test_no_delay_for_first_retry(monitor):
     monitor.make_send_fail = True
-    monitor.start(retries=1, interval=5)
+    monitor.start(retries=1, interval=60, initial_delay=0.0)
 
-    await until(lambda: monitor.send_call_count == 2)
-    monitor.next_lap()
     await until(lambda: monitor.failure_called)
-    assert math.isclose(total_sleep_time(), 5)
+    assert monitor.send_call_count == 2
 
 
 async def test_message_is_passed_to_send(monitor):
@@ -136,6 +146,46 @@ async def test_message_is_passed_to_send(monitor):
     assert monitor.send_message is message
 
 
+async def test_initial_heartbeats_are_spread(monitor):
+    loop = asyncio.get_running_loop()
+    heartbeats = [
+        monitor.scheduler.schedule(str(i), monitor.send, interval=60) for i in range(20)
+    ]
+
+    due_times = {heartbeat.due for heartbeat in heartbeats}
+    assert len(due_times) == 20
+    assert all(loop.time() + 29 < due <= loop.time() + 60 for due in due_times)
+
+    for heartbeat in heartbeats:
+        heartbeat.cancel()
+    monitor.start()
+
+
+async def test_skip_heartbeat_on_recent_traffic(monitor):
+    monitor.block_send = False
+    monitor.start(initial_delay=INTERVAL)
+
+    # Report traffic more often than the heartbeat interval, no heartbeat is sent
+    for _ in range(6):
+        monitor.heartbeat.touch()
+        await asyncio.wait(
+            [asyncio.ensure_future(asyncio.Event().wait())], timeout=INTERVAL / 4
+        )
+    assert monitor.send_call_count == 0
+
+    # Heartbeat is sent when traffic stops
+    await until(lambda: monitor.send_call_count == 1)
+
+
+async def test_one_timer_for_many_heartbeats(monitor):
+    for i in range(10):
+        monitor.scheduler.schedule(str(i), monitor.send, interval=60)
+    monitor.start()
+
+    assert len(monitor.scheduler) == 11
+    assert monitor.scheduler._timer is not None
+
+
 # MessageDispatcher
 
 
@@ -176,3 +226,132 @@ async def test_dispatch_with_filter():
 
     await asyncio.wait_for(asyncio.gather(*dispatcher.dispatch(1, 2)), 5.0)
     assert dispatched_value == 2
+
+
+async def test_dispatch_async_listener_runs_in_task():
+    dispatched = []
+
+    async def dispatch_func(message: int) -> None:
+        dispatched.append((message, asyncio.current_task() is not None))
+
+    dispatcher = MessageDispatcher[int, int]()
+    dispatcher.listen_to(1, dispatch_func)
+
+    await asyncio.wait_for(asyncio.gather(*dispatcher.dispatch(1, 123)), 5.0)
+    assert dispatched == [(123, True)]
+
+
+async def test_dispatch_to_sync_listener_is_called_soon():
+    dispatched = []
+
+    dispatcher = MessageDispatcher[int, int]()
+    dispatcher.listen_to(1, dispatched.append)
+
+    assert dispatcher.dispatch(1, 123) == []
+    assert dispatched == []
+
+    await until(lambda: dispatched == [123])
+
+
+async def test_dispatch_listener_continues_after_wait():
+    event = asyncio.Event()
+    steps = []
+
+    async def dispatch_func(message: int) -> None:
+        steps.append("started")
+        await event.wait()
+        await asyncio.sleep(0)
+        steps.append("finished")
+
+    dispatcher = MessageDispatcher[int, int]()
+    dispatcher.listen_to(1, dispatch_func)
+
+    tasks = dispatcher.dispatch(1, 1)
+    assert len(tasks) == 1
+    await until(lambda: steps == ["started"])
+
+    event.set()
+    await asyncio.wait_for(asyncio.gather(*tasks), 5.0)
+    assert steps == ["started", "finished"]
+
+
+async def test_dispatch_listener_gets_result_after_wait():
+    future = asyncio.get_running_loop().create_future()
+    results = []
+
+    async def dispatch_func(message: int) -> None:
+        try:
+            results.append(await future)
+        except ValueError as ex:
+            results.append(str(ex))
+
+    dispatcher = MessageDispatcher[int, int]()
+    dispatcher.listen_to(1, dispatch_func)
+
+    tasks = dispatcher.dispatch(1, 1)
+    future.set_result("result")
+    await asyncio.wait_for(asyncio.gather(*tasks), 5.0)
+
+    future = asyncio.get_running_loop().create_future()
+    tasks = dispatcher.dispatch(1, 1)
+    future.set_exception(ValueError("error"))
+    await asyncio.wait_for(asyncio.gather(*tasks), 5.0)
+
+    assert results == ["result", "error"]
+
+
+async def test_dispatch_cancel_waiting_listener():
+    cancelled = False
+
+    async def dispatch_func(message: int) -> None:
+        nonlocal cancelled
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+
+    dispatcher = MessageDispatcher[int, int]()
+    dispatcher.listen_to(1, dispatch_func)
+
+    tasks = dispatcher.dispatch(1, 1)
+    await asyncio.sleep(0)
+    tasks[0].cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert cancelled
+
+
+async def test_dispatch_listener_error_does_not_stop_others():
+    dispatched = []
+
+    async def failing_async(message: int) -> None:
+        raise Exception("fail")
+
+    def failing_sync(message: int) -> None:
+        raise Exception("fail")
+
+    dispatcher = MessageDispatcher[int, int]()
+    dispatcher.listen_to(1, failing_async)
+    dispatcher.listen_to(1, failing_sync)
+    dispatcher.listen_to(1, dispatched.append)
+
+    await asyncio.wait_for(asyncio.gather(*dispatcher.dispatch(1, 1)), 5.0)
+    await until(lambda: dispatched == [1])
+
+
+async def test_add_listener_while_dispatching():
+    dispatched = []
+    dispatcher = MessageDispatcher[int, int]()
+
+    def dispatch_func(message: int) -> None:
+        dispatched.append(("first", message))
+        dispatcher.listen_to(1, lambda message: dispatched.append(("second", message)))
+
+    dispatcher.listen_to(1, dispatch_func)
+
+    dispatcher.dispatch(1, 1)
+    await until(lambda: dispatched)
+    await asyncio.wait_for(asyncio.gather(*dispatcher.dispatch(1, 2)), 5.0)
+    await until(lambda: len(dispatched) == 3)
+    assert dispatched == [("first", 1), ("first", 2), ("second", 2)]
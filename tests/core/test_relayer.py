@@ -273,3 +273,28 @@ def test_get_all_instances():
     assert mrp in instances
     assert dmap in instances
     assert airplay in instances
+
+
+def test_register_after_relay_updates_resolution():
+    relayer = Relayer(BaseClass, [Protocol.MRP, Protocol.DMAP])
+    relayer.register(SubClass4("dmap"), Protocol.DMAP)
+
+    assert relayer.relay("no_args")() == "dmap"
+    with pytest.raises(exceptions.NotSupportedError):
+        relayer.relay("with_args")
+
+    relayer.register(SubClass1(), Protocol.MRP)
+
+    assert relayer.relay("no_args")() == "subclass1"
+    assert relayer.relay("with_args")(3) == 6
+
+
+def test_register_updates_main_instance():
+    relayer = Relayer(BaseClass, [Protocol.MRP, Protocol.DMAP])
+    relayer.register(SubClass4("dmap"), Protocol.DMAP)
+    assert relayer.main_protocol == Protocol.DMAP
+
+    instance = SubClass4("mrp")
+    relayer.register(instance, Protocol.MRP)
+    assert relayer.main_protocol == Protocol.MRP
+    assert relayer.main_instance == instance
@@ -147,6 +147,7 @@ class FakeRaopState:
         self.volume: float = INITIAL_VOLUME
         self.teardown_called: bool = False
         self.streaming_started: bool = False
+        self.connections: int = 0
 
     def is_supported(self, flag: RaopServiceFlags) -> bool:
         """Return if a feature is supported."""
@@ -367,7 +368,7 @@ class FakeRaopService(HttpSimpleRouter):
     async def start(self, start_web_server: bool):
         """Start the fake RAOP service."""
         self.server, self.port = await http_server(
-            lambda: BasicHttpServer(self), address="0.0.0.0"
+            self._new_connection, address="0.0.0.0"
         )
 
         local_addr = ("0.0.0.0", 0)
@@ -395,6 +396,10 @@ class FakeRaopService(HttpSimpleRouter):
             self._control_server.port,
         )
 
+    def _new_connection(self) -> BasicHttpServer:
+        self.state.connections += 1
+        return BasicHttpServer(self)
+
     async def cleanup(self):
         """Clean up resources used by fake RAOP service."""
         if self.server:
@@ -186,7 +186,7 @@ def create_response(
 ):
     msg = dns.DnsMessage().unpack(request)
 
-    resp = dns.DnsMessage()
+    resp = dns.DnsMessage(msg.msg_id)
     resp.flags = 0x0840
     resp.questions = msg.questions
 
@@ -247,9 +247,9 @@ class FakeUdns(asyncio.Protocol):
         self.sleep_proxy: bool = False
         self.request_count: int = 0
 
-    async def start(self):
+    async def start(self, address: str = "127.0.0.1"):
         self.server, _ = await self.loop.create_datagram_endpoint(
-            lambda: self, local_addr=("127.0.0.1", None)
+            lambda: self, local_addr=(address, None)
         )
         _LOGGER.debug("Starting fake UDNS server at port %d", self.port)
 
@@ -8,7 +8,7 @@ from pyatv.auth.hap_pairing import TRANSIENT_CREDENTIALS, parse_credentials
 from pyatv.auth.server_auth import CLIENT_CREDENTIALS
 from pyatv.const import Protocol
 from pyatv.exceptions import AuthenticationError
-from pyatv.protocols.airplay.auth import pair_verify
+from pyatv.protocols.airplay.auth import pair_verify, verify_connection
 from pyatv.support import http
 
 from tests.fake_device.airplay import DEVICE_CREDENTIALS
@@ -40,3 +40,15 @@ async def test_verify(airplay_conf, credentials, expectation):
     with expectation:
         await verifier.verify_credentials()
     connection.close()
+
+
+async def test_verified_connection_not_verified_again(airplay_conf):
+    connection = await http.http_connect(
+        str(airplay_conf.address), airplay_conf.get_service(Protocol.AirPlay).port
+    )
+    credentials = parse_credentials(DEVICE_CREDENTIALS)
+
+    verifier = await verify_connection(credentials, connection)
+
+    assert await verify_connection(credentials, connection) is verifier
+    connection.close()
@@ -1,10 +1,28 @@
 """Unit tests for pyatv.protocols.dmap.daap."""
 
+import asyncio
+
 import pytest
+import pytest_asyncio
 
 from pyatv import exceptions
 from pyatv.const import DeviceState, MediaType
-from pyatv.protocols.dmap.daap import media_kind, ms_to_s, playstate
+from pyatv.protocols.dmap import parser, tags
+from pyatv.protocols.dmap.daap import (
+    SESSION_RENEW_INTERVAL,
+    DaapRequester,
+    media_kind,
+    ms_to_s,
+    playstate,
+)
+from pyatv.support.http import (
+    AbstractHttpServerHandler,
+    BasicHttpServer,
+    HttpConnectionPool,
+    HttpRequest,
+    HttpResponse,
+    http_server,
+)
 
 # These are extracted from iTunes, see for instance:
 # http://www.blooming.no/wp-content/uploads/2013/03/ITLibMediaItem.h
@@ -129,3 +147,110 @@ def test_invalid_time():
     # Sometimes really large times are reported during buffering == this test
     # handles those special cases.
     assert 0 == ms_to_s(2**32 - 1)
+
+
+# REQUESTER TESTS
+
+
+class FakeDaapServer(AbstractHttpServerHandler):
+    def __init__(self):
+        self.session_id = 0
+        self.logins = 0
+        self.connections = set()
+        self.long_poll_done = asyncio.Event()
+
+    def handle_request(self, request: HttpRequest):
+        if request.path.startswith("/login"):
+            self.logins += 1
+            self.session_id += 1
+            return self._respond(
+                tags.container_tag("mlog", tags.uint32_tag("mlid", self.session_id))
+            )
+
+        if f"session-id={self.session_id}" not in request.path:
+            return HttpResponse("HTTP", "1.1", 403, "Forbidden", {}, b"")
+
+        if request.path.startswith("/long-poll"):
+            return asyncio.ensure_future(self._long_poll())
+        return self._respond(tags.string_tag("minm", request.path))
+
+    async def _long_poll(self):
+        await self.long_poll_done.wait()
+        return self._respond(tags.string_tag("minm", "done"))
+
+    @staticmethod
+    def _respond(body):
+        return HttpResponse("HTTP", "1.1", 200, "OK", {}, body)
+
+
+@pytest_asyncio.fixture(name="daap_server")
+async def daap_server_fixture():
+    handler = FakeDaapServer()
+
+    def _connection():
+        connection = BasicHttpServer(handler)
+        handler.connections.add(connection)
+        return connection
+
+    server, port = await http_server(_connection)
+    yield handler, port
+    server.close()
+
+
+@pytest_asyncio.fixture(name="requester")
+async def requester_fixture(daap_server):
+    pool = HttpConnectionPool()
+    requester = DaapRequester(pool, "127.0.0.1", daap_server[1], "0x0000000000001234")
+    yield requester
+    requester.close()
+    pool.close()
+
+
+@pytest.mark.asyncio
+async def test_commands_reuse_connection(daap_server, requester):
+    handler, _ = daap_server
+
+    await requester.login()
+    await asyncio.gather(*[requester.get(f"cmd{i}?[AUTH]") for i in range(5)])
+
+    assert handler.logins == 1
+    assert len(handler.connections) == 1
+
+
+@pytest.mark.asyncio
+async def test_long_poll_uses_separate_connection(daap_server, requester):
+    handler, _ = daap_server
+    await requester.login()
+
+    long_poll = asyncio.ensure_future(
+        requester.get("long-poll?[AUTH]", long_poll=True, timeout=0)
+    )
+    resp = await requester.get("cmd?[AUTH]")
+    assert not long_poll.done()
+    assert parser.first(resp, "minm") == "/cmd?session-id=1"
+
+    handler.long_poll_done.set()
+    assert parser.first(await long_poll, "minm") == "done"
+    assert len(handler.connections) == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_session_logs_in_once(daap_server, requester):
+    handler, _ = daap_server
+    await requester.login()
+    handler.session_id += 1  # Expire session on device
+
+    await asyncio.gather(*[requester.get(f"cmd{i}?[AUTH]") for i in range(3)])
+
+    assert handler.logins == 2
+
+
+@pytest.mark.asyncio
+async def test_idle_session_renewed(daap_server, requester):
+    handler, _ = daap_server
+    await requester.login()
+
+    requester._session_used -= SESSION_RENEW_INTERVAL + 1
+    resp = await requester.get("cmd?[AUTH]")
+    assert parser.first(resp, "minm") == "/cmd?session-id=2"
+    assert handler.logins == 2
@@ -98,6 +98,45 @@ def test_extract_simplified_container():
     assert 12 == parser.first(parsed, "cona", "conb", "uuu8")
 
 
+def test_first_only_searches_first_container():
+    in_data = tags.container_tag(
+        "cona", tags.uint8_tag("uuu8", 1)
+    ) + tags.container_tag(
+        "cona", tags.uint8_tag("uuu8", 2) + tags.uint16_tag("uu16", 3)
+    )
+    parsed = parser.parse(in_data, lookup_tag)
+    assert parser.first(parsed, "cona", "uuu8") == 1
+    assert parser.first(parsed, "cona", "uu16") is None
+
+
+def test_first_path_past_value_returns_value():
+    parsed = parser.parse(tags.uint8_tag("uuu8", 12), lookup_tag)
+    assert parser.first(parsed, "uuu8", "uu16") == 12
+
+
+def test_first_on_plain_list():
+    parsed = [{"cona": [{"uuu8": 12}]}]
+    assert parser.first(parsed, "cona", "uuu8") == 12
+    assert parser.first(parsed, "conb") is None
+
+
+def test_parse_many_siblings_and_deep_nesting():
+    siblings = b"".join(tags.uint8_tag("uuu8", i % 256) for i in range(5000))
+    parsed = parser.parse(tags.container_tag("cona", siblings), lookup_tag)
+    assert len(parser.first(parsed, "cona")) == 5000
+
+    nested = tags.uint8_tag("uuu8", 7)
+    for _ in range(2000):
+        nested = tags.container_tag("cona", nested)
+    parsed = parser.parse(nested, lookup_tag)
+    assert parser.first(parsed, *(["cona"] * 2000 + ["uuu8"])) == 7
+
+
+def test_parse_truncated_data_raises_exception():
+    with pytest.raises(exceptions.InvalidDmapDataError):
+        parser.parse(tags.uint8_tag("uuu8", 12)[0:6], lookup_tag)
+
+
 def test_ignore_value():
     elem = tags.uint8_tag("igno", 44)
     parsed = parser.parse(elem, lookup_tag)
@@ -0,0 +1,101 @@
+"""Unit tests for pyatv.protocols.dmap.updates."""
+
+import asyncio
+import math
+
+import pytest
+
+from pyatv.interface import Playing
+from pyatv.protocols.dmap import DmapPushUpdater
+from pyatv.protocols.dmap.updates import DmapUpdateScheduler, get_update_scheduler
+
+from tests.utils import total_sleep_time, until
+
+
+class FakeAppleTV:
+    def __init__(self, *responses):
+        self.playstatus_revision = 0
+        self.responses = list(responses)
+
+    async def playstatus(self, use_revision=False, timeout=None):
+        if not self.responses:
+            await asyncio.Event().wait()
+
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+
+        self.playstatus_revision = response
+        return Playing(title=str(response))
+
+
+class PushListener:
+    def __init__(self):
+        self.updates = []
+        self.errors = []
+
+    def playstatus_update(self, updater, playstatus):
+        self.updates.append(playstatus.title)
+
+    def playstatus_error(self, updater, exception):
+        self.errors.append(exception)
+
+
+def start_updater(apple_tv, dmap_state_dispatcher, name="dmap"):
+    listener = PushListener()
+    updater = DmapPushUpdater(apple_tv, dmap_state_dispatcher, listener, name=name)
+    updater.listener = listener
+    updater.start()
+    return updater, listener
+
+
+def test_backoff_grows_with_jitter():
+    scheduler = DmapUpdateScheduler(initial_backoff=1.0, max_backoff=10.0)
+
+    assert 0.5 <= scheduler.backoff(1) <= 1.0
+    assert 2.0 <= scheduler.backoff(3) <= 4.0
+    assert 5.0 <= scheduler.backoff(100) <= 10.0
+
+
+@pytest.mark.asyncio
+async def test_wait_spreads_polls():
+    scheduler = DmapUpdateScheduler(rate=20.0)
+
+    # Sleeps are stubbed, so waits are for 0.0, 0.05 and 0.1 seconds
+    await asyncio.gather(*[scheduler.wait(0.0) for _ in range(3)])
+    assert math.isclose(total_sleep_time(), 0.15, abs_tol=0.01)
+
+
+@pytest.mark.asyncio
+async def test_unchanged_revision_suppressed(dmap_state_dispatcher):
+    updater, listener = start_updater(FakeAppleTV(1, 1, 1, 2), dmap_state_dispatcher)
+
+    await until(lambda: updater.stats.polls == 4)
+    await until(lambda: listener.updates == ["1", "2"])
+    assert updater.stats.updates == 2
+    assert updater.stats.suppressed == 2
+    updater.stop()
+
+
+@pytest.mark.asyncio
+async def test_error_resets_revision_and_retries(dmap_state_dispatcher):
+    apple_tv = FakeAppleTV(1, Exception("error"), Exception("error"), 2)
+    updater, listener = start_updater(apple_tv, dmap_state_dispatcher)
+
+    await until(lambda: listener.updates == ["1", "2"])
+    assert len(listener.errors) == 2
+    assert updater.stats.errors == 2
+    assert updater.stats.polls == 2
+    updater.stop()
+
+
+@pytest.mark.asyncio
+async def test_stats_available_from_scheduler(dmap_state_dispatcher):
+    updater, _ = start_updater(FakeAppleTV(1), dmap_state_dispatcher, name="device")
+
+    await until(lambda: updater.stats.polls == 1)
+    assert get_update_scheduler().stats["device"] is updater.stats
+    assert updater.stats.last_latency >= 0.0
+
+    updater.stop()
+    assert "device" not in get_update_scheduler().stats
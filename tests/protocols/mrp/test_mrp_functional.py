@@ -7,6 +7,7 @@ import math
 from typing import Optional
 
 import pyatv
+from pyatv import exceptions
 from pyatv.conf import AppleTV, ManualService
 from pyatv.const import (
     DeviceModel,
@@ -21,6 +22,7 @@ from pyatv.const import (
     ShuffleState,
 )
 from pyatv.interface import OutputDevice
+from pyatv.protocols.mrp import CommandBatch
 from pyatv.protocols.mrp.protobuf import CommandInfo_pb2
 from pyatv.support.http import (
     BasicHttpServer,
@@ -489,6 +491,27 @@ class MRPFunctionalTest(common_functional_tests.CommonFunctionalTests):
         await self.atv.remote_control.play_pause()
         await until(lambda: self.state.last_button_pressed == "playpause")
 
+    async def test_send_batch(self):
+        batch = CommandBatch().key("up").key("select", InputAction.DoubleTap)
+        await self.atv.remote_control.get(Protocol.MRP).send_batch(batch)
+        self.assertEqual(self.state.last_button_pressed, "select")
+        self.assertEqual(self.state.last_button_action, InputAction.DoubleTap)
+
+        batch = CommandBatch().key("down").command(CommandInfo_pb2.NextTrack)
+        await self.atv.remote_control.get(Protocol.MRP).send_batch(batch)
+        self.assertEqual(self.state.last_button_pressed, "nextitem")
+
+    async def test_send_batch_command_error(self):
+        batch = CommandBatch().command(CommandInfo_pb2.Play)
+        batch.command(CommandInfo_pb2.LikeTrack)
+        with self.assertRaises(exceptions.CommandError):
+            await self.atv.remote_control.get(Protocol.MRP).send_batch(batch)
+        self.assertEqual(self.state.last_button_pressed, "play")
+
+    async def test_batch_does_not_support_hold(self):
+        with self.assertRaises(exceptions.NotSupportedError):
+            CommandBatch().key("select", InputAction.Hold)
+
     async def test_play_pause_emulation(self):
         self.usecase.example_video(paused=False)
         await self.playing(device_state=DeviceState.Playing)
@@ -3,14 +3,21 @@
 import datetime
 import math
 from typing import Any, Dict
-from unittest.mock import Mock, PropertyMock
+from unittest.mock import AsyncMock, Mock, PropertyMock
 
 import pytest
 
 from pyatv import exceptions
 from pyatv.core import UpdatedState
 from pyatv.interface import ClientSessionManager, OutputDevice
-from pyatv.protocols.mrp import MrpAudio, MrpMetadata, messages, player_state, protobuf
+from pyatv.protocols.mrp import (
+    MrpAudio,
+    MrpMetadata,
+    MrpPushUpdater,
+    messages,
+    player_state,
+    protobuf,
+)
 from pyatv.settings import InfoSettings
 
 from tests.utils import faketime
@@ -409,3 +416,31 @@ async def test_metadata_position_calculation(metadata, playing_metadata, player_
         player_state.playback_state = protobuf.PlaybackState.Playing
         playing_metadata["playbackRate"] = 0.0
         assert (await metadata.playing()).position == ELAPSED_TIME
+
+
+# MrpPushUpdater
+
+
+@pytest.mark.parametrize(
+    "fields,rebuilt",
+    [
+        ({"artworkAvailable"}, False),
+        (set(), False),
+        ({"artworkAvailable", "title"}, True),
+        ({player_state.PLAYBACK_STATE}, True),
+        (None, True),
+    ],
+)
+async def test_push_updater_only_rebuilds_on_relevant_changes(
+    metadata, mrp_state_dispatcher, fields, rebuilt
+):
+    metadata.playing = AsyncMock()
+    updater = MrpPushUpdater(metadata, Mock(), mrp_state_dispatcher)
+    updater.listener = Mock()
+
+    change = None
+    if fields is not None:
+        change = player_state.PlayerStateChange(Mock(), frozenset(fields))
+    await updater.state_updated(change)
+
+    assert metadata.playing.called == rebuilt
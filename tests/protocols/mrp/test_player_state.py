@@ -57,9 +57,11 @@ def listener(psm):
     class _StubListener:
         def __init__(self):
             self.call_count = 0
+            self.change = None
 
-        async def state_updated(self):
+        async def state_updated(self, change=None):
             self.call_count += 1
+            self.change = change
 
     listener_mock = _StubListener()
     psm.listener = listener_mock
@@ -461,3 +463,50 @@ async def test_set_default_supported_commands(psm, protocol_mock, listener):
 
     assert player.command_info(pb.CommandInfo_pb2.Play)
     assert listener.call_count == 2
+
+
+async def test_set_state_reports_changed_fields(psm, protocol_mock, listener):
+    msg = set_path(messages.create(pb.SET_STATE_MESSAGE))
+    msg = add_metadata_item(msg, identifier="id1", title="item", genre="rock")
+    pb.extract_inner(msg).playbackState = pb.PlaybackState.Playing
+    await protocol_mock.inject(msg)
+
+    assert listener.change.fields == {
+        player_state.PLAYBACK_STATE,
+        player_state.CONTENT_ITEM,
+        "title",
+        "genre",
+    }
+
+    await protocol_mock.inject(msg)
+    assert listener.change.fields == set()
+
+    msg = set_path(messages.create(pb.SET_STATE_MESSAGE))
+    msg = add_metadata_item(msg, identifier="id1", title="other", genre="rock")
+    await protocol_mock.inject(msg)
+    assert listener.change.fields == {"title"}
+
+
+async def test_content_item_update_reports_changed_fields(psm, protocol_mock, listener):
+    msg = set_path(messages.create(pb.SET_STATE_MESSAGE))
+    msg = add_metadata_item(msg, identifier="id1", title="item", elapsedTime=1.0)
+    msg = add_metadata_item(msg, identifier="id2", title="next")
+    pb.extract_inner(msg).playbackQueue.location = 0
+    await protocol_mock.inject(msg)
+
+    update_item = set_path(messages.create(pb.UPDATE_CONTENT_ITEM_MESSAGE))
+    item = pb.extract_inner(update_item).contentItems.add()
+    item.identifier = "id1"
+    item.metadata.title = "item"
+    item.metadata.elapsedTime = 2.0
+    await protocol_mock.inject(update_item)
+
+    assert listener.change.fields == {"elapsedTime"}
+    assert psm.get_player(pb.extract_inner(msg).playerPath).metadata.elapsedTime == 2.0
+
+    # Items not currently playing are merged but not reported
+    item.identifier = "id2"
+    item.metadata.title = "changed"
+    await protocol_mock.inject(update_item)
+
+    assert listener.change.fields == set()
@@ -1,25 +1,25 @@
 """Unittests for pyatv.protocols.mrp.protocol."""
 
 import asyncio
-from unittest.mock import MagicMock
+import math
+import subprocess
+import sys
 
 import pytest
 import pytest_asyncio
 
+from pyatv import exceptions
 from pyatv.auth.hap_srp import SRPAuthHandler
 from pyatv.conf import ManualService
 from pyatv.const import Protocol
 from pyatv.protocols.mrp.connection import MrpConnection
-from pyatv.protocols.mrp.protocol import (
-    HEARTBEAT_INTERVAL,
-    HEARTBEAT_RETRIES,
-    MrpProtocol,
-    heartbeat_loop,
-)
+from pyatv.protocols.mrp import messages, protobuf
+from pyatv.protocols.mrp.protocol import MrpProtocol, PendingRequests
 from pyatv.settings import InfoSettings
 
 from tests.fake_device import FakeAppleTV
-from tests.utils import total_sleep_time, until
+from tests.fake_device.mrp import DEVICE_UID
+from tests.utils import until
 
 
 @pytest_asyncio.fixture
@@ -42,8 +42,8 @@ async def mrp_protocol(mrp_atv):
 
 
 @pytest.mark.asyncio
-@pytest.mark.use_heartbeat
-async def test_heartbeat_loop(mrp_atv, mrp_protocol):
+async def test_heartbeat_loop(mrp_atv, mrp_protocol, monkeypatch):
+    monkeypatch.setattr("pyatv.protocols.mrp.protocol.HEARTBEAT_INTERVAL", 0.05)
     await mrp_protocol.start()
     mrp_protocol.enable_heartbeat()
 
@@ -52,12 +52,135 @@ async def test_heartbeat_loop(mrp_atv, mrp_protocol):
 
 
 @pytest.mark.asyncio
-async def test_heartbeat_fail_closes_connection(stub_sleep):
-    protocol = MagicMock()
-    protocol.send_and_receive.side_effect = Exception()
+async def test_heartbeat_fail_closes_connection(mrp_atv, mrp_protocol, monkeypatch):
+    monkeypatch.setattr("pyatv.protocols.mrp.protocol.HEARTBEAT_INTERVAL", 0.05)
+    await mrp_protocol.start()
+
+    async def _fail(*args, **kwargs):
+        raise Exception("heartbeat failed")
+
+    monkeypatch.setattr(mrp_protocol, "send_and_receive", _fail)
+    mrp_protocol.enable_heartbeat()
+
+    mrp_state = mrp_atv.get_state(Protocol.MRP)
+    await until(lambda: not mrp_state.clients)
+
+
+@pytest.mark.asyncio
+async def test_pipelined_requests(mrp_atv, mrp_protocol):
+    await mrp_protocol.start()
+
+    futures = [
+        mrp_protocol.send_request(messages.create(protobuf.GENERIC_MESSAGE))
+        for _ in range(50)
+    ]
+    responses = await asyncio.gather(*futures)
+
+    assert len({response.identifier for response in responses}) == 50
+    assert mrp_atv.get_state(Protocol.MRP).heartbeat_count == 50
+    assert len(mrp_protocol._outstanding) == 0
+
+
+@pytest.mark.asyncio
+async def test_request_timeout(mrp_atv, mrp_protocol):
+    await mrp_protocol.start()
+
+    # Fake device does not respond to unknown messages
+    with pytest.raises(asyncio.TimeoutError):
+        await mrp_protocol.send_and_receive(
+            messages.create(protobuf.ProtocolMessage.UNKNOWN_MESSAGE), timeout=0.05
+        )
+
+    assert len(mrp_protocol._outstanding) == 0
+
+
+@pytest.mark.asyncio
+async def test_stop_fails_pending_requests(mrp_atv, mrp_protocol):
+    await mrp_protocol.start()
+
+    future = mrp_protocol.send_request(
+        messages.create(protobuf.ProtocolMessage.UNKNOWN_MESSAGE)
+    )
+    mrp_protocol.stop()
+
+    with pytest.raises(exceptions.ConnectionLostError):
+        await future
+
+
+@pytest.mark.asyncio
+async def test_pending_requests_expire_in_deadline_order():
+    pending = PendingRequests()
+
+    slow = pending.add("slow", 0.2)
+    fast = pending.add("fast", 0.01)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await fast
+    assert not slow.done()
+
+    assert pending.resolve("slow", protobuf.ProtocolMessage())
+    assert (await slow) is not None
+    assert not pending.resolve("slow", protobuf.ProtocolMessage())
+    assert len(pending) == 0
+
+
+@pytest.mark.asyncio
+async def test_send_batch_with_one_write(mrp_atv, mrp_protocol, monkeypatch):
+    await mrp_protocol.start()
+
+    writes = []
+    transport = mrp_protocol.connection._transport
+    real_write = transport.write
+
+    def _write(data):
+        writes.append(data)
+        real_write(data)
+
+    monkeypatch.setattr(transport, "write", _write)
+
+    futures = mrp_protocol.send_batch(
+        [
+            (messages.create(protobuf.GENERIC_MESSAGE), True),
+            (messages.create(protobuf.GENERIC_MESSAGE), False),
+            (messages.create(protobuf.GENERIC_MESSAGE), True),
+        ]
+    )
+    responses = await asyncio.gather(*futures)
+
+    assert len(writes) == 1
+    assert len(responses) == 2
+    await until(lambda: mrp_atv.get_state(Protocol.MRP).heartbeat_count == 3)
+
+
+@pytest.mark.asyncio
+async def test_coalesce_volume_changes(mrp_atv, mrp_protocol):
+    await mrp_protocol.start()
+
+    for level in [0.1, 0.2, 0.3]:
+        await mrp_protocol.send(messages.set_volume(DEVICE_UID, level))
+
+    # First change is written immediately, the following two are coalesced
+    assert mrp_protocol.connection.send_queue.coalesced == 1
+    await until(
+        lambda: math.isclose(mrp_atv.get_state(Protocol.MRP).volume, 0.3, abs_tol=1e-6)
+    )
+
+
+def test_extract_inner_after_parse_without_extension():
+    # Parse in a new interpreter, where the extension has not been imported yet
+    code = (
+        "import sys; from pyatv.protocols.mrp import protobuf; "
+        "message = protobuf.ProtocolMessage(); "
+        "message.ParseFromString(bytes.fromhex(sys.argv[1])); "
+        "print(protobuf.extract_inner(message).outputDeviceUID)"
+    )
+    data = messages.set_volume(DEVICE_UID, 0.5).SerializeToString()
 
-    await heartbeat_loop(protocol)
-    assert protocol.send_and_receive.call_count == 1 + HEARTBEAT_RETRIES
-    assert total_sleep_time() == HEARTBEAT_INTERVAL
+    result = subprocess.run(
+        [sys.executable, "-c", code, data.hex()],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
 
-    protocol.connection.close.assert_called_once()
+    assert result.stdout.strip() == DEVICE_UID
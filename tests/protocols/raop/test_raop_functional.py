@@ -374,7 +374,14 @@ async def test_sync_packets(raop_client, raop_state):
 @pytest.mark.parametrize(
     "raop_properties,feedback_supported", [({"et": "0"}, True), ({"et": "0"}, False)]
 )
-async def test_send_feedback(raop_client, raop_usecase, raop_state, feedback_supported):
+async def test_send_feedback(
+    raop_client, raop_usecase, raop_state, feedback_supported, monkeypatch
+):
+    # Keep-alive is sent by a timer (not affected by stubbed sleep), so use a short
+    # interval to get more than one feedback while streaming
+    monkeypatch.setattr(
+        "pyatv.protocols.raop.protocols.airplayv1.KEEP_ALIVE_INTERVAL", 0.001
+    )
     raop_usecase.feedback_enabled(feedback_supported)
 
     await raop_client.stream.stream_file(data_path("audio_3_packets.wav"))
@@ -538,6 +545,16 @@ async def test_teardown_called_after_playback(raop_client, raop_state):
     assert raop_state.teardown_called
 
 
+@pytest.mark.parametrize("raop_properties", [{"et": "0", "md": "0,1"}])
+async def test_stream_twice_reuses_connection(raop_client, raop_state):
+    await raop_client.stream.stream_file(data_path("only_metadata.wav"))
+    raop_state.teardown_called = False
+
+    await raop_client.stream.stream_file(data_path("only_metadata.wav"))
+    assert raop_state.teardown_called
+    assert raop_state.connections == 1
+
+
 @pytest.mark.parametrize("raop_properties", [{"et": "0", "md": "0,1"}])
 async def test_custom_metadata(raop_client, raop_state):
     metadata = MediaMetadata(title="A", artist="B", album="C", artwork=b"abcd")
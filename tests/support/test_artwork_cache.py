@@ -0,0 +1,126 @@
+"""Unit tests for pyatv.support.artwork_cache."""
+
+import io
+import os
+
+import pytest
+
+from pyatv.interface import ArtworkInfo
+from pyatv.support import artwork_cache
+from pyatv.support.artwork_cache import ArtworkCache
+
+pytestmark = pytest.mark.asyncio
+
+
+def _artwork(size, width=-1, height=-1):
+    return ArtworkInfo(
+        bytes=b"a" * size, mimetype="image/png", width=width, height=height
+    )
+
+
+async def test_get_missing_artwork():
+    cache = ArtworkCache()
+
+    assert await cache.get("id", 100, 100) is None
+    assert cache.misses == 1
+    assert cache.hit_rate == 0.0
+
+
+async def test_keyed_by_size():
+    cache = ArtworkCache()
+    artwork = _artwork(10)
+    await cache.put("id", 100, None, artwork)
+
+    assert await cache.get("id", 100, None) == artwork
+    assert await cache.get("id", 200, None) is None
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert cache.hit_rate == 0.5
+    assert "id" in cache
+
+
+async def test_bounded_by_bytes():
+    cache = ArtworkCache(max_bytes=25)
+    await cache.put("id1", None, None, _artwork(10))
+    await cache.put("id2", None, None, _artwork(10))
+
+    # Use id1 so that id2 is least recently used
+    await cache.get("id1", None, None)
+    await cache.put("id3", None, None, _artwork(10))
+
+    assert "id1" in cache
+    assert "id2" not in cache
+    assert "id3" in cache
+    assert cache.size == 20
+
+
+async def test_artwork_larger_than_cache_not_stored():
+    cache = ArtworkCache(max_bytes=5)
+    await cache.put("id", None, None, _artwork(10))
+
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
+async def test_replace_artwork_updates_size():
+    cache = ArtworkCache()
+    await cache.put("id", None, None, _artwork(10))
+    await cache.put("id", None, None, _artwork(4))
+
+    assert len(cache) == 1
+    assert cache.size == 4
+
+
+async def test_disk_tier_persists(tmp_path):
+    directory = str(tmp_path / "artwork")
+    artwork = _artwork(10, width=100, height=50)
+    await ArtworkCache(directory=directory).put("id", 100, None, artwork)
+
+    cache = ArtworkCache(directory=directory)
+    assert await cache.get("id", 100, None) == artwork
+    assert cache.disk_hits == 1
+
+    # Loaded into memory after disk hit
+    assert await cache.get("id", 100, None) == artwork
+    assert cache.hits == 1
+
+
+async def test_disk_tier_bounded_by_bytes(tmp_path):
+    cache = ArtworkCache(directory=str(tmp_path), max_disk_bytes=150)
+    await cache.put("id1", None, None, _artwork(100))
+    await cache.put("id2", None, None, _artwork(100))
+
+    assert len(os.listdir(tmp_path)) == 1
+
+    cache.clear()
+    assert await cache.get("id2", None, None) is not None
+    assert await cache.get("id1", None, None) is None
+
+
+async def test_no_scaling_without_image_library(monkeypatch):
+    monkeypatch.setattr(artwork_cache, "Image", None)
+    cache = ArtworkCache()
+    await cache.put("id", 200, 200, _artwork(10, width=200, height=200))
+
+    assert await cache.get("id", 100, 100) is None
+
+
+async def test_scale_larger_artwork():
+    image_module = pytest.importorskip("PIL.Image")
+
+    output = io.BytesIO()
+    image_module.new("RGB", (200, 100)).save(output, format="PNG")
+    artwork = ArtworkInfo(
+        bytes=output.getvalue(), mimetype="image/png", width=200, height=100
+    )
+
+    cache = ArtworkCache()
+    await cache.put("id", 200, None, artwork)
+
+    scaled = await cache.get("id", 100, None)
+    assert scaled.width == 100
+    assert scaled.height == 50
+    assert cache.scaled_hits == 1
+
+    # Never upscale
+    assert await cache.get("id", 400, None) is None
@@ -2,22 +2,33 @@
 
 import asyncio
 import inspect
+import io
 import logging
 from typing import Optional, Tuple
 from unittest.mock import MagicMock, patch
 
+from aiohttp import ClientSession
 from deepdiff import DeepDiff
 import pytest
+import pytest_asyncio
 
 from pyatv import exceptions
 from pyatv.support.http import (
+    MAX_BODY_SIZE,
     SERVER_NAME,
+    STREAM_CHUNK_SIZE,
     USER_AGENT,
     BasicHttpServer,
+    ClientSessionManager,
+    HttpConnectionPool,
+    HttpParser,
     HttpRequest,
     HttpResponse,
     HttpSession,
     HttpSimpleRouter,
+    HttpStreamResponse,
+    _create_request,
+    _create_response,
     format_request,
     format_response,
     http_connect,
@@ -27,6 +38,8 @@ from pyatv.support.http import (
 )
 from pyatv.support.net import unused_port
 
+from tests.utils import until
+
 _LOGGER = logging.getLogger(__name__)
 
 # HTTP MESSAGE PARSING
@@ -127,6 +140,73 @@ def test_parse_response_ignore_header_case():
     assert rest == b"extra"
 
 
+def test_parse_response_bad_first_line():
+    with pytest.raises(ValueError):
+        parse_response(b"HTTP/1.0 abc OK\r\n\r\n")
+
+
+# INCREMENTAL PARSING
+
+RESPONSES = (
+    b"HTTP/1.0 200 OK\r\nA: B\r\n\r\n"
+    b"HTTP/1.0 200 OK\r\nContent-Length: 2\r\n\r\nAB"
+    b"RTSP/1.0 404 Not Found\r\nContent-Length: 4\r\n"
+    b"Content-Type: application/octet-stream\r\n\r\nbody"
+)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 16, len(RESPONSES)])
+def test_parser_responses_split_in_chunks(chunk_size):
+    parser = HttpParser(_create_response)
+
+    responses = []
+    for i in range(0, len(RESPONSES), chunk_size):
+        responses += parser.feed(RESPONSES[i : i + chunk_size])
+
+    assert len(responses) == 3
+    assert responses[0].headers["A"] == "B"
+    assert responses[0].body == ""
+    assert responses[1].body == "AB"
+    assert responses[2].protocol == "RTSP"
+    assert responses[2].code == 404
+    assert responses[2].message == "Not Found"
+    assert responses[2].body == b"body"
+
+
+def test_parser_keeps_partial_message():
+    parser = HttpParser(_create_request)
+
+    assert parser.feed(b"GET /test HTTP/1.1\r\nContent-Length: 4\r\n\r\nbo") == []
+    assert parser.feed(b"dyPOST /a") == [
+        HttpRequest("GET", "/test", "HTTP", "1.1", {"Content-Length": "4"}, "body")
+    ]
+    request = parser.feed(b" RTSP/1.0\r\n\r\n")[0]
+    assert request.method == "POST"
+    assert request.protocol == "RTSP"
+
+
+def test_parser_reset_drops_partial_message():
+    parser = HttpParser(_create_response)
+    parser.feed(b"HTTP/1.1 200 OK\r\nContent-Length: 10\r\n\r\nabc")
+
+    parser.reset()
+
+    assert parser.feed(b"HTTP/1.1 204 No Content\r\n\r\n")[0].code == 204
+
+
+def test_parser_bad_first_line():
+    parser = HttpParser(_create_request)
+    with pytest.raises(ValueError):
+        parser.feed(b"GET\r\n\r\n")
+
+
+@pytest.mark.parametrize("length", ["abc", "-1", str(MAX_BODY_SIZE + 1)])
+def test_parser_bad_content_length(length):
+    parser = HttpParser(_create_response)
+    with pytest.raises(ValueError):
+        parser.feed(f"HTTP/1.1 200 OK\r\nContent-Length: {length}\r\n\r\n".encode())
+
+
 @pytest.mark.parametrize(
     "response,expected",
     [
@@ -273,6 +353,21 @@ async def test_server_request_single_file():
     server.close()
 
 
+@pytest.mark.asyncio
+async def test_server_rejects_too_large_body():
+    handler = MagicMock()
+    server, port = await serve(handler)
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+    writer.write(b"POST / HTTP/1.1\r\nContent-Length: 100000000000\r\n\r\n")
+    response = await asyncio.wait_for(reader.read(), 5.0)  # Until closed
+
+    assert response.startswith(b"HTTP/1.1 413 Payload too large\r\n")
+    handler.handle_request.assert_not_called()
+    writer.close()
+    server.close()
+
+
 @pytest.mark.asyncio
 async def test_server_bad_handler_gives_error():
     def _handle_page(request: HttpRequest):
@@ -361,6 +456,40 @@ async def test_server_process_sent():
     server.close()
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "body_factory",
+    [
+        memoryview,
+        io.BytesIO,
+    ],
+)
+async def test_server_stream_response(body_factory):
+    data = bytes(range(256)) * (STREAM_CHUNK_SIZE // 128)
+
+    def _handle_page(request: HttpRequest):
+        return HttpStreamResponse(
+            "HTTP",
+            "1.1",
+            200,
+            "OK",
+            {"Content-Type": "application/octet-stream"},
+            body_factory(data),
+        )
+
+    client, server = await serve_and_connect(_handle_page)
+
+    resp = await client.get("/")
+    assert int(resp.headers["Content-Length"]) == len(data)
+    assert resp.body == data
+
+    # Responses must still be sent in order after a stream response
+    resp = await client.get("/")
+    assert resp.body == data
+
+    server.close()
+
+
 @pytest.mark.asyncio
 async def test_server_async_handler():
     class TestRouter(HttpSimpleRouter):
@@ -494,3 +623,263 @@ async def test_connection_abort_timeout_if_connection_closed():
     for task in tasks:
         with pytest.raises(exceptions.ConnectionLostError):
             await task
+
+
+@pytest.mark.asyncio
+async def test_connection_too_large_response_body():
+    async def _server(reader, writer):
+        await reader.read(1024)
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 100000000000\r\n\r\n")
+
+    port = unused_port()
+    server = await asyncio.start_server(_server, "127.0.0.1", port)
+    connection = await http_connect("127.0.0.1", port)
+
+    with pytest.raises(exceptions.InvalidResponseError):
+        await connection.get("/")
+    assert connection.transport is None
+    server.close()
+
+
+async def _response_server(responses):
+    # Respond with one body from responses (in order) once two requests are received
+    async def _server(reader, writer):
+        data = b""
+        while data.count(b"\r\n\r\n") < 2:
+            data += await reader.read(1024)
+        for body in responses:
+            writer.write(
+                f"HTTP/1.1 200 OK\r\nContent-Length: {len(body)}\r\n\r\n{body}".encode()
+            )
+
+    port = unused_port()
+    return await asyncio.start_server(_server, "127.0.0.1", port), port
+
+
+@pytest.mark.asyncio
+async def test_connection_pipelined_requests():
+    server, port = await _response_server(["first", "second"])
+    connection = await http_connect("127.0.0.1", port)
+
+    first, second = await asyncio.gather(
+        connection.get("/first"), connection.get("/second")
+    )
+
+    assert first.body == "first"
+    assert second.body == "second"
+    assert connection.reusable
+    server.close()
+
+
+@pytest.mark.asyncio
+async def test_pooled_connection_abandoned_request_keeps_response_order():
+    server, port = await _response_server(["first", "second"])
+    pool = HttpConnectionPool()
+    connection = await pool.acquire("127.0.0.1", port)
+
+    task = asyncio.create_task(connection.get("/first"))
+    await until(lambda: connection.pending_requests == 1)
+    task.cancel()
+
+    # Response to the first request must not be returned for the second one
+    response = await connection.get("/second")
+    assert response.body == "second"
+    pool.release(connection)
+    pool.close()
+    server.close()
+
+
+@pytest.mark.asyncio
+async def test_connection_abandoned_request_removed():
+    server, port = await _response_server([])
+    connection = await http_connect("127.0.0.1", port)
+
+    task = asyncio.create_task(connection.get("/"))
+    await until(lambda: connection.pending_requests == 1)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert connection.pending_requests == 0
+    assert connection.reusable
+    connection.close()
+    server.close()
+
+
+@pytest.mark.asyncio
+async def test_connection_stream_body():
+    received = []
+    data = b"a" * (2 * STREAM_CHUNK_SIZE + 10)
+
+    def _handle_page(request: HttpRequest):
+        received.append(request.body)
+        return HttpResponse("HTTP", "1.1", 200, "OK", {}, b"")
+
+    client, server = await serve_and_connect(_handle_page)
+
+    await client.post("/", body=memoryview(data))
+    await client.post("/", body=io.BytesIO(data))
+
+    assert received == [data.decode(), data.decode()]
+    server.close()
+
+
+@pytest.mark.asyncio
+async def test_connection_stream_body_chunked():
+    received = asyncio.Future()
+
+    async def _server(reader, writer):
+        data = b""
+        while not data.endswith(b"0\r\n\r\n"):
+            data += await reader.read(1024)
+        received.set_result(data)
+        writer.write(b"HTTP/1.1 200 OK\r\n\r\n")
+
+    port = unused_port()
+    server = await asyncio.start_server(_server, "127.0.0.1", port)
+    connection = await http_connect("127.0.0.1", port)
+
+    async def _body():
+        yield b"abc"
+        yield b"defgh"
+
+    await connection.post("/", body=_body())
+
+    header, body = (await received).split(b"\r\n\r\n", maxsplit=1)
+    assert b"Transfer-Encoding: chunked" in header
+    assert body == b"3\r\nabc\r\n5\r\ndefgh\r\n0\r\n\r\n"
+    server.close()
+
+
+@pytest.mark.asyncio
+async def test_connection_stream_body_unknown_length_rtsp():
+    async def _body():
+        yield b"abc"
+
+    client, server = await serve_and_connect(DummyRouter())
+
+    with pytest.raises(ValueError):
+        await client.send_and_receive("POST", "/", protocol="RTSP/1.0", body=_body())
+
+    server.close()
+
+
+# CONNECTION POOL
+
+
+@pytest_asyncio.fixture(name="pool_server")
+async def pool_server_fixture():
+    def _handle(request: HttpRequest):
+        headers = {"Connection": "close"} if request.path == "/close" else {}
+        return HttpResponse("HTTP", "1.1", 200, "OK", headers, b"")
+
+    server, port = await serve(_handle)
+    yield port
+    server.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_reuses_released_connection(pool_server):
+    pool = HttpConnectionPool()
+
+    async with pool.connection("127.0.0.1", pool_server) as connection:
+        await connection.get("/")
+    async with pool.connection("127.0.0.1", pool_server) as reused:
+        await reused.get("/")
+
+    assert connection is reused
+    assert pool.created == 1
+    assert pool.reused == 1
+    pool.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_connections_separated_by_context(pool_server):
+    pool = HttpConnectionPool()
+
+    async with pool.connection("127.0.0.1", pool_server, context="a") as first:
+        pass
+    async with pool.connection("127.0.0.1", pool_server, context="b") as second:
+        pass
+
+    assert first is not second
+    assert pool.created == 2
+    assert len(pool) == 2
+    pool.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_does_not_reuse_closed_connection(pool_server):
+    pool = HttpConnectionPool()
+
+    async with pool.connection("127.0.0.1", pool_server) as connection:
+        await connection.get("/close")
+        assert not connection.reusable
+
+    assert len(pool) == 0
+    pool.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_limits_connections_per_host(pool_server):
+    pool = HttpConnectionPool(max_connections=1)
+
+    first = await pool.acquire("127.0.0.1", pool_server)
+    task = asyncio.create_task(pool.acquire("127.0.0.1", pool_server))
+    await asyncio.sleep(0)
+    assert not task.done()
+
+    pool.release(first)
+    assert await task is first
+    pool.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_replaces_idle_connection_with_other_context(pool_server):
+    pool = HttpConnectionPool(max_connections=1)
+
+    async with pool.connection("127.0.0.1", pool_server, context="a") as first:
+        pass
+    async with pool.connection("127.0.0.1", pool_server, context="b") as second:
+        assert first.transport is None
+
+    assert first is not second
+    pool.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_closes_connection_with_abandoned_request():
+    server, port = await _response_server([])
+    pool = HttpConnectionPool()
+    connection = await pool.acquire("127.0.0.1", port)
+
+    with pytest.raises(TimeoutError):
+        await connection.send_and_receive("GET", "/", timeout=0)
+    assert connection.pending_requests == 1
+
+    pool.release(connection)
+    assert connection.transport is None
+    assert len(pool) == 0
+    pool.close()
+    server.close()
+
+
+@pytest.mark.asyncio
+async def test_session_manager_uses_empty_pool():
+    pool = HttpConnectionPool()
+    session_manager = ClientSessionManager(ClientSession(), True, pool)
+
+    assert session_manager.http_pool is pool
+    await session_manager.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_closes_idle_connections_after_timeout(pool_server):
+    pool = HttpConnectionPool(idle_timeout=0)
+
+    async with pool.connection("127.0.0.1", pool_server) as connection:
+        pass
+
+    await until(lambda: len(pool) == 0)
+    assert connection.transport is None
+    pool.close()
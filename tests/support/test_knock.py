@@ -10,7 +10,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from pyatv.support.knock import knock, knocker
+from pyatv.support.knock import KnockScheduler, get_scheduler, knock, knocker
 
 from tests.utils import until
 
@@ -110,3 +110,100 @@ async def atest_abort_knock_unhandled_exception(caplog):
     await asyncio.sleep(0)
     loop.set_debug(False)
     assert "Task exception was never retrieved" not in caplog.text
+
+
+@pytest.fixture(name="knocks")
+def knocks_fixture():
+    with patch("pyatv.support.knock.knock") as mock:
+        knocks = []
+
+        async def _knock(address, ports, timeout):
+            knocks.append((address, ports))
+
+        mock.side_effect = _knock
+        yield knocks
+
+
+@pytest.mark.asyncio
+async def test_scheduler_knocks_host(knock_server):
+    server = await knock_server()
+    scheduler = KnockScheduler()
+    scheduler.add(LOCALHOST, [server.port], 1)
+    await until(lambda: server.got_knock)
+    scheduler.close()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_deduplicates_hosts(knocks):
+    scheduler = KnockScheduler(interval=10)
+    scheduler.add(LOCALHOST, [1], 1)
+    scheduler.add(LOCALHOST, [2], 1)
+    await until(lambda: knocks)
+    await asyncio.sleep(0.1)
+
+    assert knocks == [(LOCALHOST, [1, 2])]
+    assert scheduler.hosts == {LOCALHOST}
+
+    # Host is knocked until last interested party releases it
+    scheduler.remove(LOCALHOST)
+    assert scheduler.hosts == {LOCALHOST}
+    scheduler.remove(LOCALHOST)
+    assert scheduler.hosts == set()
+    scheduler.close()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_knocks_repeatedly_until_deadline(knocks):
+    scheduler = KnockScheduler(interval=0.3)
+    scheduler.add(LOCALHOST, [1], 1)
+    await until(lambda: not scheduler.hosts)
+    assert len(knocks) == 3
+    scheduler.close()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_rate_limits_knocks(knocks):
+    hosts = [ip_address(f"10.0.0.{i}") for i in range(1, 7)]
+    scheduler = KnockScheduler(rate=10, interval=10)
+    for host in hosts:
+        scheduler.add(host, [1, 2, 3, 4], 5)
+
+    start = time.monotonic()
+    await until(lambda: len(knocks) == len(hosts))
+    end = time.monotonic()
+
+    # Bucket starts full (10 tokens), each host needs four tokens: two hosts are
+    # knocked right away and the four remaining at 2.5 hosts per second
+    assert 1.2 < (end - start) < 2.5
+    assert [address for address, _ in knocks] == hosts
+    scheduler.close()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_stops_knocking_when_responded(knocks):
+    scheduler = KnockScheduler(interval=0.1)
+    scheduler.add(LOCALHOST, [1], 5)
+    await until(lambda: len(knocks) == 3)
+
+    scheduler.responded(LOCALHOST)
+    assert scheduler.hosts == set()
+    assert 0.2 <= scheduler.wake_latencies[LOCALHOST] < 1
+
+    # asyncio.sleep is stubbed in tests, so wait using the loop instead
+    waiter = asyncio.ensure_future(asyncio.Event().wait())
+    await asyncio.wait([waiter], timeout=0.3)
+    waiter.cancel()
+    assert len(knocks) == 3
+    scheduler.close()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_ignores_response_from_unknown_host():
+    scheduler = KnockScheduler()
+    scheduler.responded(LOCALHOST)
+    assert scheduler.wake_latencies == {}
+
+
+@pytest.mark.asyncio
+async def test_get_scheduler_is_shared():
+    assert get_scheduler() is get_scheduler()
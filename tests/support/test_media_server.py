@@ -0,0 +1,173 @@
+"""Unit tests for pyatv.support.media_server."""
+
+from urllib.parse import urlparse
+
+from aiohttp import ClientSession
+import pytest
+import pytest_asyncio
+
+from pyatv.support.http import http_connect
+from pyatv.support.media_server import MediaServer, _parse_range, get_media_server
+
+CONTENT = bytes(range(256)) * 4
+
+
+@pytest.fixture(name="media_file")
+def media_file_fixture(tmp_path):
+    path = tmp_path / "media.bin"
+    path.write_bytes(CONTENT)
+    yield str(path)
+
+
+@pytest_asyncio.fixture(name="server")
+async def server_fixture():
+    server = MediaServer("127.0.0.1")
+    yield server
+    await server.close()
+
+
+async def get(url, headers=None):
+    parsed = urlparse(url)
+    connection = await http_connect(parsed.hostname, parsed.port)
+    try:
+        return await connection.send_and_receive(
+            "GET", parsed.path, headers=headers, allow_error=True
+        )
+    finally:
+        connection.close()
+
+
+async def head(url):
+    async with ClientSession() as session:
+        async with session.head(url) as response:
+            return response.status, response.headers, await response.read()
+
+
+@pytest.mark.parametrize(
+    "header,expected",
+    [
+        ("bytes=0-9", (0, 9)),
+        ("bytes=10-", (10, 1023)),
+        ("bytes=-24", (1000, 1023)),
+        ("bytes=-2000", (0, 1023)),
+        ("bytes=1000-5000", (1000, 1023)),
+        ("bytes=0-1,5-6", None),
+        ("items=0-1", None),
+    ],
+)
+def test_parse_range(header, expected):
+    assert _parse_range(header, len(CONTENT)) == expected
+
+
+@pytest.mark.parametrize("header", ["bytes=1024-", "bytes=-0", "bytes=5-2"])
+def test_parse_range_unsatisfiable(header):
+    with pytest.raises(ValueError):
+        _parse_range(header, len(CONTENT))
+
+
+@pytest.mark.asyncio
+async def test_get_whole_file(server, media_file):
+    url = await server.add_file(media_file)
+
+    resp = await get(url)
+    assert resp.code == 200
+    assert resp.headers["Accept-Ranges"] == "bytes"
+    assert resp.headers["Content-Type"] == "application/octet-stream"
+    assert resp.body == CONTENT
+    assert server.bytes_served == len(CONTENT)
+    assert server.files[media_file].requests_served == 1
+
+
+@pytest.mark.asyncio
+async def test_get_range(server, media_file):
+    url = await server.add_file(media_file)
+
+    resp = await get(url, headers={"Range": "bytes=10-19"})
+    assert resp.code == 206
+    assert resp.headers["Content-Range"] == f"bytes 10-19/{len(CONTENT)}"
+    assert resp.body == CONTENT[10:20]
+    assert server.bytes_served == 10
+
+
+@pytest.mark.asyncio
+async def test_get_range_unsatisfiable(server, media_file):
+    url = await server.add_file(media_file)
+
+    resp = await get(url, headers={"Range": "bytes=5000-"})
+    assert resp.code == 416
+    assert resp.headers["Content-Range"] == f"bytes */{len(CONTENT)}"
+
+
+@pytest.mark.asyncio
+async def test_if_range(server, media_file):
+    url = await server.add_file(media_file)
+    _, headers, _ = await head(url)
+    etag = headers["ETag"]
+
+    resp = await get(url, headers={"Range": "bytes=0-1", "If-Range": etag})
+    assert resp.code == 206
+
+    # File has changed, so whole file is sent
+    resp = await get(url, headers={"Range": "bytes=0-1", "If-Range": '"other"'})
+    assert resp.code == 200
+    assert resp.body == CONTENT
+
+
+@pytest.mark.asyncio
+async def test_head_has_no_body(server, media_file):
+    url = await server.add_file(media_file)
+
+    status, headers, body = await head(url)
+    assert status == 200
+    assert headers["Content-Length"] == str(len(CONTENT))
+    assert body == b""
+    assert server.bytes_served == 0
+
+
+@pytest.mark.asyncio
+async def test_keep_alive_requests(server, media_file):
+    url = await server.add_file(media_file)
+    parsed = urlparse(url)
+    connection = await http_connect(parsed.hostname, parsed.port)
+
+    for start in range(0, len(CONTENT), 256):
+        resp = await connection.send_and_receive(
+            "GET", parsed.path, headers={"Range": f"bytes={start}-{start + 255}"}
+        )
+        assert resp.body == CONTENT[start : start + 256]
+
+    connection.close()
+
+
+@pytest.mark.asyncio
+async def test_unknown_token_not_found(server, media_file):
+    url = await server.add_file(media_file)
+    token = urlparse(url).path.split("/")[1]
+
+    resp = await get(url.replace(token, "unknown"))
+    assert resp.code == 404
+
+
+@pytest.mark.asyncio
+async def test_same_file_shared_between_users(server, media_file):
+    url = await server.add_file(media_file)
+    assert await server.add_file(media_file) == url
+
+    await server.remove_file(media_file)
+    assert (await get(url)).code == 200
+
+    await server.remove_file(media_file)
+    assert not server.files
+    assert server.port == 0
+
+
+@pytest.mark.asyncio
+async def test_add_missing_file(server, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        await server.add_file(str(tmp_path / "missing"))
+
+
+@pytest.mark.asyncio
+async def test_get_media_server_shared_per_address():
+    assert get_media_server("127.0.0.1") is get_media_server("127.0.0.1")
+    assert get_media_server("127.0.0.1") is not get_media_server("127.0.0.2")
@@ -0,0 +1,147 @@
+"""Unit tests for pyatv.support.send_queue."""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from pyatv.support.send_queue import SendQueue
+
+
+class FakeTransport:
+    def __init__(self):
+        self.writes = []
+        self.queue = None
+        self.pause_after_write = False
+
+    def write(self, data):
+        self.writes.append(data)
+        if self.pause_after_write:
+            self.queue.pause()
+
+
+@pytest.fixture(name="transport")
+def transport_fixture():
+    yield FakeTransport()
+
+
+@pytest_asyncio.fixture(name="queue")
+async def queue_fixture(transport):
+    queue = SendQueue(asyncio.get_running_loop(), lambda data: data)
+    queue.attach(transport)
+    transport.queue = queue
+    yield queue
+
+
+async def _run_soon_callbacks():
+    # Callbacks scheduled with call_soon run before this future is done
+    future = asyncio.get_running_loop().create_future()
+    asyncio.get_running_loop().call_soon(future.set_result, None)
+    await future
+
+
+@pytest.mark.asyncio
+async def test_first_message_written_immediately(queue, transport):
+    queue.put(b"a")
+    assert transport.writes == [b"a"]
+    assert len(queue) == 0
+
+
+@pytest.mark.asyncio
+async def test_messages_in_same_iteration_written_together(queue, transport):
+    queue.put(b"a")
+    queue.put(b"b")
+    queue.put(b"c")
+    assert transport.writes == [b"a"]
+    assert len(queue) == 2
+
+    await _run_soon_callbacks()
+
+    assert transport.writes == [b"a", b"bc"]
+    assert len(queue) == 0
+    assert queue.sent == 3
+    assert queue.writes == 2
+
+    queue.put(b"d")
+    assert transport.writes == [b"a", b"bc", b"d"]
+
+
+@pytest.mark.asyncio
+async def test_put_many_written_at_once(queue, transport):
+    queue.put_many([(b"a", None), (b"b", None), (b"c", "key"), (b"d", "key")])
+
+    assert transport.writes == [b"abd"]
+    assert queue.coalesced == 1
+
+
+@pytest.mark.asyncio
+async def test_coalesce_replaces_queued_message(queue, transport):
+    queue.put(b"first")
+    queue.put(b"1", coalesce_key="volume")
+    queue.put(b"a")
+    queue.put(b"2", coalesce_key="volume")
+    queue.put(b"3", coalesce_key="other")
+
+    await _run_soon_callbacks()
+
+    assert transport.writes == [b"first", b"a23"]
+    assert queue.coalesced == 1
+
+
+@pytest.mark.asyncio
+async def test_queue_while_paused(queue, transport):
+    queue.pause()
+    queue.put(b"a")
+    queue.put(b"1", coalesce_key="volume")
+    queue.put(b"2", coalesce_key="volume")
+
+    await _run_soon_callbacks()
+    assert transport.writes == []
+    assert len(queue) == 2
+
+    queue.resume()
+    await _run_soon_callbacks()
+    assert transport.writes == [b"a2"]
+
+
+@pytest.mark.asyncio
+async def test_pause_during_flush_keeps_remaining(transport):
+    queue = SendQueue(asyncio.get_running_loop(), lambda data: data, max_write_size=1)
+    queue.attach(transport)
+    transport.queue = queue
+    transport.pause_after_write = True
+
+    queue.put_many([(b"a", None), (b"b", "key")])
+    assert transport.writes == [b"a"]
+
+    # Coalescing still works on messages put back in queue
+    queue.put(b"c", coalesce_key="key")
+    assert queue.coalesced == 1
+
+    transport.pause_after_write = False
+    queue.resume()
+    await _run_soon_callbacks()
+    assert transport.writes == [b"a", b"c"]
+
+
+@pytest.mark.asyncio
+async def test_force_flush_ignores_pause(queue, transport):
+    queue.pause()
+    queue.put(b"a")
+
+    queue.flush(force=True)
+
+    assert transport.writes == [b"a"]
+
+
+@pytest.mark.asyncio
+async def test_detach_drops_queued_messages(queue, transport):
+    queue.pause()
+    queue.put(b"a")
+    queue.detach()
+
+    await _run_soon_callbacks()
+
+    assert transport.writes == []
+    assert queue.dropped == 1
+    assert len(queue) == 0
@@ -92,3 +92,46 @@ def test_call_state_was_updated_after_update_with_listener():
 
     producer.listener.foo()
     assert producer.state_was_updated_called
+
+
+def test_listener_proxy_reused():
+    producer = StateProducer()
+    producer.listener = DummyListener()
+
+    assert producer.listener is producer.listener
+
+
+def test_change_listener_replaces_proxy():
+    first = DummyListener()
+    second = DummyListener()
+    producer = StateProducer()
+
+    producer.listener = first
+    producer.listener.foo()
+    producer.listener = second
+    producer.listener.foo()
+
+    assert first.foo_calls == 1
+    assert second.foo_calls == 1
+
+
+def test_missing_method_counts_as_call():
+    listener = DummyListener()
+    producer = StateProducer(max_calls=2)
+    producer.listener = listener
+
+    producer.listener.missing()
+    producer.listener.missing()
+    producer.listener.foo()
+
+    assert listener.foo_calls == 0
+
+
+def test_special_attributes_not_counted_as_calls():
+    producer = DummyStateProducer()
+
+    assert not isinstance(producer.listener, DummyListener)
+    assert producer.listener.__class__ is not None
+
+    assert producer.calls_made == 0
+    assert not producer.state_was_updated_called
@@ -0,0 +1,69 @@
+"""Track import time of pyatv and verify that protocols are imported lazily."""
+
+import subprocess
+import sys
+
+from pyatv.const import Protocol
+
+PROTOCOL_MODULES = [
+    "pyatv.protocols.airplay",
+    "pyatv.protocols.companion",
+    "pyatv.protocols.dmap",
+    "pyatv.protocols.mrp",
+    "pyatv.protocols.raop",
+]
+
+
+def _import_times(code: str) -> dict:
+    """Return cumulative import time (in us) per module imported by code."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = line.split("|")
+        if cumulative.strip().isdigit():
+            times[module.strip()] = int(cumulative)
+    return times
+
+
+def test_import_pyatv_does_not_import_protocols(record_property):
+    times = _import_times("import pyatv")
+
+    record_property("import_time_us", times["pyatv"])
+    for module in PROTOCOL_MODULES:
+        assert module not in times
+
+
+def test_import_protobuf_does_not_import_messages():
+    times = _import_times("import pyatv.protocols.mrp.protobuf")
+
+    assert "pyatv.protocols.mrp.protobuf.ProtocolMessage_pb2" in times
+    assert "pyatv.protocols.mrp.protobuf.SetStateMessage_pb2" not in times
+
+
+def test_protocol_imported_on_first_use():
+    # import_module is not reported by -X importtime, so look in sys.modules
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from pyatv.const import Protocol; "
+            "from pyatv import PROTOCOLS; "
+            f"PROTOCOLS[Protocol.{Protocol.DMAP.name}]; "
+            "print(' '.join(sys.modules))",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    modules = result.stdout.split()
+
+    assert "pyatv.protocols.dmap" in modules
+    assert "pyatv.protocols.mrp" not in modules
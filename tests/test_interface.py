@@ -199,7 +199,7 @@ def test_playing_custom_hash():
 def test_playing_eq_ensure_member_count():
     # Fail if a property is added or removed to interface, just as a reminder to
     # update equality comparison
-    assert len(Playing().__dict__) == 16
+    assert len(Playing()._values) == 16
 
 
 @pytest.mark.parametrize(
@@ -450,3 +450,44 @@ def test_app_equality():
     assert App(None, "test") != App(None, None)
     assert App(None, "test") == App(None, "test")
     assert App("test", "test2") == App("test", "test2")
+
+
+def test_playing_is_hashable():
+    assert hash(Playing(title="a")) == hash(Playing(title="a"))
+    assert len({Playing(title="a"), Playing(title="a"), Playing(title="b")}) == 2
+
+
+def test_playing_is_immutable():
+    playing = Playing(title="a")
+
+    with pytest.raises(AttributeError):
+        playing.title = "b"
+    with pytest.raises(AttributeError):
+        playing.other = "b"
+
+
+def test_playing_diff_same():
+    assert Playing(title="a", position=1).diff(Playing(title="a", position=1)) == {}
+
+
+def test_playing_diff_changed_fields():
+    old = Playing(title="a", position=1, total_time=10, hash="h")
+    new = Playing(title="a", position=2, total_time=10, hash="h")
+
+    assert new.diff(old) == {"position": 2}
+
+
+def test_playing_diff_includes_derived_hash():
+    old = Playing(title="a")
+    new = Playing(title="b")
+
+    assert new.diff(old) == {"title": "b", "hash": new.hash}
+
+
+def test_playing_diff_with_none_returns_all_fields():
+    playing = Playing(title="a")
+    changes = playing.diff(None)
+
+    assert len(changes) == 16
+    assert changes["title"] == "a"
+    assert changes["hash"] == playing.hash
@@ -0,0 +1,179 @@
+"""Functional tests for device manager using fake MRP devices."""
+
+import asyncio
+from ipaddress import IPv4Address
+
+import pytest
+import pytest_asyncio
+
+import pyatv
+from pyatv import exceptions
+from pyatv.conf import AppleTV, ManualService
+from pyatv.const import Protocol
+from pyatv.manager import DeviceManager, DeviceState
+from pyatv.support.net import unused_port
+
+from tests.fake_device import FakeAppleTV
+from tests.utils import until
+
+DEVICE_COUNT = 3
+
+
+def _config(index: int, port: int) -> AppleTV:
+    config = AppleTV(IPv4Address("127.0.0.1"), f"Device {index}")
+    config.add_service(ManualService(f"mrp_{index}", Protocol.MRP, port, {}))
+    return config
+
+
+@pytest_asyncio.fixture(name="fake_devices")
+async def fake_devices_fixture():
+    devices = []
+    for _ in range(DEVICE_COUNT):
+        fake_atv = FakeAppleTV(asyncio.get_running_loop(), test_mode=False)
+        fake_atv.add_service(Protocol.MRP)
+        await fake_atv.start()
+        devices.append(fake_atv)
+    yield devices
+    for fake_atv in devices:
+        await fake_atv.stop()
+
+
+@pytest_asyncio.fixture(name="manager")
+async def manager_fixture():
+    manager = DeviceManager(
+        asyncio.get_running_loop(),
+        max_concurrent_connects=2,
+        reconnect_delay=0.01,
+        max_reconnect_delay=0.05,
+    )
+    yield manager
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_connect_all_devices(manager, fake_devices):
+    for index, fake_atv in enumerate(fake_devices):
+        await manager.add(_config(index, fake_atv.get_port(Protocol.MRP)))
+
+    await manager.wait_connected(timeout=10)
+
+    assert len(manager.devices) == DEVICE_COUNT
+    for index in range(DEVICE_COUNT):
+        health = manager.health()[f"mrp_{index}"]
+        assert health.state == DeviceState.Connected
+        assert health.connect_attempts == 1
+        assert health.handshake_time is not None
+        assert manager.get(f"mrp_{index}") is not None
+
+
+@pytest.mark.asyncio
+async def test_devices_share_session(manager, fake_devices):
+    for index, fake_atv in enumerate(fake_devices):
+        await manager.add(_config(index, fake_atv.get_port(Protocol.MRP)))
+    await manager.wait_connected(timeout=10)
+
+    sessions = {id(atv._session_manager.session) for atv in manager.devices}
+    assert len(sessions) == 1
+
+
+@pytest.mark.asyncio
+async def test_add_same_device_twice_raises(manager, fake_devices):
+    await manager.add(_config(0, fake_devices[0].get_port(Protocol.MRP)))
+    with pytest.raises(ValueError):
+        await manager.add(_config(0, fake_devices[0].get_port(Protocol.MRP)))
+
+
+@pytest.mark.asyncio
+async def test_add_device_without_identifier_raises(manager):
+    with pytest.raises(exceptions.DeviceIdMissingError):
+        await manager.add(AppleTV(IPv4Address("127.0.0.1"), "Device"))
+
+
+@pytest.mark.asyncio
+async def test_reconnect_after_connection_lost(manager, fake_devices):
+    fake_atv = fake_devices[0]
+    await manager.add(_config(0, fake_atv.get_port(Protocol.MRP)))
+    await manager.wait_connected(timeout=10)
+    first_atv = manager.get("mrp_0")
+
+    for client in fake_atv.get_state(Protocol.MRP).clients:
+        client.transport.close()
+
+    await until(lambda: manager.health()["mrp_0"].connection_losses == 1)
+    await manager.wait_connected(timeout=10)
+
+    health = manager.health()["mrp_0"]
+    assert health.state == DeviceState.Connected
+    assert health.connect_attempts == 2
+    assert manager.get("mrp_0") is not first_atv
+
+    # Lost connection must have been closed (and closing finished) before reconnecting
+    with pytest.raises(exceptions.BlockedStateError):
+        await first_atv.remote_control.up()
+    assert all(task.done() for task in first_atv.close())
+
+
+@pytest.mark.asyncio
+async def test_retry_unreachable_device(manager):
+    await manager.add(_config(0, unused_port()))
+
+    await until(lambda: manager.health()["mrp_0"].connect_attempts >= 3)
+
+    health = manager.health()["mrp_0"]
+    assert health.state != DeviceState.Connected
+    assert health.last_error is not None
+    assert manager.get("mrp_0") is None
+
+
+@pytest.mark.asyncio
+async def test_reconnect_after_device_closed(manager, fake_devices):
+    await manager.add(_config(0, fake_devices[0].get_port(Protocol.MRP)))
+    await manager.wait_connected(timeout=10)
+
+    await asyncio.gather(*manager.get("mrp_0").close())
+
+    await until(lambda: manager.health()["mrp_0"].connect_attempts == 2)
+    await manager.wait_connected(timeout=10)
+    assert manager.health()["mrp_0"].state == DeviceState.Connected
+
+
+@pytest.mark.asyncio
+async def test_remove_device(manager, fake_devices):
+    await manager.add(_config(0, fake_devices[0].get_port(Protocol.MRP)))
+    await manager.wait_connected(timeout=10)
+    health = manager.health()["mrp_0"]
+
+    await manager.remove("mrp_0")
+
+    assert manager.get("mrp_0") is None
+    assert "mrp_0" not in manager.health()
+    assert health.state == DeviceState.Closed
+    await until(lambda: not fake_devices[0].get_state(Protocol.MRP).clients)
+
+
+@pytest.mark.asyncio
+async def test_bounded_concurrent_handshakes(fake_devices, monkeypatch):
+    active = 0
+    max_active = 0
+    real_connect = pyatv.connect
+
+    async def _connect(*args, **kwargs):
+        nonlocal active, max_active
+        active += 1
+        max_active = max(max_active, active)
+        try:
+            return await real_connect(*args, **kwargs)
+        finally:
+            active -= 1
+
+    monkeypatch.setattr(pyatv, "connect", _connect)
+
+    manager = DeviceManager(asyncio.get_running_loop(), max_concurrent_connects=1)
+    try:
+        for index, fake_atv in enumerate(fake_devices):
+            await manager.add(_config(index, fake_atv.get_port(Protocol.MRP)))
+        await manager.wait_connected(timeout=10)
+    finally:
+        await manager.close()
+
+    assert max_active == 1